@@ -1,7 +1,7 @@
 """Phase 2: Admin Circuit Tables
 
 Revision ID: 002_admin_tables
-Revises: 001_help_system
+Revises: b7e2f3a1c9d4
 Create Date: 2026-01-26
 
 This migration creates the admin system tables:
@@ -10,21 +10,270 @@ This migration creates the admin system tables:
 - Configuration tables: cost_types, expense_types, regions, etc.
 - audit_logs: System audit trail
 """
+import csv
+import io
+
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import JSONB
 
 
 # revision identifiers, used by Alembic
 revision = '002_admin_tables'
-down_revision = '001_help_system'
+down_revision = 'b7e2f3a1c9d4'
 branch_labels = None
 depends_on = None
 
+# Server-side defaults shared by every column below.
+NOW = sa.text('now()')
+TRUE = sa.text('true')
+
+# DDL template shared by the standard and weighted configuration tables.
+# Tables start UNLOGGED so the seed load skips WAL; see SEEDED_TABLES.
+CONFIG_TABLE_DDL = """
+CREATE UNLOGGED TABLE {table} (
+    id SERIAL NOT NULL,
+    code VARCHAR(50) NOT NULL,
+    description VARCHAR(255) NOT NULL,
+    {extra_columns}
+    is_active BOOLEAN NOT NULL DEFAULT true,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    PRIMARY KEY (id),
+    CONSTRAINT uq_{table}_code UNIQUE (code)
+);
+"""
+
+# (table name, weighted) for every configuration lookup table.
+LOOKUPS = (
+    ('cost_types', False),
+    ('expense_types', False),
+    ('regions', False),
+    ('business_areas', False),
+    ('estimating_techniques', False),
+    ('risk_categories', False),
+    ('expenditure_indicators', False),
+    ('probability_levels', True),
+    ('severity_levels', True),
+    ('pmb_weights', True),
+)
+
+# Tables created UNLOGGED and switched to LOGGED once their seed rows are in.
+SEEDED_TABLES = tuple(name for name, _ in LOOKUPS) + ('resources', 'suppliers')
+
+# audit_logs only ever grows, so it is range-partitioned by month: inserts
+# touch the current partition's indexes and old months can be detached.
+# The partition key has to be part of the primary key.
+AUDIT_LOGS_DDL = """
+CREATE TABLE audit_logs (
+    id SERIAL NOT NULL,
+    user_id INTEGER,
+    action VARCHAR(50) NOT NULL,
+    entity_type VARCHAR(100) NOT NULL,
+    entity_id INTEGER,
+    old_values JSONB,
+    new_values JSONB,
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+    PRIMARY KEY (id, created_at),
+    CONSTRAINT fk_audit_logs_user_id FOREIGN KEY (user_id)
+        REFERENCES users (id) ON DELETE SET NULL
+) PARTITION BY RANGE (created_at)
+"""
+
+# Creates the audit_logs_YYYY_MM partition holding ``month`` if it is
+# missing. Call it ahead of time (e.g. from a monthly beat task) so rows
+# do not land in audit_logs_default. Partitions take a low
+# toast_tuple_target (the parent cannot hold storage parameters) so JSONB
+# diffs over ~512 bytes are compressed out of line instead of widening
+# the heap rows the list queries scan.
+AUDIT_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION audit_logs_ensure_partition(month date)
+RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    lower_bound date := date_trunc('month', month);
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs '
+        'FOR VALUES FROM (%L) TO (%L) WITH (toast_tuple_target = 512)',
+        'audit_logs_' || to_char(lower_bound, 'YYYY_MM'),
+        lower_bound,
+        lower_bound + interval '1 month'
+    );
+END
+$$
+"""
+
+
+# ----------------------------------------------------------------
+# Seed payloads: (table, columns, rows), loaded by _seed_tables().
+# ----------------------------------------------------------------
+LOOKUP_COLUMNS = ('code', 'description', 'is_active')
+WEIGHTED_COLUMNS = ('code', 'description', 'weight', 'is_active')
+RESOURCE_COLUMNS = ('resource_code', 'description', 'eoc', 'cost', 'units', 'is_active')
+SUPPLIER_COLUMNS = ('supplier_code', 'name', 'contact', 'phone', 'email', 'is_active')
+
+# Offline (--sql) mode renders the seed values as literals, which needs a
+# type for every column.
+SEED_COLUMN_TYPES = {
+    'code': sa.String,
+    'description': sa.String,
+    'weight': sa.Integer,
+    'is_active': sa.Boolean,
+    'resource_code': sa.String,
+    'eoc': sa.String,
+    'cost': sa.Numeric,
+    'units': sa.String,
+    'supplier_code': sa.String,
+    'name': sa.String,
+    'contact': sa.String,
+    'phone': sa.String,
+    'email': sa.String,
+}
+
+COST_TYPES = (
+    ('LABOR', 'Labor costs', True),
+    ('MATERIAL', 'Material costs', True),
+    ('EQUIPMENT', 'Equipment costs', True),
+    ('SUBCONTRACT', 'Subcontractor costs', True),
+    ('TRAVEL', 'Travel and expenses', True),
+    ('ODC', 'Other Direct Costs', True),
+    ('OVERHEAD', 'Overhead costs', True),
+)
+
+EXPENSE_TYPES = (
+    ('CAPEX', 'Capital Expenditure', True),
+    ('OPEX', 'Operating Expenditure', True),
+    ('DIRECT', 'Direct Expense', True),
+    ('INDIRECT', 'Indirect Expense', True),
+)
+
+REGIONS = (
+    ('NA', 'North America', True),
+    ('EU', 'Europe', True),
+    ('APAC', 'Asia Pacific', True),
+    ('LATAM', 'Latin America', True),
+    ('MEA', 'Middle East & Africa', True),
+    ('GLOBAL', 'Global', True),
+)
+
+BUSINESS_AREAS = (
+    ('IT', 'Information Technology', True),
+    ('ENG', 'Engineering', True),
+    ('MFG', 'Manufacturing', True),
+    ('RD', 'Research & Development', True),
+    ('OPS', 'Operations', True),
+    ('ADMIN', 'Administration', True),
+    ('SALES', 'Sales & Marketing', True),
+)
+
+ESTIMATING_TECHNIQUES = (
+    ('ANALOG', 'Analogous Estimation', True),
+    ('PARAM', 'Parametric Estimation', True),
+    ('BOTTOMUP', 'Bottom-Up Estimation', True),
+    ('TOPDOWN', 'Top-Down Estimation', True),
+    ('EXPERT', 'Expert Judgment', True),
+    ('VENDOR', 'Vendor Quote', True),
+    ('HISTORICAL', 'Historical Data', True),
+)
+
+RISK_CATEGORIES = (
+    ('TECH', 'Technical Risk', True),
+    ('SCHEDULE', 'Schedule Risk', True),
+    ('COST', 'Cost Risk', True),
+    ('RESOURCE', 'Resource Risk', True),
+    ('EXTERNAL', 'External Risk', True),
+    ('QUALITY', 'Quality Risk', True),
+    ('SCOPE', 'Scope Risk', True),
+)
+
+EXPENDITURE_INDICATORS = (
+    ('PLANNED', 'Planned Expenditure', True),
+    ('ACTUAL', 'Actual Expenditure', True),
+    ('COMMITTED', 'Committed Expenditure', True),
+    ('FORECAST', 'Forecast Expenditure', True),
+)
+
+# Weights are in hundredths: 5 == 0.05.
+PROBABILITY_LEVELS = (
+    ('RARE', 'Rare (1-10%)', 5, True),
+    ('UNLIKELY', 'Unlikely (11-30%)', 20, True),
+    ('POSSIBLE', 'Possible (31-50%)', 40, True),
+    ('LIKELY', 'Likely (51-70%)', 60, True),
+    ('ALMOST_CERTAIN', 'Almost Certain (71-99%)', 85, True),
+)
+
+SEVERITY_LEVELS = (
+    ('NEGLIGIBLE', 'Negligible Impact', 5, True),
+    ('MINOR', 'Minor Impact', 10, True),
+    ('MODERATE', 'Moderate Impact', 25, True),
+    ('MAJOR', 'Major Impact', 50, True),
+    ('CRITICAL', 'Critical Impact', 90, True),
+)
+
+PMB_WEIGHTS = (
+    ('LOW', 'Low Confidence', 25, True),
+    ('MEDIUM', 'Medium Confidence', 50, True),
+    ('HIGH', 'High Confidence', 75, True),
+    ('VERY_HIGH', 'Very High Confidence', 90, True),
+)
+
+RESOURCES = (
+    ('ENG-SR', 'Senior Engineer', 'LABOR', 150.00, 'hour', True),
+    ('ENG-JR', 'Junior Engineer', 'LABOR', 85.00, 'hour', True),
+    ('PM', 'Project Manager', 'LABOR', 175.00, 'hour', True),
+    ('BA', 'Business Analyst', 'LABOR', 125.00, 'hour', True),
+    ('QA', 'QA Engineer', 'LABOR', 95.00, 'hour', True),
+    ('DEV-SR', 'Senior Developer', 'LABOR', 160.00, 'hour', True),
+    ('DEV-JR', 'Junior Developer', 'LABOR', 90.00, 'hour', True),
+    ('ARCH', 'Solution Architect', 'LABOR', 200.00, 'hour', True),
+    ('ADMIN', 'System Administrator', 'LABOR', 110.00, 'hour', True),
+    ('SUPPORT', 'Support Specialist', 'LABOR', 75.00, 'hour', True),
+)
+
+SUPPLIERS = (
+    ('ACME', 'Acme Corporation', 'John Smith', '+1-555-0100', 'john@acme.com', True),
+    ('TECHSOL', 'Tech Solutions Inc', 'Jane Doe', '+1-555-0200', 'jane@techsol.com', True),
+    ('GLOBSERV', 'Global Services Ltd', 'Bob Wilson', '+1-555-0300', 'bob@globserv.com', True),
+    ('PROCURE', 'Procurement Partners', 'Alice Brown', '+1-555-0400', 'alice@procure.com', True),
+    ('CONSULT', 'Consulting Group', 'Mike Davis', '+1-555-0500', 'mike@consult.com', True),
+)
+
+SEED_BATCH_SIZE = 1000
+
+SEEDS = (
+    ('cost_types', LOOKUP_COLUMNS, COST_TYPES),
+    ('expense_types', LOOKUP_COLUMNS, EXPENSE_TYPES),
+    ('regions', LOOKUP_COLUMNS, REGIONS),
+    ('business_areas', LOOKUP_COLUMNS, BUSINESS_AREAS),
+    ('estimating_techniques', LOOKUP_COLUMNS, ESTIMATING_TECHNIQUES),
+    ('risk_categories', LOOKUP_COLUMNS, RISK_CATEGORIES),
+    ('expenditure_indicators', LOOKUP_COLUMNS, EXPENDITURE_INDICATORS),
+    ('probability_levels', WEIGHTED_COLUMNS, PROBABILITY_LEVELS),
+    ('severity_levels', WEIGHTED_COLUMNS, SEVERITY_LEVELS),
+    ('pmb_weights', WEIGHTED_COLUMNS, PMB_WEIGHTS),
+    ('resources', RESOURCE_COLUMNS, RESOURCES),
+    ('suppliers', SUPPLIER_COLUMNS, SUPPLIERS),
+)
+
+
+def make_lookup(name: str, *, weighted: bool = False) -> str:
+    """Render the CREATE TABLE/INDEX DDL for one lookup table."""
+    # Weights are stored as SMALLINT hundredths (see models.database.types).
+    extra_columns = (
+        f'weight SMALLINT NOT NULL CONSTRAINT ck_{name}_weight CHECK (weight >= 0),'
+        if weighted
+        else ''
+    )
+    return CONFIG_TABLE_DDL.format(table=name, extra_columns=extra_columns)
+
 
 def upgrade() -> None:
     """Create admin system tables."""
-    
+    # Bootstrap on an empty database: a failed run is simply re-run, so
+    # don't wait for a WAL flush on every commit in this transaction.
+    op.execute("SET LOCAL synchronous_commit = off")
+    op.execute("SET LOCAL maintenance_work_mem = '256MB'")
+
     # ================================================================
     # Resources Table
     # ================================================================
@@ -36,15 +285,18 @@ def upgrade() -> None:
         sa.Column('eoc', sa.String(50), nullable=True),
         sa.Column('cost', sa.Numeric(18, 2), nullable=False, server_default='0'),
         sa.Column('units', sa.String(50), nullable=True),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=TRUE),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
         sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('resource_code', name='uq_resources_code')
+        sa.UniqueConstraint('resource_code', name='uq_resources_code'),
+        prefixes=['UNLOGGED'],
+    )
+    # Partial index serving the "active resources by code" listing.
+    op.create_index(
+        'ix_resources_active_code', 'resources', ['resource_code'],
+        postgresql_where=sa.text('is_active'),
     )
-    op.create_index('ix_resources_id', 'resources', ['id'])
-    op.create_index('ix_resources_code', 'resources', ['resource_code'])
-    op.create_index('ix_resources_is_active', 'resources', ['is_active'])
 
     # ================================================================
     # Suppliers Table
@@ -58,250 +310,136 @@ def upgrade() -> None:
         sa.Column('phone', sa.String(50), nullable=True),
         sa.Column('email', sa.String(255), nullable=True),
         sa.Column('notes', sa.Text(), nullable=True),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=TRUE),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
         sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('supplier_code', name='uq_suppliers_code')
+        sa.UniqueConstraint('supplier_code', name='uq_suppliers_code'),
+        prefixes=['UNLOGGED'],
+    )
+    # Partial index serving the "active suppliers by name" listing.
+    op.create_index(
+        'ix_suppliers_active_name', 'suppliers', ['name'],
+        postgresql_where=sa.text('is_active'),
     )
-    op.create_index('ix_suppliers_id', 'suppliers', ['id'])
-    op.create_index('ix_suppliers_code', 'suppliers', ['supplier_code'])
-    op.create_index('ix_suppliers_is_active', 'suppliers', ['is_active'])
-
-    # ================================================================
-    # Standard Configuration Tables
-    # ================================================================
-    config_tables = [
-        'cost_types',
-        'expense_types',
-        'regions',
-        'business_areas',
-        'estimating_techniques',
-        'risk_categories',
-        'expenditure_indicators',
-    ]
-    
-    for table_name in config_tables:
-        op.create_table(
-            table_name,
-            sa.Column('id', sa.Integer(), nullable=False),
-            sa.Column('code', sa.String(50), nullable=False),
-            sa.Column('description', sa.String(255), nullable=False),
-            sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-            sa.PrimaryKeyConstraint('id'),
-            sa.UniqueConstraint('code', name=f'uq_{table_name}_code')
-        )
-        op.create_index(f'ix_{table_name}_id', table_name, ['id'])
-        op.create_index(f'ix_{table_name}_code', table_name, ['code'])
 
     # ================================================================
-    # Weighted Configuration Tables
+    # Configuration Tables (standard + weighted)
     # ================================================================
-    weighted_tables = [
-        'probability_levels',
-        'severity_levels',
-        'pmb_weights',
-    ]
-    
-    for table_name in weighted_tables:
-        op.create_table(
-            table_name,
-            sa.Column('id', sa.Integer(), nullable=False),
-            sa.Column('code', sa.String(50), nullable=False),
-            sa.Column('description', sa.String(255), nullable=False),
-            sa.Column('weight', sa.Numeric(5, 2), nullable=False),
-            sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-            sa.PrimaryKeyConstraint('id'),
-            sa.UniqueConstraint('code', name=f'uq_{table_name}_code')
-        )
-        op.create_index(f'ix_{table_name}_id', table_name, ['id'])
-        op.create_index(f'ix_{table_name}_code', table_name, ['code'])
+    # Render every lookup table from one template and send the whole batch
+    # in a single execute instead of three statements per table.
+    op.execute(sa.text(''.join(
+        make_lookup(name, weighted=weighted) for name, weighted in LOOKUPS
+    )))
 
     # ================================================================
     # Audit Logs Table
     # ================================================================
-    op.create_table(
-        'audit_logs',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('user_id', sa.Integer(), nullable=True),
-        sa.Column('action', sa.String(50), nullable=False),
-        sa.Column('entity_type', sa.String(100), nullable=False),
-        sa.Column('entity_id', sa.Integer(), nullable=True),
-        sa.Column('old_values', JSONB(), nullable=True),
-        sa.Column('new_values', JSONB(), nullable=True),
-        sa.Column('ip_address', sa.String(45), nullable=True),
-        sa.Column('user_agent', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.PrimaryKeyConstraint('id'),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='fk_audit_logs_user_id', ondelete='SET NULL')
+    # Range-partitioned by month; see AUDIT_LOGS_DDL.
+    op.execute(sa.text(AUDIT_LOGS_DDL))
+    op.execute(sa.text(AUDIT_PARTITION_FUNCTION))
+    op.execute(sa.text(
+        "SELECT audit_logs_ensure_partition(month::date) FROM generate_series("
+        "date '2026-01-01', date_trunc('month', now()) + interval '3 months',"
+        " interval '1 month') AS month"
+    ))
+    op.execute(
+        "CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT"
+        " WITH (toast_tuple_target = 512)"
     )
-    op.create_index('ix_audit_logs_id', 'audit_logs', ['id'])
-    op.create_index('ix_audit_logs_user_id', 'audit_logs', ['user_id'])
-    op.create_index('ix_audit_logs_action', 'audit_logs', ['action'])
-    op.create_index('ix_audit_logs_entity', 'audit_logs', ['entity_type', 'entity_id'])
-    op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'])
+    # lz4 TOAST compression (PG14+) is cheaper than pglz for large diffs.
+    if (op.get_bind().dialect.server_version_info or (0,)) >= (14,):
+        op.execute(sa.text(''.join(
+            f'ALTER TABLE audit_logs ALTER COLUMN {column} SET COMPRESSION lz4;\n'
+            for column in ('old_values', 'new_values', 'user_agent')
+        )))
 
     # ================================================================
-    # Seed Data: Configuration Tables
+    # Seed Data: Configuration Tables, Resources, Suppliers
     # ================================================================
-    
-    # Cost Types
-    op.execute("""
-        INSERT INTO cost_types (code, description, is_active) VALUES
-        ('LABOR', 'Labor costs', true),
-        ('MATERIAL', 'Material costs', true),
-        ('EQUIPMENT', 'Equipment costs', true),
-        ('SUBCONTRACT', 'Subcontractor costs', true),
-        ('TRAVEL', 'Travel and expenses', true),
-        ('ODC', 'Other Direct Costs', true),
-        ('OVERHEAD', 'Overhead costs', true)
-    """)
-
-    # Expense Types
-    op.execute("""
-        INSERT INTO expense_types (code, description, is_active) VALUES
-        ('CAPEX', 'Capital Expenditure', true),
-        ('OPEX', 'Operating Expenditure', true),
-        ('DIRECT', 'Direct Expense', true),
-        ('INDIRECT', 'Indirect Expense', true)
-    """)
-
-    # Regions
-    op.execute("""
-        INSERT INTO regions (code, description, is_active) VALUES
-        ('NA', 'North America', true),
-        ('EU', 'Europe', true),
-        ('APAC', 'Asia Pacific', true),
-        ('LATAM', 'Latin America', true),
-        ('MEA', 'Middle East & Africa', true),
-        ('GLOBAL', 'Global', true)
-    """)
-
-    # Business Areas
-    op.execute("""
-        INSERT INTO business_areas (code, description, is_active) VALUES
-        ('IT', 'Information Technology', true),
-        ('ENG', 'Engineering', true),
-        ('MFG', 'Manufacturing', true),
-        ('RD', 'Research & Development', true),
-        ('OPS', 'Operations', true),
-        ('ADMIN', 'Administration', true),
-        ('SALES', 'Sales & Marketing', true)
-    """)
-
-    # Estimating Techniques
-    op.execute("""
-        INSERT INTO estimating_techniques (code, description, is_active) VALUES
-        ('ANALOG', 'Analogous Estimation', true),
-        ('PARAM', 'Parametric Estimation', true),
-        ('BOTTOMUP', 'Bottom-Up Estimation', true),
-        ('TOPDOWN', 'Top-Down Estimation', true),
-        ('EXPERT', 'Expert Judgment', true),
-        ('VENDOR', 'Vendor Quote', true),
-        ('HISTORICAL', 'Historical Data', true)
-    """)
-
-    # Risk Categories
-    op.execute("""
-        INSERT INTO risk_categories (code, description, is_active) VALUES
-        ('TECH', 'Technical Risk', true),
-        ('SCHEDULE', 'Schedule Risk', true),
-        ('COST', 'Cost Risk', true),
-        ('RESOURCE', 'Resource Risk', true),
-        ('EXTERNAL', 'External Risk', true),
-        ('QUALITY', 'Quality Risk', true),
-        ('SCOPE', 'Scope Risk', true)
-    """)
-
-    # Expenditure Indicators
-    op.execute("""
-        INSERT INTO expenditure_indicators (code, description, is_active) VALUES
-        ('PLANNED', 'Planned Expenditure', true),
-        ('ACTUAL', 'Actual Expenditure', true),
-        ('COMMITTED', 'Committed Expenditure', true),
-        ('FORECAST', 'Forecast Expenditure', true)
-    """)
-
-    # Probability Levels
-    op.execute("""
-        INSERT INTO probability_levels (code, description, weight, is_active) VALUES
-        ('RARE', 'Rare (1-10%)', 0.05, true),
-        ('UNLIKELY', 'Unlikely (11-30%)', 0.20, true),
-        ('POSSIBLE', 'Possible (31-50%)', 0.40, true),
-        ('LIKELY', 'Likely (51-70%)', 0.60, true),
-        ('ALMOST_CERTAIN', 'Almost Certain (71-99%)', 0.85, true)
-    """)
-
-    # Severity Levels
-    op.execute("""
-        INSERT INTO severity_levels (code, description, weight, is_active) VALUES
-        ('NEGLIGIBLE', 'Negligible Impact', 0.05, true),
-        ('MINOR', 'Minor Impact', 0.10, true),
-        ('MODERATE', 'Moderate Impact', 0.25, true),
-        ('MAJOR', 'Major Impact', 0.50, true),
-        ('CRITICAL', 'Critical Impact', 0.90, true)
-    """)
-
-    # PMB Weights
-    op.execute("""
-        INSERT INTO pmb_weights (code, description, weight, is_active) VALUES
-        ('LOW', 'Low Confidence', 0.25, true),
-        ('MEDIUM', 'Medium Confidence', 0.50, true),
-        ('HIGH', 'High Confidence', 0.75, true),
-        ('VERY_HIGH', 'Very High Confidence', 0.90, true)
-    """)
+    _seed_tables(SEEDS)
 
-    # ================================================================
-    # Seed Data: Sample Resources
-    # ================================================================
-    op.execute("""
-        INSERT INTO resources (resource_code, description, eoc, cost, units, is_active) VALUES
-        ('ENG-SR', 'Senior Engineer', 'LABOR', 150.00, 'hour', true),
-        ('ENG-JR', 'Junior Engineer', 'LABOR', 85.00, 'hour', true),
-        ('PM', 'Project Manager', 'LABOR', 175.00, 'hour', true),
-        ('BA', 'Business Analyst', 'LABOR', 125.00, 'hour', true),
-        ('QA', 'QA Engineer', 'LABOR', 95.00, 'hour', true),
-        ('DEV-SR', 'Senior Developer', 'LABOR', 160.00, 'hour', true),
-        ('DEV-JR', 'Junior Developer', 'LABOR', 90.00, 'hour', true),
-        ('ARCH', 'Solution Architect', 'LABOR', 200.00, 'hour', true),
-        ('ADMIN', 'System Administrator', 'LABOR', 110.00, 'hour', true),
-        ('SUPPORT', 'Support Specialist', 'LABOR', 75.00, 'hour', true)
-    """)
+    # Seeding is done: make the tables crash-safe again.
+    op.execute(sa.text(''.join(
+        f'ALTER TABLE {table_name} SET LOGGED;\n' for table_name in SEEDED_TABLES
+    )))
 
     # ================================================================
-    # Seed Data: Sample Suppliers
+    # Audit log indexes
     # ================================================================
-    op.execute("""
-        INSERT INTO suppliers (supplier_code, name, contact, phone, email, is_active) VALUES
-        ('ACME', 'Acme Corporation', 'John Smith', '+1-555-0100', 'john@acme.com', true),
-        ('TECHSOL', 'Tech Solutions Inc', 'Jane Doe', '+1-555-0200', 'jane@techsol.com', true),
-        ('GLOBSERV', 'Global Services Ltd', 'Bob Wilson', '+1-555-0300', 'bob@globserv.com', true),
-        ('PROCURE', 'Procurement Partners', 'Alice Brown', '+1-555-0400', 'alice@procure.com', true),
-        ('CONSULT', 'Consulting Group', 'Mike Davis', '+1-555-0500', 'mike@consult.com', true)
-    """)
+    # Partitioned indexes cannot be built CONCURRENTLY; the table is empty
+    # here, and each partition gets its own small leaf index.
+    # Composites match the audit queries, which filter on one key and
+    # order by created_at DESC: the index returns rows already sorted and
+    # the LIMIT stops the scan early, with no bitmap-AND or sort step.
+    op.create_index(
+        'ix_audit_logs_user_time', 'audit_logs', ['user_id', 'created_at'],
+    )
+    op.create_index(
+        'ix_audit_logs_action_time', 'audit_logs', ['action', 'created_at'],
+    )
+    op.create_index(
+        'ix_audit_logs_entity', 'audit_logs',
+        ['entity_type', 'entity_id', 'created_at'],
+        postgresql_include=['action'],
+    )
+    op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'])
+    # jsonb_path_ops GIN answers containment lookups such as
+    # new_values @> '{"wbs_code": "1.2"}' and is a fraction of the size of
+    # the default jsonb_ops index.
+    op.create_index(
+        'ix_audit_logs_new_values', 'audit_logs', ['new_values'],
+        postgresql_using='gin', postgresql_ops={'new_values': 'jsonb_path_ops'},
+    )
+
+
+def _seed_tables(seeds) -> None:
+    """Load seed rows for several tables in one pass.
+
+    On psycopg2 every table is streamed through ``COPY ... FROM STDIN`` on a
+    single cursor. Other drivers (and offline ``--sql`` mode) fall back to
+    ``op.bulk_insert``, which binds the rows as parameters in one
+    ``executemany`` per ``SEED_BATCH_SIZE`` rows so large seeds are not
+    materialised as a single parameter list.
+    """
+    bind = op.get_bind()
+    if bind.dialect.driver == 'psycopg2' and not op.get_context().as_sql:
+        cursor = bind.connection.cursor()
+        try:
+            for table_name, columns, rows in seeds:
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(rows)
+                buffer.seek(0)
+                cursor.copy_expert(
+                    f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH CSV",
+                    buffer,
+                )
+        finally:
+            cursor.close()
+        return
+
+    for table_name, columns, rows in seeds:
+        table = _seed_table(table_name, columns)
+        for start in range(0, len(rows), SEED_BATCH_SIZE):
+            op.bulk_insert(table, [
+                dict(zip(columns, row))
+                for row in rows[start:start + SEED_BATCH_SIZE]
+            ])
+
+
+def _seed_table(table_name, columns):
+    """Build a typed lightweight table for the ``bulk_insert`` fallback."""
+    return sa.table(
+        table_name, *(sa.column(c, SEED_COLUMN_TYPES[c]) for c in columns)
+    )
 
 
 def downgrade() -> None:
     """Drop admin system tables."""
-    # Drop audit logs first (has FK)
-    op.drop_table('audit_logs')
-    
-    # Drop weighted config tables
-    op.drop_table('pmb_weights')
-    op.drop_table('severity_levels')
-    op.drop_table('probability_levels')
-    
-    # Drop standard config tables
-    op.drop_table('expenditure_indicators')
-    op.drop_table('risk_categories')
-    op.drop_table('estimating_techniques')
-    op.drop_table('business_areas')
-    op.drop_table('regions')
-    op.drop_table('expense_types')
-    op.drop_table('cost_types')
-    
-    # Drop resources and suppliers
-    op.drop_table('suppliers')
-    op.drop_table('resources')
+    # One statement: CASCADE takes care of FK ordering.
+    op.execute(
+        'DROP TABLE IF EXISTS '
+        + ', '.join(('audit_logs',) + SEEDED_TABLES)
+        + ' CASCADE'
+    )
+    op.execute('DROP FUNCTION IF EXISTS audit_logs_ensure_partition(date)')
@@ -13,6 +13,7 @@ Creates all project-related tables with full Phase 3 support:
 """
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic
@@ -21,17 +22,47 @@ down_revision = '002_admin_tables'
 branch_labels = None
 depends_on = None
 
+# Server-side defaults shared by every column below. now() is the
+# transaction start time, so every row of a bulk insert gets the same
+# stamp; loaders that need per-row ordering should pass
+# ``created_at=sa.func.clock_timestamp()`` explicitly.
+NOW = sa.text('now()')
+FALSE = sa.text('false')
+
+# Update-heavy tables (progress ticks, estimate edits) leave 30% free space
+# per page so updates can stay HOT instead of touching every index.
+HIGH_CHURN_TABLES = ('wbs', 'import_jobs', 'resource_assignments')
+
+# Money columns are BIGINT cents (1.00 == 100); the models' Cents type
+# converts to and from Decimal.
+CENTS = 'Amount in cents'
+BASIS_POINTS = 'Percentage in basis points (10000 = 100%)'
+HUNDREDTHS = 'Weight in hundredths (100 = 1.00)'
+
+# Status and format columns are SMALLINT positions in the models' Python
+# enums (IntEnum type); the comments record the mapping for psql users.
+PROJECT_STATUS = '0 draft, 1 importing, 2 imported, 3 import_failed, 4 active, 5 archived'
+SOURCE_FORMAT = '0 mpp, 1 mpx, 2 xml, 3 manual'
+IMPORT_STATUS = (
+    '0 pending, 1 uploading, 2 parsing, 3 creating_records, 4 completed, 5 failed'
+)
+
+# risks.expected_cost: risk_cost (cents) times both weight snapshots
+# (hundredths), rounded back to cents.
+EXPECTED_COST = (
+    '(COALESCE(risk_cost, 0) * COALESCE(probability_weight, 0)'
+    ' * COALESCE(severity_weight, 0) + 5000) / 10000'
+)
+
+# resource_assignments FKs are DEFERRABLE INITIALLY DEFERRED: bulk loaders
+# (imports, seeds) should run ``SET CONSTRAINTS ALL DEFERRED`` so the
+# parent-row checks happen once at COMMIT instead of per inserted row.
+DEFERRED = {'deferrable': True, 'initially': 'DEFERRED'}
+
 
 def upgrade() -> None:
     """Create project, WBS, import, assignment, and risk tables."""
 
-    # ================================================================
-    # PostgreSQL Enum Types
-    # ================================================================
-    op.execute("CREATE TYPE projectstatus AS ENUM ('draft', 'importing', 'imported', 'import_failed', 'active', 'archived')")
-    op.execute("CREATE TYPE projectsourceformat AS ENUM ('mpp', 'mpx', 'xml', 'manual')")
-    op.execute("CREATE TYPE importstatus AS ENUM ('pending', 'uploading', 'parsing', 'creating_records', 'completed', 'failed')")
-
     # ================================================================
     # Projects Table
     # ================================================================
@@ -41,93 +72,99 @@ def upgrade() -> None:
         sa.Column('project_name', sa.String(255), nullable=False),
         sa.Column('project_manager', sa.String(255), nullable=True),
         sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('archived', sa.Boolean(), nullable=False, server_default='false'),
+        sa.Column('archived', sa.Boolean(), nullable=False, server_default=FALSE),
         # Source file tracking (Phase 3)
         sa.Column('source_file', sa.String(500), nullable=True),
-        sa.Column('source_format', sa.Enum('mpp', 'mpx', 'xml', 'manual', name='projectsourceformat', create_type=False), nullable=True),
+        sa.Column('source_format', sa.SmallInteger(), nullable=True, comment=SOURCE_FORMAT),
         sa.Column('s3_key', sa.String(1000), nullable=True),
-        sa.Column('status', sa.Enum('draft', 'importing', 'imported', 'import_failed', 'active', 'archived', name='projectstatus', create_type=False), nullable=False, server_default='draft'),
+        sa.Column('status', sa.SmallInteger(), nullable=False, server_default='0', comment=PROJECT_STATUS),
         # Project schedule dates
-        sa.Column('start_date', sa.DateTime(), nullable=True),
-        sa.Column('finish_date', sa.DateTime(), nullable=True),
-        sa.Column('baseline_start', sa.DateTime(), nullable=True),
-        sa.Column('baseline_finish', sa.DateTime(), nullable=True),
+        sa.Column('start_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finish_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('baseline_start', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('baseline_finish', sa.DateTime(timezone=True), nullable=True),
         # Cached counts
         sa.Column('task_count', sa.Integer(), nullable=False, server_default='0'),
         sa.Column('resource_count', sa.Integer(), nullable=False, server_default='0'),
         # Owner
         sa.Column('owner_id', sa.Integer(), nullable=True),
         # Timestamps
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
         sa.PrimaryKeyConstraint('id'),
         sa.ForeignKeyConstraint(['owner_id'], ['users.id'], name='fk_projects_owner_id', ondelete='SET NULL'),
+        sa.CheckConstraint('source_format BETWEEN 0 AND 3', name='ck_projects_source_format'),
+        sa.CheckConstraint('status BETWEEN 0 AND 5', name='ck_projects_status'),
     )
-    op.create_index('ix_projects_id', 'projects', ['id'])
     op.create_index('ix_projects_project_name', 'projects', ['project_name'])
-    op.create_index('ix_projects_status', 'projects', ['status'])
+    # Project listings only ever show non-archived rows, newest first
+    op.create_index(
+        'ix_projects_active', 'projects', ['updated_at'],
+        postgresql_where=sa.text('NOT archived'),
+    )
 
     # ================================================================
     # WBS Table
     # ================================================================
+    # Stays LOGGED: risks and resource_assignments reference it, and
+    # toggling SET UNLOGGED/LOGGED rewrites the whole table under an
+    # exclusive lock. Imports stage rows in a TEMPORARY table instead
+    # (see app.core.database.temp_staging).
     op.create_table(
         'wbs',
-        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.BigInteger(), sa.Identity(always=False), primary_key=True),
         sa.Column('project_id', sa.Integer(), nullable=False),
         sa.Column('task_unique_id', sa.Integer(), nullable=True),
         sa.Column('wbs_code', sa.String(100), nullable=True),
         sa.Column('wbs_title', sa.String(500), nullable=False),
         # Hierarchy
         sa.Column('outline_level', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('parent_id', sa.Integer(), nullable=True),
+        sa.Column('parent_id', sa.BigInteger(), nullable=True),
+        sa.Column('wbs_path', sa.Text(), nullable=True),
         # Schedule dates
-        sa.Column('schedule_start', sa.DateTime(), nullable=True),
-        sa.Column('schedule_finish', sa.DateTime(), nullable=True),
-        sa.Column('baseline_start', sa.DateTime(), nullable=True),
-        sa.Column('baseline_finish', sa.DateTime(), nullable=True),
-        sa.Column('late_start', sa.DateTime(), nullable=True),
-        sa.Column('late_finish', sa.DateTime(), nullable=True),
-        sa.Column('actual_start', sa.DateTime(), nullable=True),
-        sa.Column('actual_finish', sa.DateTime(), nullable=True),
+        sa.Column('schedule_start', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('schedule_finish', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('baseline_start', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('baseline_finish', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('late_start', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('late_finish', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('actual_start', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('actual_finish', sa.DateTime(timezone=True), nullable=True),
         # Duration
         sa.Column('duration', sa.Float(), nullable=True),
         sa.Column('duration_units', sa.String(20), nullable=True),
         # Progress
         sa.Column('percent_complete', sa.Float(), nullable=True, server_default='0'),
         # Cost
-        sa.Column('cost', sa.Numeric(18, 2), nullable=True, server_default='0'),
-        sa.Column('baseline_cost', sa.Numeric(18, 2), nullable=True, server_default='0'),
+        sa.Column('cost', sa.BigInteger(), nullable=True, server_default='0', comment=CENTS),
+        sa.Column('baseline_cost', sa.BigInteger(), nullable=True, server_default='0', comment=CENTS),
         # Task classification flags
-        sa.Column('is_milestone', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('is_summary', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('is_critical', sa.Boolean(), nullable=False, server_default='false'),
-        # Display cache
-        sa.Column('resource_names', sa.String(1000), nullable=True),
+        sa.Column('is_milestone', sa.Boolean(), nullable=False, server_default=FALSE),
+        sa.Column('is_summary', sa.Boolean(), nullable=False, server_default=FALSE),
+        sa.Column('is_critical', sa.Boolean(), nullable=False, server_default=FALSE),
+        # Assigned resource names, from MS Project
+        sa.Column('resource_names', postgresql.ARRAY(sa.String()), nullable=True),
         sa.Column('notes', sa.Text(), nullable=True),
         # Estimation fields (legacy)
         sa.Column('requirements', sa.Text(), nullable=True),
         sa.Column('assumptions', sa.Text(), nullable=True),
         sa.Column('approver', sa.String(255), nullable=True),
-        sa.Column('approver_date', sa.DateTime(), nullable=True),
+        sa.Column('approver_date', sa.DateTime(timezone=True), nullable=True),
         sa.Column('estimate_revision', sa.Integer(), nullable=True, server_default='0'),
         # Timestamps
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.PrimaryKeyConstraint('id'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
         sa.ForeignKeyConstraint(['project_id'], ['projects.id'], name='fk_wbs_project_id', ondelete='CASCADE'),
         sa.ForeignKeyConstraint(['parent_id'], ['wbs.id'], name='fk_wbs_parent_id', ondelete='SET NULL'),
+        sa.CheckConstraint('percent_complete BETWEEN 0 AND 100', name='ck_wbs_percent_complete'),
     )
-    op.create_index('ix_wbs_id', 'wbs', ['id'])
-    op.create_index('ix_wbs_project_id', 'wbs', ['project_id'])
-    op.create_index('ix_wbs_parent_id', 'wbs', ['parent_id'])
-    op.create_index('ix_wbs_task_unique_id', 'wbs', ['task_unique_id'])
 
     # ================================================================
     # Import Jobs Table
     # ================================================================
     op.create_table(
         'import_jobs',
-        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.BigInteger(), sa.Identity(always=False), primary_key=True),
         sa.Column('project_id', sa.Integer(), nullable=False),
         sa.Column('user_id', sa.Integer(), nullable=False),
         # File info
@@ -135,8 +172,10 @@ def upgrade() -> None:
         sa.Column('s3_key', sa.String(1000), nullable=True),
         sa.Column('file_size', sa.Integer(), nullable=True),
         # Status tracking
-        sa.Column('status', sa.Enum('pending', 'uploading', 'parsing', 'creating_records', 'completed', 'failed', name='importstatus', create_type=False), nullable=False, server_default='pending'),
-        sa.Column('progress', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('status', sa.SmallInteger(), nullable=False, server_default='0', comment=IMPORT_STATUS),
+        # Phase counters; the models derive progress from them
+        sa.Column('rows_processed', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('rows_total', sa.BigInteger(), nullable=False, server_default='0'),
         sa.Column('celery_task_id', sa.String(255), nullable=True),
         # Result counts
         sa.Column('task_count', sa.Integer(), nullable=False, server_default='0'),
@@ -145,27 +184,36 @@ def upgrade() -> None:
         # Error tracking
         sa.Column('error_message', sa.Text(), nullable=True),
         # Timestamps
-        sa.Column('started_at', sa.DateTime(), nullable=True),
-        sa.Column('completed_at', sa.DateTime(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.PrimaryKeyConstraint('id'),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
         sa.ForeignKeyConstraint(['project_id'], ['projects.id'], name='fk_import_jobs_project_id', ondelete='CASCADE'),
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='fk_import_jobs_user_id'),
+        sa.CheckConstraint('status BETWEEN 0 AND 5', name='ck_import_jobs_status'),
+        sa.CheckConstraint('rows_processed BETWEEN 0 AND rows_total', name='ck_import_jobs_rows'),
     )
-    op.create_index('ix_import_jobs_id', 'import_jobs', ['id'])
     op.create_index('ix_import_jobs_project_id', 'import_jobs', ['project_id'])
     op.create_index('ix_import_jobs_user_id', 'import_jobs', ['user_id'])
-    op.create_index('ix_import_jobs_status', 'import_jobs', ['status'])
-    op.create_index('ix_import_jobs_celery_task_id', 'import_jobs', ['celery_task_id'])
+    # Only in-flight jobs are looked up by status; finished ones stay out
+    op.create_index(
+        'ix_import_jobs_active', 'import_jobs', ['project_id', 'created_at'],
+        # pending, uploading, parsing, creating_records
+        postgresql_where=sa.text('status IN (0, 1, 2, 3)'),
+    )
+    # One job per Celery task, so a retried worker can upsert its row with
+    # ON CONFLICT (celery_task_id); the constraint's index serves lookups.
+    op.create_unique_constraint(
+        'uq_import_jobs_celery', 'import_jobs', ['celery_task_id']
+    )
 
     # ================================================================
     # Resource Assignments Table
     # ================================================================
     op.create_table(
         'resource_assignments',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('wbs_id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.BigInteger(), sa.Identity(always=False), primary_key=True),
+        sa.Column('wbs_id', sa.BigInteger(), nullable=False),
         sa.Column('resource_code', sa.String(50), nullable=False),
         sa.Column('supplier_code', sa.String(50), nullable=True),
         sa.Column('cost_type_code', sa.String(50), nullable=True),
@@ -173,27 +221,28 @@ def upgrade() -> None:
         sa.Column('bus_area_code', sa.String(50), nullable=True),
         sa.Column('estimating_technique_code', sa.String(50), nullable=True),
         # Three-point estimation
-        sa.Column('best_estimate', sa.Numeric(18, 2), nullable=True, server_default='0'),
-        sa.Column('likely_estimate', sa.Numeric(18, 2), nullable=True, server_default='0'),
-        sa.Column('worst_estimate', sa.Numeric(18, 2), nullable=True, server_default='0'),
+        sa.Column('best_estimate', sa.BigInteger(), nullable=True, server_default='0', comment=CENTS),
+        sa.Column('likely_estimate', sa.BigInteger(), nullable=True, server_default='0', comment=CENTS),
+        sa.Column('worst_estimate', sa.BigInteger(), nullable=True, server_default='0', comment=CENTS),
         # Tracking percentages
-        sa.Column('duty_pct', sa.Numeric(5, 2), nullable=True, server_default='100'),
-        sa.Column('import_content_pct', sa.Numeric(5, 2), nullable=True, server_default='0'),
-        sa.Column('aii_pct', sa.Numeric(5, 2), nullable=True, server_default='0'),
+        sa.Column('duty_pct', sa.SmallInteger(), nullable=True, server_default='10000', comment=BASIS_POINTS),
+        sa.Column('import_content_pct', sa.SmallInteger(), nullable=True, server_default='0', comment=BASIS_POINTS),
+        sa.Column('aii_pct', sa.SmallInteger(), nullable=True, server_default='0', comment=BASIS_POINTS),
         # Timestamps
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.PrimaryKeyConstraint('id'),
-        sa.ForeignKeyConstraint(['wbs_id'], ['wbs.id'], name='fk_assignments_wbs_id', ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['resource_code'], ['resources.resource_code'], name='fk_assignments_resource_code'),
-        sa.ForeignKeyConstraint(['supplier_code'], ['suppliers.supplier_code'], name='fk_assignments_supplier_code'),
-        sa.ForeignKeyConstraint(['cost_type_code'], ['cost_types.code'], name='fk_assignments_cost_type'),
-        sa.ForeignKeyConstraint(['region_code'], ['regions.code'], name='fk_assignments_region'),
-        sa.ForeignKeyConstraint(['bus_area_code'], ['business_areas.code'], name='fk_assignments_bus_area'),
-        sa.ForeignKeyConstraint(['estimating_technique_code'], ['estimating_techniques.code'], name='fk_assignments_est_technique'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
+        sa.ForeignKeyConstraint(['wbs_id'], ['wbs.id'], name='fk_assignments_wbs_id', ondelete='CASCADE', **DEFERRED),
+        sa.ForeignKeyConstraint(['resource_code'], ['resources.resource_code'], name='fk_assignments_resource_code', **DEFERRED),
+        sa.ForeignKeyConstraint(['supplier_code'], ['suppliers.supplier_code'], name='fk_assignments_supplier_code', **DEFERRED),
+        sa.ForeignKeyConstraint(['cost_type_code'], ['cost_types.code'], name='fk_assignments_cost_type', **DEFERRED),
+        sa.ForeignKeyConstraint(['region_code'], ['regions.code'], name='fk_assignments_region', **DEFERRED),
+        sa.ForeignKeyConstraint(['bus_area_code'], ['business_areas.code'], name='fk_assignments_bus_area', **DEFERRED),
+        sa.ForeignKeyConstraint(['estimating_technique_code'], ['estimating_techniques.code'], name='fk_assignments_est_technique', **DEFERRED),
+        # Percentages are basis points: 0-10000
+        sa.CheckConstraint('duty_pct BETWEEN 0 AND 10000', name='ck_ra_duty_pct'),
+        sa.CheckConstraint('import_content_pct BETWEEN 0 AND 10000', name='ck_ra_import_content_pct'),
+        sa.CheckConstraint('aii_pct BETWEEN 0 AND 10000', name='ck_ra_aii_pct'),
     )
-    op.create_index('ix_resource_assignments_id', 'resource_assignments', ['id'])
-    op.create_index('ix_resource_assignments_wbs_id', 'resource_assignments', ['wbs_id'])
 
     # ================================================================
     # Risks Table
@@ -201,36 +250,136 @@ def upgrade() -> None:
     op.create_table(
         'risks',
         sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('wbs_id', sa.Integer(), nullable=False),
+        sa.Column('wbs_id', sa.BigInteger(), nullable=False),
         sa.Column('risk_category_code', sa.String(50), nullable=True),
-        sa.Column('risk_cost', sa.Numeric(18, 2), nullable=True, server_default='0'),
+        sa.Column('risk_cost', sa.BigInteger(), nullable=True, server_default='0', comment=CENTS),
         sa.Column('probability_code', sa.String(50), nullable=True),
         sa.Column('severity_code', sa.String(50), nullable=True),
+        # Weight snapshots and the expected cost derived from them
+        sa.Column('probability_weight', sa.SmallInteger(), nullable=True, comment=HUNDREDTHS),
+        sa.Column('severity_weight', sa.SmallInteger(), nullable=True, comment=HUNDREDTHS),
+        sa.Column(
+            'expected_cost', sa.BigInteger(),
+            sa.Computed(EXPECTED_COST, persisted=True), comment=CENTS,
+        ),
         sa.Column('mitigation_plan', sa.Text(), nullable=True),
-        sa.Column('date_identified', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('date_identified', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
         # Timestamps
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=NOW),
         sa.PrimaryKeyConstraint('id'),
         sa.ForeignKeyConstraint(['wbs_id'], ['wbs.id'], name='fk_risks_wbs_id', ondelete='CASCADE'),
         sa.ForeignKeyConstraint(['risk_category_code'], ['risk_categories.code'], name='fk_risks_category'),
         sa.ForeignKeyConstraint(['probability_code'], ['probability_levels.code'], name='fk_risks_probability'),
         sa.ForeignKeyConstraint(['severity_code'], ['severity_levels.code'], name='fk_risks_severity'),
+        sa.CheckConstraint(
+            'probability_weight >= 0 AND severity_weight >= 0', name='ck_risks_weights'
+        ),
     )
-    op.create_index('ix_risks_id', 'risks', ['id'])
-    op.create_index('ix_risks_wbs_id', 'risks', ['wbs_id'])
+    op.create_index('ix_risks_wbs_expected_cost', 'risks', ['wbs_id', 'expected_cost'])
+
+    op.execute(''.join(
+        f'ALTER TABLE {table_name} SET (fillfactor = 70);\n'
+        for table_name in HIGH_CHURN_TABLES
+    ))
+
+    # ================================================================
+    # Secondary indexes on high-volume tables
+    # ================================================================
+    # Built CONCURRENTLY outside the migration transaction so re-running
+    # against populated tables does not take a write-blocking lock.
+    with op.get_context().autocommit_block():
+        # Hierarchy lookups filter on project_id first, so it leads both
+        # composites (which also serve plain project_id filters).
+        op.create_index(
+            'ix_wbs_project_parent', 'wbs', ['project_id', 'parent_id'],
+            postgresql_concurrently=True,
+        )
+        # INCLUDE lets tree listings run as index-only scans
+        op.create_index(
+            'ix_wbs_project_outline', 'wbs', ['project_id', 'outline_level'],
+            postgresql_include=['wbs_code', 'wbs_title', 'percent_complete'],
+            postgresql_concurrently=True,
+        )
+        # Kept alongside the composite: get_children() and the ON DELETE
+        # SET NULL check of the self-referencing FK filter on parent_id
+        # alone, which the project-led composite cannot serve.
+        op.create_index(
+            'ix_wbs_parent_id', 'wbs', ['parent_id'],
+            postgresql_concurrently=True,
+        )
+        # text_pattern_ops lets prefix LIKE use the index under any
+        # collation, so a subtree is one B-tree range scan.
+        op.create_index(
+            'ix_wbs_path', 'wbs', ['wbs_path'],
+            postgresql_ops={'wbs_path': 'text_pattern_ops'},
+            postgresql_concurrently=True,
+        )
+        # GIN over the name array answers "tasks using resource X" (@>)
+        op.create_index(
+            'ix_wbs_resource_names', 'wbs', ['resource_names'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+        # MS Project UniqueIDs are unique within a project; this backs the
+        # importer's parent-link join and lets re-imports use ON CONFLICT.
+        op.create_index(
+            'uq_wbs_project_task_uid', 'wbs', ['project_id', 'task_unique_id'],
+            unique=True,
+            postgresql_where=sa.text('task_unique_id IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
+        # Covers the per-WBS estimate rollups without touching the heap
+        op.create_index(
+            'ix_ra_wbs_cover', 'resource_assignments', ['wbs_id'],
+            postgresql_include=[
+                'resource_code', 'best_estimate', 'likely_estimate', 'worst_estimate',
+            ],
+            postgresql_concurrently=True,
+        )
+        # Resources and suppliers can be hard-deleted; without these the
+        # FK check on each delete scans resource_assignments. The
+        # remaining code columns point at small admin lookup tables whose
+        # rows are normally deactivated, not deleted; a rare admin delete
+        # can afford the scan, so they stay unindexed.
+        op.create_index(
+            'ix_ra_resource_code', 'resource_assignments', ['resource_code'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_ra_supplier_code', 'resource_assignments', ['supplier_code'],
+            postgresql_where=sa.text('supplier_code IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
+        # Rows are appended in created_at order, so a BRIN range index
+        # serves time-window scans at a fraction of a B-tree's size.
+        for table in ('wbs', 'import_jobs'):
+            op.create_index(
+                f'ix_{table}_created_brin', table, ['created_at'],
+                postgresql_using='brin',
+                postgresql_with={'pages_per_range': 32},
+                postgresql_concurrently=True,
+            )
+
+    # A project's WBS rows are read together (tree expand, estimate
+    # rollup), so keep the heap ordered by (project_id, outline_level).
+    # This only records the clustering index; a maintenance job should run
+    # a plain ``CLUSTER wbs`` after large imports (it takes an ACCESS
+    # EXCLUSIVE lock, so schedule it off-hours). A low vacuum threshold
+    # keeps the freed space reusable for in-place updates.
+    op.execute('ALTER TABLE wbs CLUSTER ON ix_wbs_project_outline')
+    op.execute('ALTER TABLE wbs SET (autovacuum_vacuum_scale_factor = 0.02)')
 
 
 def downgrade() -> None:
     """Drop project, WBS, import, assignment, and risk tables."""
-    # Drop in reverse dependency order
-    op.drop_table('risks')
-    op.drop_table('resource_assignments')
-    op.drop_table('import_jobs')
-    op.drop_table('wbs')
-    op.drop_table('projects')
-
-    # Drop enum types
-    op.execute('DROP TYPE importstatus')
-    op.execute('DROP TYPE projectsourceformat')
-    op.execute('DROP TYPE projectstatus')
+    # IF EXISTS keeps this re-runnable after a partially applied upgrade.
+    op.execute(
+        'DROP TABLE IF EXISTS risks, resource_assignments, import_jobs, wbs, '
+        'projects CASCADE'
+    )
+    # Databases upgraded before the statuses became SMALLINTs may still
+    # carry the old native enum types.
+    op.execute(
+        'DROP TYPE IF EXISTS importstatus, projectsourceformat, projectstatus CASCADE'
+    )
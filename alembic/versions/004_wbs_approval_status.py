@@ -20,6 +20,9 @@ depends_on = None
 
 def upgrade() -> None:
     """Add approval_status column to wbs table."""
+    # A constant server_default is a catalog-only change on PostgreSQL 11+:
+    # existing rows read 'draft' without a table rewrite, so no batched
+    # backfill is needed here.
     op.add_column(
         "wbs",
         sa.Column(
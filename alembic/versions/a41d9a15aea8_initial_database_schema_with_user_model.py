@@ -18,7 +18,27 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# Short OLTP queries never recoup JIT compilation time. Set per database
+# rather than as a connection startup option, which PgBouncer rejects.
+SET_JIT_OFF = """
+DO $$
+BEGIN
+    EXECUTE format('ALTER DATABASE %I SET jit = off', current_database());
+END
+$$
+"""
+RESET_JIT = """
+DO $$
+BEGIN
+    EXECUTE format('ALTER DATABASE %I RESET jit', current_database());
+END
+$$
+"""
+
+
 def upgrade() -> None:
+    op.execute(SET_JIT_OFF)
+
     # Create user_role enum
     op.execute("CREATE TYPE userrole AS ENUM ('admin', 'manager', 'user', 'viewer')")
 
@@ -33,22 +53,29 @@ def upgrade() -> None:
         sa.Column('role', sa.Enum('admin', 'manager', 'user', 'viewer', name='userrole'), nullable=False),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
         sa.Column('is_verified', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('last_login', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('last_login', sa.DateTime(timezone=True), nullable=True),
         sa.PrimaryKeyConstraint('id')
     )
     op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
-    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
     op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True)
+    # The primary key already indexes id; active-user listings use this
+    # smaller partial index instead.
+    op.create_index(
+        'ix_users_active_id', 'users', ['id'],
+        postgresql_where=sa.text('is_active'),
+    )
 
 
 def downgrade() -> None:
     # Drop users table and indexes
+    op.drop_index('ix_users_active_id', table_name='users')
     op.drop_index(op.f('ix_users_username'), table_name='users')
-    op.drop_index(op.f('ix_users_id'), table_name='users')
     op.drop_index(op.f('ix_users_email'), table_name='users')
     op.drop_table('users')
 
     # Drop enum type
     op.execute('DROP TYPE userrole')
+
+    op.execute(RESET_JIT)
@@ -17,6 +17,11 @@ down_revision: Union[str, None] = 'a41d9a15aea8'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Tables holding multi-KB help bodies. A lower toast_tuple_target moves any
+# body over ~512 bytes out of line (compressed) into the TOAST table, so
+# the main heap keeps only the metadata that listings filter and sort on.
+TEXT_HEAVY_TABLES = ('help_topics', 'help_descriptions')
+
 
 def upgrade() -> None:
     # Create help_categories table
@@ -26,12 +31,11 @@ def upgrade() -> None:
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('display_order', sa.Integer(), nullable=False, server_default='0'),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('name'),
     )
-    op.create_index(op.f('ix_help_categories_id'), 'help_categories', ['id'], unique=False)
 
     # Create help_topics table
     op.create_table(
@@ -42,12 +46,11 @@ def upgrade() -> None:
         sa.Column('content', sa.Text(), nullable=False),
         sa.Column('display_order', sa.Integer(), nullable=False, server_default='0'),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
         sa.ForeignKeyConstraint(['category_id'], ['help_categories.id']),
         sa.PrimaryKeyConstraint('id'),
     )
-    op.create_index(op.f('ix_help_topics_id'), 'help_topics', ['id'], unique=False)
 
     # Create help_descriptions table
     op.create_table(
@@ -56,17 +59,16 @@ def upgrade() -> None:
         sa.Column('topic_id', sa.Integer(), nullable=False),
         sa.Column('section_number', sa.Integer(), nullable=False, server_default='1'),
         sa.Column('detailed_text', sa.Text(), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
         sa.ForeignKeyConstraint(['topic_id'], ['help_topics.id']),
         sa.PrimaryKeyConstraint('id'),
     )
-    op.create_index(op.f('ix_help_descriptions_id'), 'help_descriptions', ['id'], unique=False)
+
+    for table_name in TEXT_HEAVY_TABLES:
+        op.execute(f'ALTER TABLE {table_name} SET (toast_tuple_target = 512)')
 
 
 def downgrade() -> None:
-    op.drop_index(op.f('ix_help_descriptions_id'), table_name='help_descriptions')
     op.drop_table('help_descriptions')
-    op.drop_index(op.f('ix_help_topics_id'), table_name='help_topics')
     op.drop_table('help_topics')
-    op.drop_index(op.f('ix_help_categories_id'), table_name='help_categories')
     op.drop_table('help_categories')
@@ -1,15 +1,41 @@
-"""Core application modules."""
+"""Core application modules.
+
+Only settings are loaded eagerly. Database and security helpers are
+resolved on first access (PEP 562), so importing ``app.core.config`` --
+which runs this package first -- does not pull in SQLAlchemy, passlib or
+PyJWT.
+"""
+from importlib import import_module
+
 from app.core.config import get_settings, settings
-from app.core.database import Base, SessionLocal, drop_db, engine, get_db, init_db
-from app.core.security import (
-    create_access_token,
-    create_refresh_token,
-    get_current_user,
-    get_password_hash,
-    require_any_role,
-    require_role,
-    verify_password,
-)
+
+_LAZY_EXPORTS = {
+    "Base": "app.core.database",
+    "bulk_session": "app.core.database",
+    "drop_db": "app.core.database",
+    "get_db": "app.core.database",
+    "get_engine": "app.core.database",
+    "get_scoped_session": "app.core.database",
+    "get_sessionmaker": "app.core.database",
+    "init_db": "app.core.database",
+    "create_access_token": "app.core.security",
+    "create_refresh_token": "app.core.security",
+    "get_current_user": "app.core.security",
+    "get_password_hash": "app.core.security",
+    "require_any_role": "app.core.security",
+    "require_role": "app.core.security",
+    "verify_password": "app.core.security",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "settings",
@@ -18,8 +44,10 @@ __all__ = [
     "init_db",
     "drop_db",
     "Base",
-    "SessionLocal",
-    "engine",
+    "get_engine",
+    "get_sessionmaker",
+    "get_scoped_session",
+    "bulk_session",
     "get_password_hash",
     "verify_password",
     "create_access_token",
@@ -1,6 +1,7 @@
 """
 Common dependencies for FastAPI endpoints.
 """
+from dataclasses import dataclass
 from typing import Optional
 
 from fastapi import Header, HTTPException, status
@@ -17,9 +18,17 @@ async def verify_api_key(x_api_key: Optional[str] = Header(None)) -> str:
     return x_api_key or ""
 
 
+@dataclass(frozen=True, slots=True)
+class Pagination:
+    """Validated pagination window."""
+
+    skip: int
+    limit: int
+
+
 async def get_pagination_params(
     skip: int = 0, limit: int = 100, max_limit: int = 1000
-) -> dict:
+) -> Pagination:
     """
     Get pagination parameters.
 
@@ -29,24 +38,15 @@ async def get_pagination_params(
         max_limit: Maximum allowed limit
 
     Returns:
-        Dictionary with skip and limit values
+        Pagination with skip and limit values
     """
+    if skip >= 0 and 1 <= limit <= max_limit:
+        return Pagination(skip, limit)
+
     if skip < 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Skip value must be non-negative",
-        )
-
-    if limit < 1:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Limit value must be positive",
-        )
-
-    if limit > max_limit:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Limit value cannot exceed {max_limit}",
-        )
-
-    return {"skip": skip, "limit": limit}
+        detail = "Skip value must be non-negative"
+    elif limit < 1:
+        detail = "Limit value must be positive"
+    else:
+        detail = f"Limit value cannot exceed {max_limit}"
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
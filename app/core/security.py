@@ -1,20 +1,52 @@
 """
 Security utilities for authentication and authorization.
 """
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional
 
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Password hashing. Existing hashes keep verifying at whatever cost they
+# were created with; only new hashes use BCRYPT_ROUNDS.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__ident="2b",
+)
+
+# passlib silently falls back to its pure-Python bcrypt (orders of
+# magnitude slower) when no native backend is importable.
+_bcrypt_backend = pwd_context.handler("bcrypt").get_backend()
+if _bcrypt_backend == "builtin":
+    raise RuntimeError(
+        "passlib selected its pure-Python bcrypt backend; install bcrypt>=4"
+    )
+logger.debug("Using bcrypt backend %r", _bcrypt_backend)
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt releases the GIL, so hashing on these threads runs in parallel
+# while the event loop keeps serving other requests.
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt"
+)
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
@@ -30,12 +62,29 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the bcrypt thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _BCRYPT_POOL, pwd_context.verify, plain_password, hashed_password
+    )
+
+
+async def aget_password_hash(password: str) -> str:
+    """Hash a password on the bcrypt thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, pwd_context.hash, password)
+
+
 def create_access_token(
     data: Dict[str, Any], expires_delta: Optional[timedelta] = None
 ) -> str:
     """
     Create a JWT access token.
 
+    ``sub`` stays a string per RFC 7519; the user id is also stored as a
+    numeric ``uid`` claim so ``get_current_user`` never has to parse it.
+
     Args:
         data: Data to encode in the token
         expires_delta: Token expiration time (default: 30 minutes)
@@ -44,6 +93,8 @@ def create_access_token(
         Encoded JWT token
     """
     to_encode = data.copy()
+    if "uid" not in to_encode:
+        to_encode["uid"] = int(to_encode["sub"])
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
@@ -77,6 +128,28 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
     return encoded_jwt
 
 
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
+
+def _credentials_exception() -> HTTPException:
+    """401 for a missing, invalid or expired token.
+
+    Built only on the failure path, and fresh each time: re-raising one
+    shared instance would keep growing its ``__traceback__``.
+    """
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers=_BEARER_CHALLENGE,
+    )
+
+
+# Verified payloads keyed by token digest. Authenticated clients replay the
+# same token on every request, so the HMAC check and JSON parse run once
+# per token per worker; expiry is still enforced on every hit.
+_token_cache = TTLCache(maxsize=10_000, ttl=30)
+
+
 def decode_token(token: str) -> Dict[str, Any]:
     """
     Decode and verify a JWT token.
@@ -90,26 +163,52 @@ def decode_token(token: str) -> Dict[str, Any]:
     Raises:
         HTTPException: If token is invalid or expired
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _token_cache.get(key)
+    if payload is not None:
+        if payload.get("exp", float("inf")) > time.time():
+            return dict(payload)
+        _token_cache.pop(key)
+        raise _credentials_exception()
 
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        return payload
-    except JWTError:
-        raise credentials_exception
+    except jwt.InvalidTokenError:
+        raise _credentials_exception()
+    _token_cache.set(key, payload)
+    return dict(payload)
+
+
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    """Session-independent snapshot of the authenticated user."""
+
+    id: int
+    username: str
+    role: Any  # UserRole
+    is_active: bool
+
+
+# Snapshots keyed by user id. Each worker may serve a snapshot up to ttl
+# seconds old; UserService drops the entry when it changes the user here.
+_user_cache = TTLCache(maxsize=50_000, ttl=10)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Forget the cached snapshot of ``user_id`` in this worker."""
+    _user_cache.pop(user_id)
 
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
-):
+) -> CurrentUser:
     """
-    Get current authenticated user from the database.
+    Get current authenticated user.
+
+    The user row is loaded at most once per ``_user_cache`` ttl per worker
+    and returned as a ``CurrentUser`` snapshot.
 
     Usage:
         @app.get("/me")
@@ -118,23 +217,32 @@ async def get_current_user(
     """
     from app.models.database.user import User
 
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    try:
-        payload = decode_token(token)
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-
-    user = db.get(User, int(user_id))
+    payload = decode_token(token)
+    # Refresh tokens are only good for /auth/refresh, never as access tokens.
+    if payload.get("type") == "refresh":
+        raise _credentials_exception()
+    user_id = payload.get("uid")
+    if user_id is None:
+        # Access tokens issued before create_access_token added uid carry
+        # only sub; they expire within ACCESS_TOKEN_EXPIRE_MINUTES, after
+        # which this fallback can go.
+        try:
+            user_id = int(payload["sub"])
+        except (KeyError, TypeError, ValueError):
+            raise _credentials_exception()
+
+    user = _user_cache.get(user_id)
     if user is None:
-        raise credentials_exception
+        db_user = db.get(User, user_id)
+        if db_user is None:
+            raise _credentials_exception()
+        user = CurrentUser(
+            id=db_user.id,
+            username=db_user.username,
+            role=db_user.role,
+            is_active=db_user.is_active,
+        )
+        _user_cache.set(user.id, user)
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -143,10 +251,15 @@ async def get_current_user(
     return user
 
 
+@lru_cache(maxsize=32)
 def require_role(required_role: str):
     """
     Dependency to require a specific role.
 
+    Cached per role so every route guarded by the same role shares one
+    checker; FastAPI then resolves it once per request instead of once
+    per distinct closure.
+
     Usage:
         @app.get("/admin")
         def admin_only(
@@ -179,6 +292,13 @@ def require_any_role(*roles: str):
             return {"message": "Welcome, manager!"}
     """
 
+    return _any_role_checker(frozenset(roles))
+
+
+@lru_cache(maxsize=32)
+def _any_role_checker(roles: FrozenSet[str]):
+    """Build the checker for ``require_any_role``, keyed on the role set."""
+
     async def role_checker(current_user=Depends(get_current_user)):
         if current_user.role.value not in roles:
             raise HTTPException(
@@ -1,10 +1,9 @@
 import os
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterable, Sequence
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import sessionmaker
 
 from app.models.project import Base
 
@@ -20,18 +19,20 @@ if DATABASE_URL.startswith("postgresql://"):
 else:
     ASYNC_DATABASE_URL = DATABASE_URL
 
-# Sync engine for migrations
-sync_engine = create_engine(
-    DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://"),
-    echo=False,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
-
 # Async engine for application
 async_engine = create_async_engine(
-    ASYNC_DATABASE_URL, echo=False, pool_pre_ping=True, pool_size=10, max_overflow=20
+    ASYNC_DATABASE_URL,
+    echo=False,
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=40,
+    pool_recycle=1800,
+    pool_timeout=5,
+    connect_args={
+        # SQLAlchemy's and asyncpg's prepared statement caches
+        "prepared_statement_cache_size": 500,
+        "statement_cache_size": 500,
+    },
 )
 
 # Session makers
@@ -43,12 +44,20 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=False,
 )
 
-SessionLocal = sessionmaker(sync_engine, autoflush=False, autocommit=False)
-
 
 def init_db():
-    """Initialize database tables (sync)"""
-    Base.metadata.create_all(bind=sync_engine)
+    """Initialize database tables (sync)
+
+    Uses a throwaway single-connection engine so the async engine is the
+    only long-lived pool.
+    """
+    engine = create_engine(
+        DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://"), pool_size=1
+    )
+    try:
+        Base.metadata.create_all(bind=engine)
+    finally:
+        engine.dispose()
 
 
 async def init_db_async():
@@ -57,15 +66,52 @@ async def init_db_async():
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def bulk_insert_rows(
+    table: str, columns: Sequence[str], rows: Iterable[Sequence]
+) -> None:
+    """
+    Load rows into a table with asyncpg's binary COPY
+
+    Use this instead of per-row INSERTs for seeding or other bulk loads:
+    COPY is parsed and planned once and streams the rows, which is an
+    order of magnitude faster than parameterized INSERTs. Values must be
+    native Python types matching the column types (no ORM conversions).
+
+    Usage:
+        await bulk_insert_rows("regions", ("code", "description"), rows)
+    """
+    async with async_engine.begin() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table, records=rows, columns=list(columns)
+        )
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency function to get database session for FastAPI endpoints
+    Dependency function to get a read-only database session
+
+    Nothing is committed: closing the session rolls back its transaction
+    without a COMMIT round-trip. Use ``get_db_tx`` for endpoints that write.
 
     Usage:
         @app.get("/endpoint")
         async def endpoint(db: AsyncSession = Depends(get_db)):
             # use db session
     """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_db_tx() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get a database session that commits on success
+
+    Usage:
+        @app.post("/endpoint")
+        async def endpoint(db: AsyncSession = Depends(get_db_tx)):
+            # use db session
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -73,8 +119,6 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 
 async def close_db():
@@ -2,7 +2,7 @@ import logging
 
 from fastapi import HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -71,7 +71,7 @@ class InvalidFileTypeException(ICEPacException):
 
 async def icepac_exception_handler(
     request: Request, exc: ICEPacException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handler for custom ICEPac exceptions"""
     logger.error(
         f"ICEPac error: {exc.message}",
@@ -82,7 +82,7 @@ async def icepac_exception_handler(
         },
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": True,
@@ -93,22 +93,25 @@ async def icepac_exception_handler(
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(
+    request: Request, exc: HTTPException
+) -> ORJSONResponse:
     """Handler for FastAPI HTTP exceptions"""
     logger.warning(
         f"HTTP error: {exc.detail}",
         extra={"status_code": exc.status_code, "path": request.url.path},
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": True, "message": exc.detail, "path": request.url.path},
+        headers=getattr(exc, "headers", None),
     )
 
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handler for request validation errors"""
     errors = []
     for error in exc.errors():
@@ -125,7 +128,7 @@ async def validation_exception_handler(
         extra={"path": request.url.path, "errors": errors},
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": True,
@@ -136,14 +139,14 @@ async def validation_exception_handler(
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handler for unhandled exceptions"""
     logger.exception(
         f"Unhandled error: {str(exc)}",
         extra={"path": request.url.path, "exception_type": type(exc).__name__},
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": True,
@@ -1,19 +1,35 @@
-import json
 import logging
+import logging.handlers
+import queue
 import sys
-from datetime import datetime
-from typing import Any
+import time
+from typing import Any, Optional
+
+import orjson
 
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging"""
 
+    # (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last record;
+    # one tuple so concurrent formatters never see a mismatched pair
+    _second = (None, "")
+
+    def _timestamp(self, created: float) -> str:
+        """UTC ISO-8601 timestamp; the whole-second part is reused."""
+        second = int(created)
+        cached_second, prefix = self._second
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}"
+
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": record.getMessage() if record.args else str(record.msg),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
@@ -27,17 +43,43 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
 
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, default=str).decode()
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records unformatted, leaving all formatting to the listener."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The default prepare() formats on the calling thread and folds the
+        # traceback into the message, dropping exc_info; the listener lives
+        # in this process, so the record can be passed through untouched.
+        return record
+
+
+# Drains queued records to stdout on its own thread; see setup_logging
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_running = False
 
 
-def setup_logging(log_level: str = "INFO", json_format: bool = False) -> None:
+def setup_logging(
+    log_level: str = "INFO",
+    json_format: bool = False,
+    log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+) -> None:
     """
     Configure application logging
 
+    Loggers only enqueue records; formatting and the blocking stdout write
+    happen on a background listener thread, off the event loop. Call
+    ``stop_logging()`` on shutdown to flush what is still queued.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_format: Whether to use JSON formatting for logs
+        log_format: Format string for plain-text logs
     """
+    global _listener
+
     level = getattr(logging, log_level.upper(), logging.INFO)
 
     # Create handler
@@ -48,17 +90,24 @@ def setup_logging(log_level: str = "INFO", json_format: bool = False) -> None:
         formatter = JSONFormatter()
     else:
         formatter = logging.Formatter(
-            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            fmt=log_format,
             datefmt="%Y-%m-%d %H:%M:%S",
         )
 
     handler.setFormatter(formatter)
 
+    stop_logging()
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, handler, respect_handler_level=True
+    )
+    start_logging()
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     root_logger.handlers = []
-    root_logger.addHandler(handler)
+    root_logger.addHandler(_DeferredQueueHandler(log_queue))
 
     # Set level for third-party loggers
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -68,6 +117,22 @@ def setup_logging(log_level: str = "INFO", json_format: bool = False) -> None:
     logging.getLogger("botocore").setLevel(logging.WARNING)
 
 
+def start_logging() -> None:
+    """Start the background log writer (no-op if already running)."""
+    global _listener_running
+    if _listener is not None and not _listener_running:
+        _listener.start()
+        _listener_running = True
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background log writer."""
+    global _listener_running
+    if _listener is not None and _listener_running:
+        _listener.stop()
+        _listener_running = False
+
+
 class LoggerAdapter(logging.LoggerAdapter):
     """Custom logger adapter for adding context to logs"""
 
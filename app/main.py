@@ -2,31 +2,47 @@
 ICEPac FastAPI Application
 Cost Estimation & Project Risk Management System
 """
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+import redis.asyncio as aioredis
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
+from app.core.database import get_engine
+from app.logging_config import setup_logging, start_logging, stop_logging
+from app.middleware.db_session import DBSessionScopeMiddleware
 from app.middleware.error_handler import ErrorHandlerMiddleware
 from app.middleware.request_logging import RequestLoggingMiddleware
+from app.routes import admin, auth, estimation, help, project
+from app.services.config_cache import config_cache
 
 # Configure logging
-logging.basicConfig(
-    level=settings.LOG_LEVEL,
-    format=settings.LOG_FORMAT,
-)
+setup_logging(settings.LOG_LEVEL, log_format=settings.LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - startup and shutdown events."""
+    start_logging()
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Debug mode: {settings.DEBUG}")
+    try:
+        await run_in_threadpool(config_cache.preload)
+    except Exception as exc:
+        # Lookups load lazily instead; the app must still come up.
+        logger.warning(f"Config cache preload failed: {exc}")
     yield
     logger.info(f"Shutting down {settings.APP_NAME}")
+    stop_logging()
 
 
 # Create FastAPI application
@@ -38,9 +54,15 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Middleware (order matters - last added is first executed)
+# Middleware (order matters - last added is first executed). CORS goes
+# outermost so preflights short-circuit and error responses still carry
+# the CORS headers the browser needs to read them.
+app.add_middleware(DBSessionScopeMiddleware)
+app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(ErrorHandlerMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
@@ -48,35 +70,83 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(RequestLoggingMiddleware)
-app.add_middleware(ErrorHandlerMiddleware)
 
 
-@app.get("/health", tags=["System"])
-async def health_check():
-    """Health check endpoint."""
-    return {
+# Static payloads, serialised once: settings are frozen after startup
+_HEALTH_JSON = orjson.dumps(
+    {
         "status": "healthy",
         "app": settings.APP_NAME,
         "version": settings.APP_VERSION,
     }
-
-
-@app.get("/", tags=["System"])
-async def root():
-    """Root endpoint - API information."""
-    return {
+)
+_ROOT_JSON = orjson.dumps(
+    {
         "app": settings.APP_NAME,
         "version": settings.APP_VERSION,
         "description": settings.APP_DESCRIPTION,
         "docs": "/docs",
         "health": "/health",
+        "ready": "/ready",
     }
+)
 
 
-# Include routers
-from app.routes import admin, auth, estimation, help, project  # noqa: E402
+@app.get("/health", tags=["System"])
+async def health_check():
+    """Health check endpoint."""
+    return Response(_HEALTH_JSON, media_type="application/json")
+
+
+# Readiness results are reused for this long, so probes from several load
+# balancers cost one round of backend checks per interval, not one each.
+READY_CACHE_SECONDS = 2.0
+READY_CHECK_TIMEOUT = 0.5
+_ready_cache = {"at": float("-inf"), "result": None}
+# Connections are opened lazily and pooled across probes
+_redis = aioredis.from_url(settings.REDIS_URL)
+
+
+def _ping_database() -> None:
+    with get_engine().connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+async def _probe(check) -> str:
+    try:
+        await asyncio.wait_for(check, READY_CHECK_TIMEOUT)
+    except Exception:
+        return "unavailable"
+    return "ok"
+
+
+@app.get("/ready", tags=["System"])
+async def readiness_check():
+    """Readiness check endpoint (database and Redis, cached briefly)."""
+    now = time.monotonic()
+    if now - _ready_cache["at"] >= READY_CACHE_SECONDS:
+        database, redis_status = await asyncio.gather(
+            _probe(run_in_threadpool(_ping_database)), _probe(_redis.ping())
+        )
+        _ready_cache["result"] = {"database": database, "redis": redis_status}
+        _ready_cache["at"] = now
 
+    checks = _ready_cache["result"]
+    # Redis is only a cache; the app keeps serving without it
+    ready = checks["database"] == "ok"
+    return ORJSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "unavailable", "checks": checks},
+    )
+
+
+@app.get("/", tags=["System"])
+async def root():
+    """Root endpoint - API information."""
+    return Response(_ROOT_JSON, media_type="application/json")
+
+
+# Include routers
 app.include_router(auth.router, prefix=settings.API_V1_PREFIX, tags=["Authentication"])
 app.include_router(admin.router, prefix=settings.API_V1_PREFIX, tags=["Admin"])
 app.include_router(help.router, prefix=settings.API_V1_PREFIX, tags=["Help"])
@@ -89,4 +159,13 @@ app.include_router(
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    # Development runner. uvicorn[standard] ships the C event loop and HTTP
+    # parser; "auto" picks uvloop everywhere except Windows, which it lacks.
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=settings.DEBUG,
+        loop="auto",
+        http="httptools",
+    )
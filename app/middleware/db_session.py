@@ -0,0 +1,24 @@
+"""Database session scoping middleware."""
+import uuid
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.database import request_scope
+
+
+class DBSessionScopeMiddleware:
+    """Tags each request so ``get_db`` shares one session across its dependencies."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_scope.set(uuid.uuid4().hex)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_scope.reset(token)
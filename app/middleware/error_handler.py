@@ -1,29 +1,47 @@
 """Global error handling middleware."""
 import logging
 
-from fastapi import Request, status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
+class ErrorHandlerMiddleware:
     """Catches unhandled exceptions and returns structured error responses."""
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
             logger.error(
-                f"Unhandled exception on {request.method} {request.url.path}: {exc}",
+                f"Unhandled exception on {scope['method']} {scope['path']}: {exc}",
                 exc_info=True,
             )
-            return JSONResponse(
+            # Headers already went out; nothing sensible left to send
+            if response_started:
+                raise
+            response = JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "detail": "Internal server error",
-                    "path": request.url.path,
+                    "path": scope["path"],
                 },
             )
+            await response(scope, receive, send)
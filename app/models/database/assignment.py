@@ -1,64 +1,122 @@
 """Resource Assignment database model."""
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    Column,
+    Float,
+    ForeignKey,
+    Identity,
+    Index,
+    String,
+    cast,
+    text,
+    type_coerce,
+)
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.models.database.mixins import TimestampMixin
+from app.models.database.types import BasisPoints, BigIntPK, Cents
+
+# Checked at COMMIT so bulk loads can run under SET CONSTRAINTS ALL DEFERRED.
+DEFERRED_FK = {"deferrable": True, "initially": "DEFERRED"}
 
 
-class ResourceAssignment(Base):
+class ResourceAssignment(TimestampMixin, Base):
     """Resource Assignment model - maps to legacy tblResourceAssignment."""
 
     __tablename__ = "resource_assignments"
+    __repr_fields__ = ("id", "wbs_id", "resource_code")
+    __table_args__ = (
+        Index(
+            "ix_ra_wbs_cover",
+            "wbs_id",
+            postgresql_include=[
+                "resource_code",
+                "best_estimate",
+                "likely_estimate",
+                "worst_estimate",
+            ],
+        ),
+        Index("ix_ra_resource_code", "resource_code"),
+        Index(
+            "ix_ra_supplier_code",
+            "supplier_code",
+            postgresql_where=text("supplier_code IS NOT NULL"),
+        ),
+        # Percentages are stored as basis points (100% == 10000)
+        CheckConstraint("duty_pct BETWEEN 0 AND 10000", name="ck_ra_duty_pct"),
+        CheckConstraint(
+            "import_content_pct BETWEEN 0 AND 10000", name="ck_ra_import_content_pct"
+        ),
+        CheckConstraint("aii_pct BETWEEN 0 AND 10000", name="ck_ra_aii_pct"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    wbs_id = Column(Integer, ForeignKey("wbs.id"), nullable=False, index=True)
+    id = Column(BigIntPK, Identity(), primary_key=True)
+    wbs_id = Column(BigInteger, ForeignKey("wbs.id", **DEFERRED_FK), nullable=False)
     resource_code = Column(
-        String(50), ForeignKey("resources.resource_code"), nullable=False
+        String(50), ForeignKey("resources.resource_code", **DEFERRED_FK), nullable=False
     )
     supplier_code = Column(
-        String(50), ForeignKey("suppliers.supplier_code"), nullable=True
+        String(50), ForeignKey("suppliers.supplier_code", **DEFERRED_FK), nullable=True
+    )
+    cost_type_code = Column(
+        String(50), ForeignKey("cost_types.code", **DEFERRED_FK), nullable=True
+    )
+    region_code = Column(
+        String(50), ForeignKey("regions.code", **DEFERRED_FK), nullable=True
+    )
+    bus_area_code = Column(
+        String(50), ForeignKey("business_areas.code", **DEFERRED_FK), nullable=True
     )
-    cost_type_code = Column(String(50), ForeignKey("cost_types.code"), nullable=True)
-    region_code = Column(String(50), ForeignKey("regions.code"), nullable=True)
-    bus_area_code = Column(String(50), ForeignKey("business_areas.code"), nullable=True)
     estimating_technique_code = Column(
-        String(50), ForeignKey("estimating_techniques.code"), nullable=True
+        String(50),
+        ForeignKey("estimating_techniques.code", **DEFERRED_FK),
+        nullable=True,
     )
 
     # Three-point estimation
-    best_estimate = Column(Numeric(18, 2), default=0)
-    likely_estimate = Column(Numeric(18, 2), default=0)
-    worst_estimate = Column(Numeric(18, 2), default=0)
+    best_estimate = Column(Cents, default=0)
+    likely_estimate = Column(Cents, default=0)
+    worst_estimate = Column(Cents, default=0)
 
     # Tracking percentages
-    duty_pct = Column(Numeric(5, 2), default=100)
-    import_content_pct = Column(Numeric(5, 2), default=0)
-    aii_pct = Column(Numeric(5, 2), default=0)  # Actual Import Implementation
-
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
-    )
+    duty_pct = Column(BasisPoints, default=100)
+    import_content_pct = Column(BasisPoints, default=0)
+    aii_pct = Column(BasisPoints, default=0)  # Actual Import Implementation
 
     # Relationships
     wbs_item = relationship("WBS", back_populates="assignments")
 
-    @property
+    @hybrid_property
     def pert_estimate(self) -> float:
         """PERT estimate: (Best + 4*Likely + Worst) / 6"""
         return float(
             (self.best_estimate + 4 * self.likely_estimate + self.worst_estimate) / 6
         )
 
-    @property
+    @pert_estimate.expression
+    def pert_estimate(cls):
+        # Work on the raw cents so literals are not scaled by Cents, then
+        # divide by 6 * 100 in floating point.
+        best, likely, worst = cls._raw_estimates()
+        return cast(best + 4 * likely + worst, Float) / 600
+
+    @hybrid_property
     def std_deviation(self) -> float:
         """Standard deviation: (Worst - Best) / 6"""
         return float((self.worst_estimate - self.best_estimate) / 6)
 
-    def __repr__(self):
-        return (
-            f"<ResourceAssignment(id={self.id}, "
-            f"wbs={self.wbs_id}, resource='{self.resource_code}')>"
+    @std_deviation.expression
+    def std_deviation(cls):
+        best, _, worst = cls._raw_estimates()
+        return cast(worst - best, Float) / 600
+
+    @classmethod
+    def _raw_estimates(cls):
+        """The three estimate columns as plain BIGINT cents expressions."""
+        return tuple(
+            type_coerce(column, BigInteger)
+            for column in (cls.best_estimate, cls.likely_estimate, cls.worst_estimate)
         )
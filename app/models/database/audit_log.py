@@ -1,10 +1,23 @@
 """Audit log database model for tracking all system changes."""
-from datetime import datetime
-
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import backref, relationship
 
 from app.core.database import Base
+from app.models.database.mixins import detail_column
+
+# Binary JSONB on PostgreSQL (parsed once, GIN-indexable); plain JSON elsewhere.
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
 
 
 class AuditLog(Base):
@@ -15,26 +28,44 @@ class AuditLog(Base):
     """
 
     __tablename__ = "audit_logs"
+    __repr_fields__ = ("id", "action", "entity_type", "entity_id")
+    __table_args__ = (
+        Index("ix_audit_logs_user_time", "user_id", "created_at"),
+        Index("ix_audit_logs_action_time", "action", "created_at"),
+        Index(
+            "ix_audit_logs_entity",
+            "entity_type",
+            "entity_id",
+            "created_at",
+            postgresql_include=["action"],
+        ),
+        Index(
+            "ix_audit_logs_new_values",
+            "new_values",
+            postgresql_using="gin",
+            postgresql_ops={"new_values": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
-    action = Column(String(50), nullable=False, index=True)
-    entity_type = Column(String(100), nullable=False, index=True)
-    entity_id = Column(Integer, nullable=True, index=True)
-    old_values = Column(JSON, nullable=True)
-    new_values = Column(JSON, nullable=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    action = Column(String(50), nullable=False)
+    entity_type = Column(String(100), nullable=False)
+    entity_id = Column(Integer, nullable=True)
+    # Diffs and user agent are only read by the admin views, which undefer them
+    old_values = detail_column(JSONDocument, nullable=True)
+    new_values = detail_column(JSONDocument, nullable=True)
     ip_address = Column(String(45), nullable=True)  # IPv6 max length
-    user_agent = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-
-    # Relationship to user (optional, for when user is deleted)
-    user = relationship("User", backref="audit_logs", lazy="joined")
+    user_agent = detail_column(Text, nullable=True)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False, index=True)
 
-    def __repr__(self):
-        return (
-            f"<AuditLog(id={self.id}, action='{self.action}', "
-            f"entity='{self.entity_type}:{self.entity_id}')>"
-        )
+    # Relationship to user (optional, for when user is deleted).
+    # selectin loads the users for a page of logs in one IN query instead of
+    # joining a user row onto every log; the reverse side stays a query so a
+    # busy user's history is never materialised wholesale.
+    user = relationship(
+        "User", backref=backref("audit_logs", lazy="dynamic"), lazy="selectin"
+    )
 
 
 # Action constants
@@ -4,11 +4,18 @@ Maps legacy tables: tblCostType, tblExpType, tblRegion, tblBus_Area,
 tblEstimatingTechnique, tblRiskCategory, tblProbabilityOccurrence,
 tblSeverityOccurrence, tblExpInd, tblPMBWeight.
 """
-from datetime import datetime
-
-from sqlalchemy import Boolean, Column, DateTime, Integer, Numeric, String
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Column,
+    DateTime,
+    Integer,
+    String,
+    func,
+)
 
 from app.core.database import Base
+from app.models.database.types import Weight
 
 # ============================================================
 # Base classes for config tables
@@ -18,17 +25,21 @@ from app.core.database import Base
 class ConfigTableMixin:
     """Mixin for standard configuration tables."""
 
-    id = Column(Integer, primary_key=True, index=True)
-    code = Column(String(50), unique=True, nullable=False, index=True)
+    __repr_fields__ = ("code",)
+
+    id = Column(Integer, primary_key=True)
+    code = Column(String(50), unique=True, nullable=False)
     description = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
 
 class WeightedConfigTableMixin(ConfigTableMixin):
     """Mixin for weighted configuration tables (probability, severity, etc.)."""
 
-    weight = Column(Numeric(5, 2), nullable=False)
+    weight = Column(Weight, nullable=False)
 
 
 # ============================================================
@@ -40,9 +51,7 @@ class CostType(ConfigTableMixin, Base):
     """Cost type classification - maps to legacy tblCostType."""
 
     __tablename__ = "cost_types"
-
-    def __repr__(self):
-        return f"<CostType(code='{self.code}', desc='{self.description}')>"
+    __repr_fields__ = ("code", "description")
 
 
 class ExpenseType(ConfigTableMixin, Base):
@@ -50,54 +59,36 @@ class ExpenseType(ConfigTableMixin, Base):
 
     __tablename__ = "expense_types"
 
-    def __repr__(self):
-        return f"<ExpenseType(code='{self.code}')>"
-
 
 class Region(ConfigTableMixin, Base):
     """Geographic region - maps to legacy tblRegion."""
 
     __tablename__ = "regions"
 
-    def __repr__(self):
-        return f"<Region(code='{self.code}')>"
-
 
 class BusinessArea(ConfigTableMixin, Base):
     """Business area - maps to legacy tblBus_Area."""
 
     __tablename__ = "business_areas"
 
-    def __repr__(self):
-        return f"<BusinessArea(code='{self.code}')>"
-
 
 class EstimatingTechnique(ConfigTableMixin, Base):
     """Estimating technique - maps to legacy tblEstimatingTechnique."""
 
     __tablename__ = "estimating_techniques"
 
-    def __repr__(self):
-        return f"<EstimatingTechnique(code='{self.code}')>"
-
 
 class RiskCategory(ConfigTableMixin, Base):
     """Risk category - maps to legacy tblRiskCategory."""
 
     __tablename__ = "risk_categories"
 
-    def __repr__(self):
-        return f"<RiskCategory(code='{self.code}')>"
-
 
 class ExpenditureIndicator(ConfigTableMixin, Base):
     """Expenditure indicator - maps to legacy tblExpInd."""
 
     __tablename__ = "expenditure_indicators"
 
-    def __repr__(self):
-        return f"<ExpenditureIndicator(code='{self.code}')>"
-
 
 # ============================================================
 # Weighted Configuration Tables
@@ -111,48 +102,53 @@ class ProbabilityLevel(Base):
     """
 
     __tablename__ = "probability_levels"
+    __repr_fields__ = ("code", "weight")
+    __table_args__ = (
+        CheckConstraint("weight >= 0", name="ck_probability_levels_weight"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    code = Column(String(50), unique=True, nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    code = Column(String(50), unique=True, nullable=False)
     description = Column(String(255), nullable=False)
-    weight = Column(Numeric(5, 2), nullable=False)
+    weight = Column(Weight, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-
-    def __repr__(self):
-        return f"<ProbabilityLevel(code='{self.code}', weight={self.weight})>"
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
 
 class SeverityLevel(Base):
     """Severity level for risk assessment - maps to legacy tblSeverityOccurrence."""
 
     __tablename__ = "severity_levels"
+    __repr_fields__ = ("code", "weight")
+    __table_args__ = (CheckConstraint("weight >= 0", name="ck_severity_levels_weight"),)
 
-    id = Column(Integer, primary_key=True, index=True)
-    code = Column(String(50), unique=True, nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    code = Column(String(50), unique=True, nullable=False)
     description = Column(String(255), nullable=False)
-    weight = Column(Numeric(5, 2), nullable=False)
+    weight = Column(Weight, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-
-    def __repr__(self):
-        return f"<SeverityLevel(code='{self.code}', weight={self.weight})>"
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
 
 class PMBWeight(Base):
     """Project Management Baseline weight - maps to legacy tblPMBWeight."""
 
     __tablename__ = "pmb_weights"
+    __repr_fields__ = ("code", "weight")
+    __table_args__ = (CheckConstraint("weight >= 0", name="ck_pmb_weights_weight"),)
 
-    id = Column(Integer, primary_key=True, index=True)
-    code = Column(String(50), unique=True, nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    code = Column(String(50), unique=True, nullable=False)
     description = Column(String(255), nullable=False)
-    weight = Column(Numeric(5, 2), nullable=False)
+    weight = Column(Weight, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-
-    def __repr__(self):
-        return f"<PMBWeight(code='{self.code}', weight={self.weight})>"
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
 
 # ============================================================
@@ -1,17 +1,33 @@
 """Import job database model for tracking MS Project file imports."""
 import enum
-from datetime import datetime
 
-from sqlalchemy import Column, DateTime
-from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    case,
+    cast,
+    text,
+)
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.models.database.mixins import TimestampMixin, detail_column
+from app.models.database.types import BigIntPK, IntEnum
 
 
 class ImportStatus(str, enum.Enum):
-    """Import job lifecycle status."""
+    """Import job lifecycle status (stored by position: append new members only)."""
 
     PENDING = "pending"
     UPLOADING = "uploading"
@@ -21,12 +37,30 @@ class ImportStatus(str, enum.Enum):
     FAILED = "failed"
 
 
-class ImportJob(Base):
+class ImportJob(TimestampMixin, Base):
     """Tracks async MS Project file import jobs."""
 
     __tablename__ = "import_jobs"
+    __repr_fields__ = ("id", "project_id", "status")
+    __table_args__ = (
+        Index(
+            "ix_import_jobs_active",
+            "project_id",
+            "created_at",
+            # pending, uploading, parsing, creating_records
+            postgresql_where=text("status IN (0, 1, 2, 3)"),
+        ),
+        CheckConstraint(
+            f"status BETWEEN 0 AND {len(ImportStatus) - 1}",
+            name="ck_import_jobs_status",
+        ),
+        CheckConstraint(
+            "rows_processed BETWEEN 0 AND rows_total", name="ck_import_jobs_rows"
+        ),
+        UniqueConstraint("celery_task_id", name="uq_import_jobs_celery"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntPK, Identity(), primary_key=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 
@@ -36,11 +70,13 @@ class ImportJob(Base):
     file_size = Column(Integer, nullable=True)
 
     # Status tracking
-    status = Column(
-        SQLEnum(ImportStatus), default=ImportStatus.PENDING, nullable=False, index=True
-    )
-    progress = Column(Float, default=0.0, nullable=False)
-    celery_task_id = Column(String(255), nullable=True, index=True)
+    # Unindexed on its own: only in-flight jobs are looked up by status,
+    # through the ix_import_jobs_active partial index
+    status = Column(IntEnum(ImportStatus), default=ImportStatus.PENDING, nullable=False)
+    # Counters advance once per import phase, not per row; progress is derived
+    rows_processed = Column(BigInteger, default=0, nullable=False)
+    rows_total = Column(BigInteger, default=0, nullable=False)
+    celery_task_id = Column(String(255), nullable=True)
 
     # Result counts
     task_count = Column(Integer, default=0)
@@ -48,22 +84,30 @@ class ImportJob(Base):
     assignment_count = Column(Integer, default=0)
 
     # Error tracking
-    error_message = Column(Text, nullable=True)
+    error_message = detail_column(Text, nullable=True)
 
     # Timestamps
-    started_at = Column(DateTime, nullable=True)
-    completed_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
-    )
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     project = relationship("Project", back_populates="import_jobs")
     user = relationship("User", foreign_keys=[user_id])
 
-    def __repr__(self):
-        return (
-            f"<ImportJob(id={self.id}, "
-            f"project_id={self.project_id}, status='{self.status}')>"
+    @hybrid_property
+    def progress(self) -> float:
+        """Percent complete, derived from the row counters."""
+        if self.status == ImportStatus.COMPLETED:
+            return 100.0
+        if not self.rows_total:
+            return 0.0
+        return 100.0 * self.rows_processed / self.rows_total
+
+    @progress.expression
+    def progress(cls):
+        done = 100.0 * cast(cls.rows_processed, Float) / cls.rows_total
+        return case(
+            (cls.status == ImportStatus.COMPLETED, 100.0),
+            (cls.rows_total > 0, done),
+            else_=0.0,
         )
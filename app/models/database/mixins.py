@@ -0,0 +1,27 @@
+"""Declarative mixins shared by the database models."""
+from sqlalchemy import Column, DateTime, func
+from sqlalchemy.orm import deferred
+
+# Deferred column group for bulky values that list and aggregate queries
+# skip. Repositories load it with ``undefer_group(DETAILS)`` (or
+# ``with_details=True``) where the response actually returns the columns.
+DETAILS = "details"
+
+
+def detail_column(*args, **kwargs):
+    """A ``Column`` left out of the default SELECT until accessed."""
+    return deferred(Column(*args, **kwargs), group=DETAILS)
+
+
+class TimestampMixin:
+    """``created_at`` / ``updated_at`` columns, both maintained by the database."""
+
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -1,17 +1,27 @@
 """Project database model."""
 import enum
-from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime
-from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.models.database.mixins import TimestampMixin
+from app.models.database.types import IntEnum
 
 
 class ProjectStatus(str, enum.Enum):
-    """Project lifecycle status."""
+    """Project lifecycle status (stored by position: append new members only)."""
 
     DRAFT = "draft"
     IMPORTING = "importing"
@@ -22,7 +32,7 @@ class ProjectStatus(str, enum.Enum):
 
 
 class ProjectSourceFormat(str, enum.Enum):
-    """Source file format."""
+    """Source file format (stored by position: append new members only)."""
 
     MPP = "mpp"
     MPX = "mpx"
@@ -30,32 +40,42 @@ class ProjectSourceFormat(str, enum.Enum):
     MANUAL = "manual"
 
 
-class Project(Base):
+class Project(TimestampMixin, Base):
     """Project model - maps to legacy tblProjects."""
 
     __tablename__ = "projects"
+    __repr_fields__ = ("id", "project_name")
+    __table_args__ = (
+        Index(
+            "ix_projects_active", "updated_at", postgresql_where=text("NOT archived")
+        ),
+        CheckConstraint(
+            f"source_format BETWEEN 0 AND {len(ProjectSourceFormat) - 1}",
+            name="ck_projects_source_format",
+        ),
+        CheckConstraint(
+            f"status BETWEEN 0 AND {len(ProjectStatus) - 1}", name="ck_projects_status"
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     project_name = Column(String(255), nullable=False, index=True)
     project_manager = Column(String(255), nullable=True)
     description = Column(Text, nullable=True)
     archived = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
-    )
 
     # Source file tracking (Phase 3)
     source_file = Column(String(500), nullable=True)
-    source_format = Column(SQLEnum(ProjectSourceFormat), nullable=True)
+    # Stored as CHECK-constrained SMALLINTs rather than native PG enum types
+    source_format = Column(IntEnum(ProjectSourceFormat), nullable=True)
     s3_key = Column(String(1000), nullable=True)
-    status = Column(SQLEnum(ProjectStatus), default=ProjectStatus.DRAFT, nullable=False)
+    status = Column(IntEnum(ProjectStatus), default=ProjectStatus.DRAFT, nullable=False)
 
     # Project schedule dates (from MS Project)
-    start_date = Column(DateTime, nullable=True)
-    finish_date = Column(DateTime, nullable=True)
-    baseline_start = Column(DateTime, nullable=True)
-    baseline_finish = Column(DateTime, nullable=True)
+    start_date = Column(DateTime(timezone=True), nullable=True)
+    finish_date = Column(DateTime(timezone=True), nullable=True)
+    baseline_start = Column(DateTime(timezone=True), nullable=True)
+    baseline_finish = Column(DateTime(timezone=True), nullable=True)
 
     # Cached counts for quick display
     task_count = Column(Integer, default=0)
@@ -67,11 +87,11 @@ class Project(Base):
     # Relationships
     owner = relationship("User", foreign_keys=[owner_id])
     wbs_items = relationship(
-        "WBS", back_populates="project", cascade="all, delete-orphan"
+        "WBS",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     import_jobs = relationship(
         "ImportJob", back_populates="project", cascade="all, delete-orphan"
     )
-
-    def __repr__(self):
-        return f"<Project(id={self.id}, name='{self.project_name}')>"
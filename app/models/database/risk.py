@@ -1,38 +1,65 @@
 """Risk database model."""
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    Column,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.models.database.mixins import TimestampMixin, detail_column
+from app.models.database.types import Cents, Weight
+
+# risk_cost (cents) times both weights (hundredths), rounded back to cents.
+# Computed on the raw integers so it needs no casts.
+EXPECTED_COST_SQL = (
+    "(COALESCE(risk_cost, 0) * COALESCE(probability_weight, 0)"
+    " * COALESCE(severity_weight, 0) + 5000) / 10000"
+)
 
 
-class Risk(Base):
+class Risk(TimestampMixin, Base):
     """Risk model - maps to legacy tblRisks."""
 
     __tablename__ = "risks"
+    __repr_fields__ = ("id", "wbs_id", "risk_cost")
+    __table_args__ = (
+        # Per-WBS exposure sums and top-N lists read only this index
+        Index("ix_risks_wbs_expected_cost", "wbs_id", "expected_cost"),
+        CheckConstraint(
+            "probability_weight >= 0 AND severity_weight >= 0", name="ck_risks_weights"
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    wbs_id = Column(Integer, ForeignKey("wbs.id"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    wbs_id = Column(BigInteger, ForeignKey("wbs.id"), nullable=False)
     risk_category_code = Column(
         String(50), ForeignKey("risk_categories.code"), nullable=True
     )
-    risk_cost = Column(Numeric(18, 2), default=0)
+    risk_cost = Column(Cents, default=0)
     probability_code = Column(
         String(50), ForeignKey("probability_levels.code"), nullable=True
     )
     severity_code = Column(
         String(50), ForeignKey("severity_levels.code"), nullable=True
     )
-    mitigation_plan = Column(Text, nullable=True)
-    date_identified = Column(DateTime, default=datetime.utcnow, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    # Weights copied from the probability/severity tables whenever the codes
+    # are written (and refreshed when a level's weight changes)
+    probability_weight = Column(Weight, nullable=True)
+    severity_weight = Column(Weight, nullable=True)
+    expected_cost = Column(Cents, Computed(EXPECTED_COST_SQL, persisted=True))
+    mitigation_plan = detail_column(Text, nullable=True)
+    date_identified = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     # Relationships
-    wbs_item = relationship("WBS", back_populates="risks")
-
-    def __repr__(self):
-        return f"<Risk(id={self.id}, wbs={self.wbs_id}, cost={self.risk_cost})>"
+    wbs_item = relationship("WBS", back_populates="risks", lazy="raise_on_sql")
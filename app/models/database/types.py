@@ -0,0 +1,97 @@
+"""Custom column types shared by the database models."""
+import enum
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Type
+
+from sqlalchemy import JSON, BigInteger, Integer, SmallInteger, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.types import TypeDecorator
+
+_ONE = Decimal(1)
+
+# 64-bit surrogate key; SQLite only autoincrements a plain INTEGER PRIMARY KEY.
+BigIntPK = BigInteger().with_variant(Integer, "sqlite")
+
+# varchar[] on PostgreSQL (GIN-indexable, queried with @>); a JSON list elsewhere.
+StringArray = ARRAY(String).with_variant(JSON(), "sqlite")
+
+
+class _Hundredths(TypeDecorator):
+    """Two-decimal ``Decimal`` stored as an integer count of hundredths.
+
+    Sums and comparisons run on integers in the database; values are
+    scaled back to two decimal places only when loaded.
+    """
+
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        amount = Decimal(str(value)) * 100
+        return int(amount.quantize(_ONE, rounding=ROUND_HALF_UP))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(int(value)).scaleb(-2)
+
+
+class Cents(_Hundredths):
+    """Money amount stored as a BIGINT count of cents, exposed as ``Decimal``."""
+
+    impl = BigInteger
+    cache_ok = True
+
+
+class BasisPoints(_Hundredths):
+    """Percentage stored as a SMALLINT count of basis points (10000 = 100%).
+
+    Replaces ``Numeric(5, 2)`` for percentages up to 327.67: two bytes
+    instead of a variable-length numeric.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+
+class Weight(_Hundredths):
+    """Weight factor stored as a SMALLINT count of hundredths (100 = 1.00).
+
+    Probability and severity weights are multiplied together in SQL, so
+    the product of two weights is scaled by 10000.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+
+class IntEnum(TypeDecorator):
+    """Python enum stored as a SMALLINT holding the member's position.
+
+    Two bytes per row and integer comparisons in WHERE clauses, with no
+    ``CREATE TYPE`` to alter when a status is added. Positions are the
+    stored values, so new members must be appended, never inserted or
+    reordered.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: Type[enum.Enum]):
+        super().__init__()
+        # Public so it becomes part of the statement cache key.
+        self.enum_cls = enum_cls
+        self._members = tuple(enum_cls)
+        self._positions = {member: i for i, member in enumerate(self._members)}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._positions[self.enum_cls(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._members[value]
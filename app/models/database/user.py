@@ -1,12 +1,12 @@
 """User database model."""
 import enum
-from datetime import datetime
 
 from sqlalchemy import Boolean, Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Integer, String
+from sqlalchemy import Index, Integer, String, text
 
 from app.core.database import Base
+from app.models.database.mixins import TimestampMixin
 
 
 class UserRole(str, enum.Enum):
@@ -18,12 +18,24 @@ class UserRole(str, enum.Enum):
     VIEWER = "viewer"
 
 
-class User(Base):
+class User(TimestampMixin, Base):
     """User model for authentication and authorization."""
 
     __tablename__ = "users"
+    __repr_fields__ = ("id", "username", "email", "role")
+    __table_args__ = (
+        # Active-user listings page through this small partial index; the
+        # full unique indexes on email/username stay, since logins must
+        # find deactivated accounts to reject them.
+        Index(
+            "ix_users_active_id",
+            "id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
     username = Column(String(100), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
@@ -31,14 +43,4 @@ class User(Base):
     role = Column(SQLEnum(UserRole), default=UserRole.USER, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     is_verified = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
-    )
-    last_login = Column(DateTime, nullable=True)
-
-    def __repr__(self):
-        return (
-            f"<User(id={self.id}, username='{self.username}', "
-            f"email='{self.email}', role='{self.role}')>"
-        )
+    last_login = Column(DateTime(timezone=True), nullable=True)
@@ -1,23 +1,27 @@
 """Work Breakdown Structure database model."""
-from datetime import datetime
-
 from sqlalchemy import (
+    BigInteger,
     Boolean,
+    CheckConstraint,
     Column,
     DateTime,
     Float,
     ForeignKey,
+    Identity,
+    Index,
     Integer,
-    Numeric,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.models.database.mixins import TimestampMixin
+from app.models.database.types import BigIntPK, Cents, StringArray
 
 
-class WBS(Base):
+class WBS(TimestampMixin, Base):
     """WBS model - maps to legacy tblWBS.
 
     Enhanced in Phase 3 with hierarchy support, duration, progress,
@@ -25,26 +29,60 @@ class WBS(Base):
     """
 
     __tablename__ = "wbs"
+    __repr_fields__ = ("id", "wbs_code", "wbs_title")
+    __table_args__ = (
+        Index("ix_wbs_project_parent", "project_id", "parent_id"),
+        # Tree listings read only these columns, so INCLUDE them for
+        # index-only scans.
+        Index(
+            "ix_wbs_project_outline",
+            "project_id",
+            "outline_level",
+            postgresql_include=["wbs_code", "wbs_title", "percent_complete"],
+        ),
+        # Subtree lookups are prefix LIKEs on the materialized path
+        Index(
+            "ix_wbs_path",
+            "wbs_path",
+            postgresql_ops={"wbs_path": "text_pattern_ops"},
+        ),
+        # "Which tasks use resource X" is array containment
+        Index("ix_wbs_resource_names", "resource_names", postgresql_using="gin"),
+        Index(
+            "uq_wbs_project_task_uid",
+            "project_id",
+            "task_unique_id",
+            unique=True,
+            postgresql_where=text("task_unique_id IS NOT NULL"),
+            sqlite_where=text("task_unique_id IS NOT NULL"),
+        ),
+        CheckConstraint(
+            "percent_complete BETWEEN 0 AND 100", name="ck_wbs_percent_complete"
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
-    task_unique_id = Column(Integer, nullable=True, index=True)
+    id = Column(BigIntPK, Identity(), primary_key=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    task_unique_id = Column(Integer, nullable=True)
     wbs_code = Column(String(100), nullable=True)
     wbs_title = Column(String(500), nullable=False)
 
     # Hierarchy (Phase 3)
     outline_level = Column(Integer, default=0, nullable=False)
-    parent_id = Column(Integer, ForeignKey("wbs.id"), nullable=True, index=True)
+    parent_id = Column(BigInteger, ForeignKey("wbs.id"), nullable=True, index=True)
+    # Materialized ancestor path, e.g. "/1/17/93/"; see
+    # WBSRepository.rebuild_paths()
+    wbs_path = Column(Text, nullable=True)
 
     # Schedule dates
-    schedule_start = Column(DateTime, nullable=True)
-    schedule_finish = Column(DateTime, nullable=True)
-    baseline_start = Column(DateTime, nullable=True)
-    baseline_finish = Column(DateTime, nullable=True)
-    late_start = Column(DateTime, nullable=True)
-    late_finish = Column(DateTime, nullable=True)
-    actual_start = Column(DateTime, nullable=True)
-    actual_finish = Column(DateTime, nullable=True)
+    schedule_start = Column(DateTime(timezone=True), nullable=True)
+    schedule_finish = Column(DateTime(timezone=True), nullable=True)
+    baseline_start = Column(DateTime(timezone=True), nullable=True)
+    baseline_finish = Column(DateTime(timezone=True), nullable=True)
+    late_start = Column(DateTime(timezone=True), nullable=True)
+    late_finish = Column(DateTime(timezone=True), nullable=True)
+    actual_start = Column(DateTime(timezone=True), nullable=True)
+    actual_finish = Column(DateTime(timezone=True), nullable=True)
 
     # Duration (Phase 3)
     duration = Column(Float, nullable=True)
@@ -54,35 +92,34 @@ class WBS(Base):
     percent_complete = Column(Float, default=0.0)
 
     # Cost
-    cost = Column(Numeric(18, 2), default=0)
-    baseline_cost = Column(Numeric(18, 2), default=0)
+    cost = Column(Cents, default=0)
+    baseline_cost = Column(Cents, default=0)
 
     # Task classification flags (Phase 3)
     is_milestone = Column(Boolean, default=False, nullable=False)
     is_summary = Column(Boolean, default=False, nullable=False)
     is_critical = Column(Boolean, default=False, nullable=False)
 
-    # Display cache (Phase 3)
-    resource_names = Column(String(1000), nullable=True)
+    # Names of the resources assigned in MS Project (Phase 3)
+    resource_names = Column(StringArray, nullable=True)
     notes = Column(Text, nullable=True)
 
     # Estimation fields (legacy)
     requirements = Column(Text, nullable=True)
     assumptions = Column(Text, nullable=True)
     approver = Column(String(255), nullable=True)
-    approver_date = Column(DateTime, nullable=True)
+    approver_date = Column(DateTime(timezone=True), nullable=True)
     estimate_revision = Column(Integer, default=0)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
-    )
-
     # Relationships
     project = relationship("Project", back_populates="wbs_items")
     parent = relationship("WBS", remote_side=[id], back_populates="children")
+    # Filled in bulk by WBSRepository.get_tree(); never loaded per item
     children = relationship(
-        "WBS", back_populates="parent", cascade="all, delete-orphan"
+        "WBS",
+        back_populates="parent",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     assignments = relationship(
         "ResourceAssignment", back_populates="wbs_item", cascade="all, delete-orphan"
@@ -90,6 +127,3 @@ class WBS(Base):
     risks = relationship(
         "Risk", back_populates="wbs_item", cascade="all, delete-orphan"
     )
-
-    def __repr__(self):
-        return f"<WBS(id={self.id}, code='{self.wbs_code}', title='{self.wbs_title}')>"
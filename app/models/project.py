@@ -0,0 +1,10 @@
+"""
+Legacy import path for the project model.
+
+The canonical definitions live in ``app.models.database``; this module only
+re-exports them so the table is mapped exactly once.
+"""
+from app.core.database import Base
+from app.models.database.project import Project, ProjectSourceFormat, ProjectStatus
+
+__all__ = ["Base", "Project", "ProjectSourceFormat", "ProjectStatus"]
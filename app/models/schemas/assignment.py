@@ -65,7 +65,7 @@ class AssignmentResponse(AssignmentBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 class AssignmentListResponse(BaseModel):
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, AliasPath, BaseModel, Field, TypeAdapter
 
 
 class AuditLogBase(BaseModel):
@@ -28,10 +28,13 @@ class AuditLogResponse(AuditLogBase):
 
     id: int
     user_id: Optional[int] = None
-    username: Optional[str] = None  # Populated from relationship
+    # Read from the eager-loaded ``user`` relationship when validating ORM rows
+    username: Optional[str] = Field(
+        None, validation_alias=AliasChoices("username", AliasPath("user", "username"))
+    )
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 class AuditLogListResponse(BaseModel):
@@ -43,6 +46,10 @@ class AuditLogListResponse(BaseModel):
     limit: int
 
 
+# Built once: validates a whole page of ORM rows in a single native call
+AUDIT_LOG_LIST_ADAPTER = TypeAdapter(list[AuditLogResponse])
+
+
 class AuditLogFilter(BaseModel):
     """Filter parameters for audit log queries."""
 
@@ -52,3 +59,4 @@ class AuditLogFilter(BaseModel):
     entity_id: Optional[int] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
+    new_values_contains: Optional[dict[str, Any]] = None
@@ -1,9 +1,11 @@
 """Configuration table schemas for generic CRUD operations."""
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Type
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 # ============================================================
 # Standard Config Item Schemas (code + description)
@@ -52,7 +54,7 @@ class ConfigItemResponse(ConfigItemBase):
     is_active: bool
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 class ConfigItemListResponse(BaseModel):
@@ -62,6 +64,10 @@ class ConfigItemListResponse(BaseModel):
     total: int
 
 
+# Built once: renders a validated listing straight to JSON bytes
+CONFIG_ITEM_LIST_ADAPTER = TypeAdapter(ConfigItemListResponse)
+
+
 # ============================================================
 # Weighted Config Item Schemas (code + description + weight)
 # ============================================================
@@ -111,7 +117,7 @@ class WeightedConfigItemResponse(WeightedConfigItemBase):
     is_active: bool
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 class WeightedConfigItemListResponse(BaseModel):
@@ -125,55 +131,58 @@ class WeightedConfigItemListResponse(BaseModel):
 # Config Table Metadata
 # ============================================================
 
-CONFIG_TABLE_INFO = {
-    "cost-types": {
-        "name": "Cost Types",
-        "description": "Cost type classifications for resource assignments",
-        "weighted": False,
-    },
-    "expense-types": {
-        "name": "Expense Types",
-        "description": "Expense type classifications",
-        "weighted": False,
-    },
-    "regions": {
-        "name": "Regions",
-        "description": "Geographic regions for projects and resources",
-        "weighted": False,
-    },
-    "business-areas": {
-        "name": "Business Areas",
-        "description": "Business area classifications",
-        "weighted": False,
-    },
-    "estimating-techniques": {
-        "name": "Estimating Techniques",
-        "description": "Estimation methodology classifications",
-        "weighted": False,
-    },
-    "risk-categories": {
-        "name": "Risk Categories",
-        "description": "Risk classification categories",
-        "weighted": False,
-    },
-    "expenditure-indicators": {
-        "name": "Expenditure Indicators",
-        "description": "Expenditure indicator classifications",
-        "weighted": False,
-    },
-    "probability-levels": {
-        "name": "Probability Levels",
-        "description": "Risk probability levels with weights",
-        "weighted": True,
-    },
-    "severity-levels": {
-        "name": "Severity Levels",
-        "description": "Risk severity levels with weights",
-        "weighted": True,
-    },
-    "pmb-weights": {
-        "name": "PMB Weights",
-        "description": "Project Management Baseline weights",
-        "weighted": True,
-    },
-}
+
+@dataclass(frozen=True, slots=True)
+class ConfigTableSpec:
+    """Static metadata and response schema for one generic config table."""
+
+    name: str
+    description: str
+    weighted: bool = False
+    response_schema: Type[BaseModel] = ConfigItemResponse
+
+
+def _weighted(name: str, description: str) -> ConfigTableSpec:
+    return ConfigTableSpec(name, description, True, WeightedConfigItemResponse)
+
+
+# Read-only dispatch table: one lookup yields everything a generic config
+# request needs, including the schema to validate responses with.
+CONFIG_TABLE_INFO: Mapping[str, ConfigTableSpec] = MappingProxyType(
+    {
+        "cost-types": ConfigTableSpec(
+            "Cost Types", "Cost type classifications for resource assignments"
+        ),
+        "expense-types": ConfigTableSpec(
+            "Expense Types", "Expense type classifications"
+        ),
+        "regions": ConfigTableSpec(
+            "Regions", "Geographic regions for projects and resources"
+        ),
+        "business-areas": ConfigTableSpec(
+            "Business Areas", "Business area classifications"
+        ),
+        "estimating-techniques": ConfigTableSpec(
+            "Estimating Techniques", "Estimation methodology classifications"
+        ),
+        "risk-categories": ConfigTableSpec(
+            "Risk Categories", "Risk classification categories"
+        ),
+        "expenditure-indicators": ConfigTableSpec(
+            "Expenditure Indicators", "Expenditure indicator classifications"
+        ),
+        "probability-levels": _weighted(
+            "Probability Levels", "Risk probability levels with weights"
+        ),
+        "severity-levels": _weighted(
+            "Severity Levels", "Risk severity levels with weights"
+        ),
+        "pmb-weights": _weighted("PMB Weights", "Project Management Baseline weights"),
+    }
+)
+
+# Body of GET /admin/config, built once
+CONFIG_TABLE_LISTING = tuple(
+    {"name": spec.name, "description": spec.description, "weighted": spec.weighted}
+    for spec in CONFIG_TABLE_INFO.values()
+)
@@ -1,8 +1,8 @@
 """Estimation and approval workflow schemas."""
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
 class WBSCostSummary(BaseModel):
@@ -31,6 +31,8 @@ class WBSCostSummary(BaseModel):
     # Approval status
     approval_status: str = "draft"
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class CostBreakdownItem(BaseModel):
     """Single item in a cost breakdown (by cost type, region, etc.)."""
@@ -40,6 +42,8 @@ class CostBreakdownItem(BaseModel):
     total_pert: float = 0.0
     assignment_count: int = 0
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class SupplierBreakdownItem(BaseModel):
     """Single item in supplier breakdown."""
@@ -49,6 +53,8 @@ class SupplierBreakdownItem(BaseModel):
     total_pert: float = 0.0
     assignment_count: int = 0
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class ProjectEstimationSummary(BaseModel):
     """Full project estimation summary with breakdowns."""
@@ -84,7 +90,7 @@ class ProjectEstimationSummary(BaseModel):
 class ApprovalAction(BaseModel):
     """Schema for approval workflow actions."""
 
-    action: str = Field(..., pattern="^(submit|approve|reject|reset)$")
+    action: Literal["submit", "approve", "reject", "reset"]
     comment: Optional[str] = None
 
 
@@ -97,4 +103,4 @@ class WBSApprovalResponse(BaseModel):
     approver_date: Optional[datetime] = None
     estimate_revision: int = 0
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
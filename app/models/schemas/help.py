@@ -14,7 +14,7 @@ class HelpDescriptionResponse(BaseModel):
     detailed_text: str
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 # --- HelpCategory schemas ---
@@ -41,7 +41,7 @@ class HelpCategoryResponse(HelpCategoryBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 # --- HelpTopic schemas ---
@@ -73,7 +73,7 @@ class HelpTopicResponse(HelpTopicBase):
     updated_at: datetime
     descriptions: List[HelpDescriptionResponse] = []
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 class HelpTopicListResponse(BaseModel):
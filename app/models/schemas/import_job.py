@@ -14,6 +14,8 @@ class ImportJobResponse(BaseModel):
     file_size: Optional[int] = None
     status: str
     progress: float
+    rows_processed: int = 0
+    rows_total: int = 0
     celery_task_id: Optional[str] = None
     task_count: int = 0
     resource_count: int = 0
@@ -24,7 +26,7 @@ class ImportJobResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 class ImportJobListResponse(BaseModel):
@@ -59,7 +59,7 @@ class ResourceResponse(ResourceBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 class ResourceListResponse(BaseModel):
@@ -127,7 +127,7 @@ class SupplierResponse(SupplierBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 class SupplierListResponse(BaseModel):
@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter
 
 
 class RiskBase(BaseModel):
@@ -39,14 +39,16 @@ class RiskResponse(RiskBase):
     wbs_id: int
     date_identified: datetime
 
-    # Computed field: risk_cost * probability_weight * severity_weight
-    # This is computed in the service layer, not a model property
-    risk_exposure: Optional[float] = None
+    # risk_cost * probability_weight * severity_weight, read from the
+    # database-generated expected_cost column of ORM rows
+    risk_exposure: Optional[float] = Field(
+        None, validation_alias=AliasChoices("risk_exposure", "expected_cost")
+    )
 
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 class RiskListResponse(BaseModel):
@@ -54,3 +56,7 @@ class RiskListResponse(BaseModel):
 
     items: list[RiskResponse]
     total: int
+
+
+# Built once: validates a whole list of ORM rows in a single native call
+RISK_LIST_ADAPTER = TypeAdapter(list[RiskResponse])
@@ -41,13 +41,13 @@ class WBSResponse(BaseModel):
     is_critical: bool = False
 
     # Display
-    resource_names: Optional[str] = None
+    resource_names: Optional[list[str]] = None
     notes: Optional[str] = None
 
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 class WBSTreeNode(WBSResponse):
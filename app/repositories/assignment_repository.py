@@ -1,7 +1,7 @@
 """Resource Assignment repository."""
 from typing import List
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, literal, null, select, tuple_, union_all
 from sqlalchemy.orm import Session
 
 from app.models.database.assignment import ResourceAssignment
@@ -9,6 +9,39 @@ from app.models.database.wbs import WBS
 from app.repositories.base import BaseRepository
 
 
+# What the estimation rollups read per assignment. PERT and sigma come
+# back as database-computed floats, so no per-row Decimal arithmetic runs
+# in Python however often a rollup reads them.
+ESTIMATE_COLUMNS = (
+    ResourceAssignment.wbs_id,
+    ResourceAssignment.resource_code,
+    ResourceAssignment.supplier_code,
+    ResourceAssignment.cost_type_code,
+    ResourceAssignment.region_code,
+    ResourceAssignment.pert_estimate.label("pert_estimate"),
+    ResourceAssignment.std_deviation.label("std_deviation"),
+)
+
+
+# Columns the project rollup groups by, one grouping set each. A row's
+# ``grouping_id`` is the SQL GROUPING() bitmask over these columns (first
+# column = highest bit), so it names the set the row belongs to.
+ROLLUP_COLUMNS = (
+    "wbs_id",
+    "cost_type_code",
+    "region_code",
+    "resource_code",
+    "supplier_code",
+)
+ROLLUP_TOTAL = (1 << len(ROLLUP_COLUMNS)) - 1
+
+
+def rollup_grouping_id(column: str) -> int:
+    """``grouping_id`` of the rows grouped by ``column`` alone."""
+    position = ROLLUP_COLUMNS.index(column)
+    return ROLLUP_TOTAL & ~(1 << (len(ROLLUP_COLUMNS) - 1 - position))
+
+
 class AssignmentRepository(BaseRepository[ResourceAssignment]):
     """Repository for ResourceAssignment operations."""
 
@@ -24,6 +57,11 @@ class AssignmentRepository(BaseRepository[ResourceAssignment]):
         )
         return list(self.db.scalars(stmt).all())
 
+    def get_estimates_by_wbs(self, wbs_id: int) -> List[Row]:
+        """Get ``ESTIMATE_COLUMNS`` rows for a WBS item's assignments."""
+        stmt = select(*ESTIMATE_COLUMNS).where(ResourceAssignment.wbs_id == wbs_id)
+        return list(self.db.execute(stmt).all())
+
     def count_by_wbs(self, wbs_id: int) -> int:
         """Count assignments for a WBS item."""
         stmt = (
@@ -43,6 +81,15 @@ class AssignmentRepository(BaseRepository[ResourceAssignment]):
         )
         return list(self.db.scalars(stmt).all())
 
+    def get_estimates_by_project(self, project_id: int) -> List[Row]:
+        """Get ``ESTIMATE_COLUMNS`` rows for every assignment of a project."""
+        stmt = (
+            select(*ESTIMATE_COLUMNS)
+            .join(WBS, ResourceAssignment.wbs_id == WBS.id)
+            .where(WBS.project_id == project_id)
+        )
+        return list(self.db.execute(stmt).all())
+
     def count_by_project(self, project_id: int) -> int:
         """Count assignments for a project."""
         stmt = (
@@ -61,20 +108,72 @@ class AssignmentRepository(BaseRepository[ResourceAssignment]):
         - total_variance: Sum of ((worst - best) / 6)^2
         - count: Number of assignments
         """
-        assignments = self.get_by_wbs(wbs_id)
-        total_pert = 0.0
-        total_variance = 0.0
-
-        for a in assignments:
-            total_pert += a.pert_estimate
-            total_variance += a.std_deviation**2
+        std = ResourceAssignment.std_deviation
+        stmt = select(
+            func.coalesce(func.sum(ResourceAssignment.pert_estimate), 0.0),
+            func.coalesce(func.sum(std * std), 0.0),
+            func.count(),
+        ).where(ResourceAssignment.wbs_id == wbs_id)
+        total_pert, total_variance, count = self.db.execute(stmt).one()
 
         return {
-            "total_pert": total_pert,
-            "total_variance": total_variance,
-            "count": len(assignments),
+            "total_pert": float(total_pert),
+            "total_variance": float(total_variance),
+            "count": count,
         }
 
+    def get_estimate_rollup(self, project_id: int) -> List[Row]:
+        """
+        PERT totals for a project per ``ROLLUP_COLUMNS`` value, in one query.
+
+        Returns rows of ``(*ROLLUP_COLUMNS, grouping_id, total_pert,
+        total_variance, count)``: one per distinct value of each rollup
+        column (the other columns NULL) plus a grand-total row whose
+        ``grouping_id`` is ``ROLLUP_TOTAL``. PostgreSQL computes every
+        set in a single pass with ``GROUPING SETS``; other databases get
+        the equivalent ``UNION ALL`` of per-column ``GROUP BY`` queries.
+        """
+        columns = [getattr(ResourceAssignment, name) for name in ROLLUP_COLUMNS]
+        std = ResourceAssignment.std_deviation
+        measures = (
+            func.coalesce(func.sum(ResourceAssignment.pert_estimate), 0.0).label(
+                "total_pert"
+            ),
+            func.coalesce(func.sum(std * std), 0.0).label("total_variance"),
+            func.count().label("count"),
+        )
+
+        def grouped(*selected):
+            return (
+                select(*selected, *measures)
+                .join(WBS, ResourceAssignment.wbs_id == WBS.id)
+                .where(WBS.project_id == project_id)
+            )
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            stmt = grouped(
+                *columns, func.grouping(*columns).label("grouping_id")
+            ).group_by(func.grouping_sets(*columns, tuple_()))
+        else:
+            parts = [
+                grouped(
+                    *(
+                        other if other is column else null().label(other.key)
+                        for other in columns
+                    ),
+                    literal(rollup_grouping_id(column.key)).label("grouping_id"),
+                ).group_by(column)
+                for column in columns
+            ]
+            parts.append(
+                grouped(
+                    *(null().label(column.key) for column in columns),
+                    literal(ROLLUP_TOTAL).label("grouping_id"),
+                )
+            )
+            stmt = union_all(*parts)
+        return list(self.db.execute(stmt).all())
+
     def get_summary_by_field(self, project_id: int, group_field: str) -> List[dict]:
         """Group assignment PERT totals by a code field.
 
@@ -3,12 +3,18 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import and_, func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
 from app.models.database.audit_log import AuditLog
+from app.models.database.mixins import DETAILS
 from app.repositories.base import BaseRepository
 
 
+def _contains(column, document: dict):
+    """JSONB containment test, ``column @> document``."""
+    return column.op("@>", is_comparison=True)(document)
+
+
 class AuditRepository(BaseRepository[AuditLog]):
     """Repository for AuditLog operations."""
 
@@ -55,8 +61,15 @@ class AuditRepository(BaseRepository[AuditLog]):
         end_date: Optional[datetime] = None,
         skip: int = 0,
         limit: int = 100,
+        with_details: bool = False,
+        new_values_contains: Optional[dict] = None,
     ) -> List[AuditLog]:
-        """Get audit logs with multiple filters."""
+        """Get audit logs with multiple filters.
+
+        The value diffs and user agent are deferred unless ``with_details``
+        is set. ``new_values_contains`` keeps entries whose new values
+        contain that JSON object (JSONB ``@>``, served by the GIN index).
+        """
         conditions = []
 
         if user_id is not None:
@@ -71,10 +84,14 @@ class AuditRepository(BaseRepository[AuditLog]):
             conditions.append(AuditLog.created_at >= start_date)
         if end_date is not None:
             conditions.append(AuditLog.created_at <= end_date)
+        if new_values_contains is not None:
+            conditions.append(_contains(AuditLog.new_values, new_values_contains))
 
         stmt = select(AuditLog)
         if conditions:
             stmt = stmt.where(and_(*conditions))
+        if with_details:
+            stmt = stmt.options(undefer_group(DETAILS))
         stmt = stmt.order_by(AuditLog.created_at.desc()).offset(skip).limit(limit)
 
         return list(self.db.scalars(stmt).all())
@@ -87,6 +104,7 @@ class AuditRepository(BaseRepository[AuditLog]):
         entity_id: Optional[int] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        new_values_contains: Optional[dict] = None,
     ) -> int:
         """Count audit logs with multiple filters."""
         conditions = []
@@ -103,6 +121,8 @@ class AuditRepository(BaseRepository[AuditLog]):
             conditions.append(AuditLog.created_at >= start_date)
         if end_date is not None:
             conditions.append(AuditLog.created_at <= end_date)
+        if new_values_contains is not None:
+            conditions.append(_contains(AuditLog.new_values, new_values_contains))
 
         stmt = select(func.count()).select_from(AuditLog)
         if conditions:
@@ -2,9 +2,10 @@
 from typing import Generic, List, Optional, Type, TypeVar
 
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
 from app.core.database import Base
+from app.models.database.mixins import DETAILS
 
 ModelType = TypeVar("ModelType", bound=Base)
 
@@ -16,9 +17,10 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
 
-    def get(self, id: int) -> Optional[ModelType]:
-        """Get a single record by ID."""
-        return self.db.get(self.model, id)
+    def get(self, id: int, with_details: bool = False) -> Optional[ModelType]:
+        """Get a single record by ID, optionally with its deferred detail columns."""
+        options = [undefer_group(DETAILS)] if with_details else None
+        return self.db.get(self.model, id, options=options)
 
     def get_multi(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
         """Get multiple records with pagination."""
@@ -2,7 +2,7 @@
 from typing import List, Optional
 
 from sqlalchemy import func, or_, select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.models.database.help import HelpCategory, HelpTopic
 from app.repositories.base import BaseRepository
@@ -39,17 +39,22 @@ class HelpTopicRepository(BaseRepository[HelpTopic]):
         )
         return self.db.scalars(stmt).first()
 
+    def load_descriptions(self, topic: HelpTopic) -> HelpTopic:
+        """Load ``topic.descriptions``, which never lazy-loads on access."""
+        self.db.refresh(topic, ["descriptions"])
+        return topic
+
     def get_active(self, skip: int = 0, limit: int = 100) -> List[HelpTopic]:
         """Get active topics with descriptions, ordered by display_order."""
         stmt = (
             select(HelpTopic)
-            .options(joinedload(HelpTopic.descriptions))
+            .options(selectinload(HelpTopic.descriptions))
             .where(HelpTopic.is_active.is_(True))
             .order_by(HelpTopic.display_order)
             .offset(skip)
             .limit(limit)
         )
-        return list(self.db.scalars(stmt).unique().all())
+        return list(self.db.scalars(stmt).all())
 
     def count_active(self) -> int:
         """Count active topics."""
@@ -66,7 +71,7 @@ class HelpTopicRepository(BaseRepository[HelpTopic]):
         """Get active topics for a specific category."""
         stmt = (
             select(HelpTopic)
-            .options(joinedload(HelpTopic.descriptions))
+            .options(selectinload(HelpTopic.descriptions))
             .where(
                 HelpTopic.category_id == category_id,
                 HelpTopic.is_active.is_(True),
@@ -75,7 +80,7 @@ class HelpTopicRepository(BaseRepository[HelpTopic]):
             .offset(skip)
             .limit(limit)
         )
-        return list(self.db.scalars(stmt).unique().all())
+        return list(self.db.scalars(stmt).all())
 
     def count_by_category(self, category_id: int) -> int:
         """Count active topics in a category."""
@@ -93,6 +98,7 @@ class HelpTopicRepository(BaseRepository[HelpTopic]):
         """Full-text search on title and content."""
         stmt = (
             select(HelpTopic)
+            .options(selectinload(HelpTopic.descriptions))
             .where(
                 HelpTopic.is_active.is_(True),
                 or_(
@@ -2,9 +2,10 @@
 from typing import List, Optional
 
 from sqlalchemy import desc, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
 from app.models.database.import_job import ImportJob
+from app.models.database.mixins import DETAILS
 from app.repositories.base import BaseRepository
 
 
@@ -15,9 +16,10 @@ class ImportJobRepository(BaseRepository[ImportJob]):
         super().__init__(ImportJob, db)
 
     def get_by_project(self, project_id: int) -> List[ImportJob]:
-        """Get all import jobs for a project, newest first."""
+        """Get all import jobs for a project, newest first, with error messages."""
         stmt = (
             select(ImportJob)
+            .options(undefer_group(DETAILS))
             .where(ImportJob.project_id == project_id)
             .order_by(desc(ImportJob.created_at))
         )
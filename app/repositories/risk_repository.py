@@ -2,8 +2,9 @@
 from typing import List
 
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
+from app.models.database.mixins import DETAILS
 from app.models.database.risk import Risk
 from app.models.database.wbs import WBS
 from app.repositories.base import BaseRepository
@@ -15,13 +16,19 @@ class RiskRepository(BaseRepository[Risk]):
     def __init__(self, db: Session):
         super().__init__(Risk, db)
 
-    def get_by_wbs(self, wbs_id: int) -> List[Risk]:
-        """Get all risks for a WBS item."""
+    def get_by_wbs(self, wbs_id: int, with_details: bool = False) -> List[Risk]:
+        """Get all risks for a WBS item.
+
+        ``mitigation_plan`` is deferred unless ``with_details`` is set, so
+        exposure sums do not pull the free-text plans.
+        """
         stmt = (
             select(Risk)
             .where(Risk.wbs_id == wbs_id)
             .order_by(Risk.date_identified.desc())
         )
+        if with_details:
+            stmt = stmt.options(undefer_group(DETAILS))
         return list(self.db.scalars(stmt).all())
 
     def count_by_wbs(self, wbs_id: int) -> int:
@@ -54,6 +61,11 @@ class RiskRepository(BaseRepository[Risk]):
         stmt = select(func.sum(Risk.risk_cost)).where(Risk.wbs_id == wbs_id)
         return float(self.db.scalar(stmt) or 0)
 
+    def get_total_exposure_by_wbs(self, wbs_id: int) -> float:
+        """Get sum of expected_cost for a WBS item (index-only on PostgreSQL)."""
+        stmt = select(func.sum(Risk.expected_cost)).where(Risk.wbs_id == wbs_id)
+        return float(self.db.scalar(stmt) or 0)
+
     def get_total_cost_by_project(self, project_id: int) -> float:
         """Get sum of risk_cost for a project."""
         stmt = (
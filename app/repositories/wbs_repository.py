@@ -1,13 +1,44 @@
 """WBS repository."""
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import CTE, Text, cast, delete, func, literal, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.database.wbs import WBS
 from app.repositories.base import BaseRepository
 
 
+PATH_SEP = "/"
+
+
+def wbs_tree_cte(*anchor_criteria) -> CTE:
+    """
+    ``WITH RECURSIVE`` walk down the WBS hierarchy.
+
+    Starts from the rows matching ``anchor_criteria`` and yields ``(id,
+    path)`` for them and every descendant, where ``path`` is the
+    ``/``-delimited chain of ids from the anchor down. Used to
+    (re)materialize ``wbs_path`` and usable directly wherever the stored
+    paths cannot be trusted.
+    """
+    wbs = WBS.__table__
+    tree = (
+        select(
+            wbs.c.id,
+            (literal(PATH_SEP) + cast(wbs.c.id, Text) + PATH_SEP).label("path"),
+        )
+        .where(*anchor_criteria)
+        .cte("wbs_tree", recursive=True)
+    )
+    child = wbs.alias("child")
+    return tree.union_all(
+        select(
+            child.c.id, tree.c.path + cast(child.c.id, Text) + PATH_SEP
+        ).where(child.c.parent_id == tree.c.id)
+    )
+
+
 class WBSRepository(BaseRepository[WBS]):
     """Repository for WBS operations with hierarchy support."""
 
@@ -27,6 +58,21 @@ class WBSRepository(BaseRepository[WBS]):
         )
         return list(self.db.scalars(stmt).all())
 
+    def iter_by_project(self, project_id: int, batch_size: int = 1000) -> Iterator[WBS]:
+        """
+        Yield every WBS item of a project in outline order.
+
+        Rows come off a server-side cursor ``batch_size`` at a time, so
+        only one batch is held in memory however large the project is.
+        """
+        stmt = (
+            select(WBS)
+            .where(WBS.project_id == project_id)
+            .order_by(WBS.outline_level, WBS.id)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.db.scalars(stmt)
+
     def count_by_project(self, project_id: int) -> int:
         """Count WBS items for a project."""
         stmt = select(func.count()).select_from(WBS).where(WBS.project_id == project_id)
@@ -46,6 +92,78 @@ class WBSRepository(BaseRepository[WBS]):
         stmt = select(WBS).where(WBS.parent_id == parent_id).order_by(WBS.id)
         return list(self.db.scalars(stmt).all())
 
+    def get_tree(self, project_id: int, limit: int = 10000) -> List[WBS]:
+        """
+        Load a project's WBS hierarchy with one query and return the roots.
+
+        Every item's ``children`` collection is filled from the flat result
+        as already-loaded state, so walking the tree (e.g. serializing it)
+        issues no further SQL however deep it goes.
+        """
+        items = self.get_by_project(project_id, skip=0, limit=limit)
+        children = {item.id: [] for item in items}
+        roots = []
+        for item in items:
+            if item.parent_id in children:
+                children[item.parent_id].append(item)
+            else:
+                roots.append(item)
+        for item in items:
+            set_committed_value(item, "children", children[item.id])
+        return roots
+
+    def get_subtree(self, root: WBS) -> List[WBS]:
+        """
+        Get ``root`` and all its descendants with one path range scan.
+
+        Rows whose path has not been materialized yet (``wbs_path`` is
+        NULL until ``rebuild_paths`` runs) are walked with the recursive
+        CTE instead.
+        """
+        if root.wbs_path is None:
+            tree = wbs_tree_cte(WBS.id == root.id)
+            stmt = select(WBS).join(tree, WBS.id == tree.c.id).order_by(tree.c.path)
+            return list(self.db.scalars(stmt).all())
+        stmt = (
+            select(WBS)
+            .where(
+                WBS.project_id == root.project_id,
+                WBS.wbs_path.startswith(root.wbs_path),
+            )
+            .order_by(WBS.wbs_path)
+        )
+        return list(self.db.scalars(stmt).all())
+
+    def get_by_resource_name(self, project_id: int, name: str) -> List[WBS]:
+        """Get the WBS items of a project that list ``name`` as a resource."""
+        stmt = (
+            select(WBS)
+            .where(
+                WBS.project_id == project_id,
+                WBS.resource_names.contains([name]),
+            )
+            .order_by(WBS.id)
+        )
+        return list(self.db.scalars(stmt).all())
+
+    def rebuild_paths(self, project_id: int) -> None:
+        """
+        Recompute ``wbs_path`` for every item of a project in one UPDATE.
+
+        Must run after any change to ``parent_id``; callers commit.
+        """
+        tree = wbs_tree_cte(WBS.project_id == project_id, WBS.parent_id.is_(None))
+        self.db.execute(
+            update(WBS)
+            .where(WBS.project_id == project_id)
+            .values(
+                wbs_path=select(tree.c.path)
+                .where(tree.c.id == WBS.id)
+                .scalar_subquery()
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     def get_by_unique_id(self, project_id: int, task_unique_id: int) -> Optional[WBS]:
         """Get a WBS item by its MS Project unique ID within a project."""
         stmt = select(WBS).where(
@@ -66,6 +184,9 @@ class WBSRepository(BaseRepository[WBS]):
         """Create multiple WBS items in a single transaction."""
         db_items = [WBS(**data) for data in items]
         self.db.add_all(db_items)
+        self.db.flush()
+        for project_id in {item.project_id for item in db_items}:
+            self.rebuild_paths(project_id)
         self.db.commit()
         for item in db_items:
             self.db.refresh(item)
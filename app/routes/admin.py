@@ -2,21 +2,21 @@
 
 All admin routes require authentication and appropriate role permissions.
 """
+import json
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.security import get_current_user, require_any_role
-from app.models.schemas.audit_log import AuditLogListResponse, AuditLogResponse
-from app.models.schemas.config import (
-    CONFIG_TABLE_INFO,
-    ConfigItemListResponse,
-    ConfigItemResponse,
-    WeightedConfigItemResponse,
+from app.models.schemas.audit_log import (
+    AUDIT_LOG_LIST_ADAPTER,
+    AuditLogListResponse,
+    AuditLogResponse,
 )
+from app.models.schemas.config import CONFIG_TABLE_LISTING, ConfigItemListResponse
 from app.models.schemas.resource import (
     ResourceCreate,
     ResourceListResponse,
@@ -35,7 +35,7 @@ from app.models.schemas.user import (
     UserUpdate,
 )
 from app.services.audit_service import AuditService, serialize_for_audit
-from app.services.config_service import get_config_service, is_weighted_table
+from app.services.config_service import get_config_service
 from app.services.resource_service import ResourceService
 from app.services.supplier_service import SupplierService
 from app.services.user_service import UserService
@@ -86,7 +86,7 @@ async def create_user(
 ):
     """Create a new user."""
     service = UserService(db)
-    user = service.create(user_in)
+    user = await service.create(user_in)
 
     audit = AuditService(db)
     audit.log_create(
@@ -126,7 +126,7 @@ async def update_password(
 ):
     """Change user password."""
     service = UserService(db)
-    service.update_password(user_id, password_in)
+    await service.update_password(user_id, password_in)
 
     audit = AuditService(db)
     audit.log_password_change(user_id, request)
@@ -356,7 +356,7 @@ async def delete_supplier(
 @router.get("/config")
 async def list_config_tables(current_user=Depends(get_current_user)):
     """List all available configuration tables."""
-    return {"tables": [{"name": k, **v} for k, v in CONFIG_TABLE_INFO.items()]}
+    return {"tables": CONFIG_TABLE_LISTING}
 
 
 @router.get("/config/{table_name}", response_model=ConfigItemListResponse)
@@ -366,10 +366,15 @@ async def list_config_items(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """List all items in a configuration table."""
+    """List all items in a configuration table.
+
+    Served from the pre-rendered listing cache; writes to the table
+    invalidate it.
+    """
     service = get_config_service(table_name, db)
-    items = service.get_active() if active_only else service.get_all()
-    return ConfigItemListResponse(items=items, total=len(items))
+    return Response(
+        service.get_listing_json(active_only), media_type="application/json"
+    )
 
 
 @router.get("/config/{table_name}/{item_id}")
@@ -382,9 +387,7 @@ async def get_config_item(
     """Get a single config item."""
     service = get_config_service(table_name, db)
     item = service.get_or_404(item_id)
-    if is_weighted_table(table_name):
-        return WeightedConfigItemResponse.model_validate(item)
-    return ConfigItemResponse.model_validate(item)
+    return service.response_schema.model_validate(item)
 
 
 @router.post("/config/{table_name}", status_code=201)
@@ -404,9 +407,7 @@ async def create_config_item(
         table_name, item.id, serialize_for_audit(item), current_user.id, request
     )
 
-    if is_weighted_table(table_name):
-        return WeightedConfigItemResponse.model_validate(item)
-    return ConfigItemResponse.model_validate(item)
+    return service.response_schema.model_validate(item)
 
 
 @router.put("/config/{table_name}/{item_id}")
@@ -434,9 +435,7 @@ async def update_config_item(
         request,
     )
 
-    if is_weighted_table(table_name):
-        return WeightedConfigItemResponse.model_validate(item)
-    return ConfigItemResponse.model_validate(item)
+    return service.response_schema.model_validate(item)
 
 
 @router.delete("/config/{table_name}/{item_id}", status_code=204)
@@ -472,37 +471,55 @@ async def list_audit_logs(
     entity_id: Optional[int] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    new_values_contains: Optional[str] = Query(
+        None, description='JSON object the new values must contain, e.g. {"status": 1}'
+    ),
     db: Session = Depends(get_db),
     current_user=Depends(require_any_role("admin")),
 ):
     """List audit logs with filtering (admin only)."""
+    contains = _parse_json_object(new_values_contains)
     service = AuditService(db)
+    # The list view shows each entry's diffs, so load the deferred columns
     logs = service.get_logs(
-        user_id, action, entity_type, entity_id, start_date, end_date, skip, limit
+        user_id,
+        action,
+        entity_type,
+        entity_id,
+        start_date,
+        end_date,
+        skip,
+        limit,
+        with_details=True,
+        new_values_contains=contains,
     )
     total = service.count_logs(
-        user_id, action, entity_type, entity_id, start_date, end_date
+        user_id,
+        action,
+        entity_type,
+        entity_id,
+        start_date,
+        end_date,
+        new_values_contains=contains,
     )
 
-    items = [
-        AuditLogResponse(
-            id=log.id,
-            user_id=log.user_id,
-            username=log.user.username if log.user else None,
-            action=log.action,
-            entity_type=log.entity_type,
-            entity_id=log.entity_id,
-            old_values=log.old_values,
-            new_values=log.new_values,
-            ip_address=log.ip_address,
-            user_agent=log.user_agent,
-            created_at=log.created_at,
-        )
-        for log in logs
-    ]
+    items = AUDIT_LOG_LIST_ADAPTER.validate_python(logs, from_attributes=True)
     return AuditLogListResponse(items=items, total=total, skip=skip, limit=limit)
 
 
+def _parse_json_object(raw: Optional[str]) -> Optional[dict]:
+    """Decode a JSON-object query parameter, rejecting anything else."""
+    if raw is None:
+        return None
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        value = None
+    if not isinstance(value, dict):
+        raise HTTPException(status_code=400, detail="Expected a JSON object")
+    return value
+
+
 @router.get("/audit-logs/{audit_id}", response_model=AuditLogResponse)
 async def get_audit_log(
     audit_id: int,
@@ -514,16 +531,4 @@ async def get_audit_log(
     log = service.get(audit_id)
     if not log:
         raise HTTPException(status_code=404, detail="Audit log not found")
-    return AuditLogResponse(
-        id=log.id,
-        user_id=log.user_id,
-        username=log.user.username if log.user else None,
-        action=log.action,
-        entity_type=log.entity_type,
-        entity_id=log.entity_id,
-        old_values=log.old_values,
-        new_values=log.new_values,
-        ip_address=log.ip_address,
-        user_agent=log.user_agent,
-        created_at=log.created_at,
-    )
+    return AuditLogResponse.model_validate(log)
@@ -18,7 +18,7 @@ async def login(
 ):
     """Authenticate user and return JWT tokens."""
     service = UserService(db)
-    user = service.authenticate(form_data.username, form_data.password)
+    user = await service.authenticate(form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -27,7 +27,7 @@ async def login(
         )
 
     access_token = create_access_token(
-        data={"sub": str(user.id), "role": user.role.value}
+        data={"sub": str(user.id), "uid": user.id, "role": user.role.value}
     )
     refresh_token = create_refresh_token(data={"sub": str(user.id)})
     return TokenResponse(access_token=access_token, refresh_token=refresh_token)
@@ -55,7 +55,7 @@ async def refresh_token(
         )
 
     access_token = create_access_token(
-        data={"sub": str(user.id), "role": user.role.value}
+        data={"sub": str(user.id), "uid": user.id, "role": user.role.value}
     )
     new_refresh_token = create_refresh_token(data={"sub": str(user.id)})
     return TokenResponse(access_token=access_token, refresh_token=new_refresh_token)
@@ -17,6 +17,7 @@ from app.models.schemas.estimation import (
     WBSCostSummary,
 )
 from app.models.schemas.risk import (
+    RISK_LIST_ADAPTER,
     RiskCreate,
     RiskListResponse,
     RiskResponse,
@@ -175,16 +176,8 @@ async def list_risks(
     """List all risks for a WBS item with computed exposure."""
     _validate_project_wbs(db, project_id, wbs_id)
     service = RiskService(db)
-    risks_with_exposure = service.get_by_wbs_with_exposure(wbs_id)
-
-    # Build response with exposure added
-    items = []
-    for item in risks_with_exposure:
-        risk = item["risk"]
-        response = RiskResponse.model_validate(risk)
-        response.risk_exposure = item["risk_exposure"]
-        items.append(response)
-
+    risks = service.get_by_wbs(wbs_id, with_details=True)
+    items = RISK_LIST_ADAPTER.validate_python(risks, from_attributes=True)
     return RiskListResponse(items=items, total=len(items))
 
 
@@ -204,10 +197,7 @@ async def create_risk(
     """Create a new risk for a WBS item."""
     _validate_project_wbs(db, project_id, wbs_id)
     service = RiskService(db)
-    risk = service.create(wbs_id, risk_in)
-    response = RiskResponse.model_validate(risk)
-    response.risk_exposure = service.compute_risk_exposure(risk)
-    return response
+    return service.create(wbs_id, risk_in)
 
 
 @router.get(
@@ -228,9 +218,7 @@ async def get_risk(
     risk = service.get_or_404(risk_id)
     if risk.wbs_id != wbs_id:
         raise HTTPException(status_code=404, detail="Risk not found")
-    response = RiskResponse.model_validate(risk)
-    response.risk_exposure = service.compute_risk_exposure(risk)
-    return response
+    return risk
 
 
 @router.put(
@@ -252,10 +240,7 @@ async def update_risk(
     risk = service.get_or_404(risk_id)
     if risk.wbs_id != wbs_id:
         raise HTTPException(status_code=404, detail="Risk not found")
-    updated = service.update(risk_id, risk_in)
-    response = RiskResponse.model_validate(updated)
-    response.risk_exposure = service.compute_risk_exposure(updated)
-    return response
+    return service.update(risk_id, risk_in)
 
 
 @router.delete(
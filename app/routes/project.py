@@ -1,5 +1,6 @@
 """Project routes."""
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -15,7 +16,12 @@ from app.models.schemas.project import (
     ProjectResponse,
     ProjectUpdate,
 )
-from app.models.schemas.wbs import WBSListResponse, WBSTreeNode, WBSTreeResponse
+from app.models.schemas.wbs import (
+    WBSListResponse,
+    WBSResponse,
+    WBSTreeNode,
+    WBSTreeResponse,
+)
 from app.repositories.wbs_repository import WBSRepository
 from app.services.import_service import ImportService
 from app.services.project_service import ProjectService
@@ -174,28 +180,30 @@ async def get_wbs_tree(
     """Get hierarchical WBS tree for a project."""
     ProjectService(db).get_or_404(project_id)
     repo = WBSRepository(db)
+    roots = repo.get_tree(project_id)
+    return WBSTreeResponse(
+        items=[WBSTreeNode.model_validate(root) for root in roots],
+        total=repo.count_by_project(project_id),
+    )
+
+
+@router.get("/{project_id}/wbs/export")
+async def export_wbs(
+    project_id: int,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Stream every WBS item of a project as NDJSON, one item per line.
 
-    # Fetch all items flat, build tree in memory
-    all_items = repo.get_by_project(project_id, skip=0, limit=10000)
-    total = len(all_items)
-
-    # Build lookup by ID
-    nodes = {}
-    for item in all_items:
-        node = WBSTreeNode.model_validate(item)
-        node.children = []
-        nodes[item.id] = node
-
-    # Link parents
-    roots = []
-    for item in all_items:
-        node = nodes[item.id]
-        if item.parent_id and item.parent_id in nodes:
-            nodes[item.parent_id].children.append(node)
-        else:
-            roots.append(node)
-
-    return WBSTreeResponse(items=roots, total=total)
+    Unlike the paginated list, memory use stays at one cursor batch no
+    matter how many tasks the project has.
+    """
+    ProjectService(db).get_or_404(project_id)
+    items = WBSRepository(db).iter_by_project(project_id)
+    return StreamingResponse(
+        (WBSResponse.model_validate(item).model_dump_json() + "\n" for item in items),
+        media_type="application/x-ndjson",
+    )
 
 
 # ============================================================
@@ -1,8 +1,8 @@
 """Approval workflow service."""
-from datetime import datetime
 from typing import Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.database.audit_log import AuditLog
@@ -92,7 +92,7 @@ class ApprovalService:
         # Update status and approval fields
         wbs.approval_status = "approved"
         wbs.approver = username
-        wbs.approver_date = datetime.utcnow()
+        wbs.approver_date = func.now()
         wbs.estimate_revision = (wbs.estimate_revision or 0) + 1
         self.db.commit()
         self.db.refresh(wbs)
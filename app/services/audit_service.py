@@ -187,8 +187,8 @@ class AuditService:
     # Query methods
 
     def get(self, audit_id: int) -> Optional[AuditLog]:
-        """Get an audit log by ID."""
-        return self.repository.get(audit_id)
+        """Get an audit log by ID, including its value diffs."""
+        return self.repository.get(audit_id, with_details=True)
 
     def get_logs(
         self,
@@ -200,6 +200,8 @@ class AuditService:
         end_date: Optional[datetime] = None,
         skip: int = 0,
         limit: int = 100,
+        with_details: bool = False,
+        new_values_contains: Optional[dict] = None,
     ) -> List[AuditLog]:
         """Get audit logs with optional filters."""
         return self.repository.get_filtered(
@@ -211,6 +213,8 @@ class AuditService:
             end_date=end_date,
             skip=skip,
             limit=limit,
+            with_details=with_details,
+            new_values_contains=new_values_contains,
         )
 
     def count_logs(
@@ -221,6 +225,7 @@ class AuditService:
         entity_id: Optional[int] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        new_values_contains: Optional[dict] = None,
     ) -> int:
         """Count audit logs with optional filters."""
         return self.repository.count_filtered(
@@ -230,6 +235,7 @@ class AuditService:
             entity_id=entity_id,
             start_date=start_date,
             end_date=end_date,
+            new_values_contains=new_values_contains,
         )
 
     def get_recent(self, limit: int = 50) -> List[AuditLog]:
@@ -1,8 +1,8 @@
 """Redis-backed cache service."""
-import json
 import logging
 from typing import Any, Optional
 
+import orjson
 import redis
 
 from app.core.config import settings
@@ -41,7 +41,7 @@ class CacheService:
             raw = self.client.get(key)
             if raw is None:
                 return None
-            return json.loads(raw)
+            return orjson.loads(raw)
         except Exception as exc:
             logger.warning("Cache GET error for key '%s': %s", key, exc)
             return None
@@ -56,7 +56,7 @@ class CacheService:
             self.client.setex(
                 name=key,
                 time=ttl if ttl is not None else self._default_ttl,
-                value=json.dumps(value, default=str),
+                value=orjson.dumps(value, default=str),
             )
             return True
         except Exception as exc:
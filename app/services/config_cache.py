@@ -0,0 +1,160 @@
+"""In-process cache of the configuration/lookup tables."""
+import logging
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Dict, Optional, Type
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from app.core.database import Base, get_sessionmaker
+from app.models.database.config_tables import ALL_CONFIG_MODELS
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Writes in this worker invalidate immediately; the TTL bounds how long a
+# write made by another worker can go unseen here.
+CONFIG_CACHE_TTL = 60
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigEntry:
+    """Detached snapshot of one lookup row, safe to share across sessions."""
+
+    code: str
+    description: str
+    is_active: bool
+    weight: Optional[Decimal] = None
+
+    @classmethod
+    def from_row(cls, row) -> "ConfigEntry":
+        return cls(
+            code=row.code,
+            description=row.description,
+            is_active=row.is_active,
+            weight=getattr(row, "weight", None),
+        )
+
+
+class ConfigCache:
+    """
+    ``{code: ConfigEntry}`` dicts for every config table.
+
+    The tables are small and rarely written, so each one is loaded whole on
+    first use (or at startup via ``preload``) and code lookups become a
+    dict probe instead of a query. Inserts, updates and deletes through the
+    ORM drop the affected table once their transaction commits, and it is
+    reloaded on the next lookup.
+
+    Rendered API listings are cached alongside, keyed on the table's write
+    version. The version is bumped when a write commits, so a listing
+    rendered before that commit is stored under the retired version and
+    never served.
+    """
+
+    def __init__(self, ttl: float = CONFIG_CACHE_TTL):
+        self._tables = TTLCache(maxsize=len(ALL_CONFIG_MODELS), ttl=ttl)
+        self._listings = TTLCache(maxsize=4 * len(ALL_CONFIG_MODELS), ttl=ttl)
+        self._versions: Dict[str, int] = {}
+
+    def table(self, db: Session, model: Type[Base]) -> Dict[str, ConfigEntry]:
+        """Return every row of ``model`` keyed by code, loading it if needed."""
+        pending = _has_pending_write(db, model)
+        entries = None if pending else self._tables.get(model.__tablename__)
+        if entries is None:
+            version = self.version(model)
+            entries = {
+                row.code: ConfigEntry.from_row(row)
+                for row in db.scalars(select(model))
+            }
+            # Uncommitted rows, or a commit landing mid-load, must not be kept
+            if not pending and self.version(model) == version:
+                self._tables.set(model.__tablename__, entries)
+        return entries
+
+    def get(self, db: Session, model: Type[Base], code: str) -> Optional[ConfigEntry]:
+        """Look up one row of ``model`` by code."""
+        return self.table(db, model).get(code)
+
+    def version(self, model: Type[Base]) -> int:
+        """Number of committed writes to ``model`` seen by this worker."""
+        return self._versions.get(model.__tablename__, 0)
+
+    def listing(
+        self,
+        db: Session,
+        model: Type[Base],
+        active_only: bool,
+        render: Callable[[], bytes],
+    ) -> bytes:
+        """Return the rendered listing of ``model``, calling ``render`` on a miss."""
+        if _has_pending_write(db, model):
+            return render()
+        key = (model.__tablename__, active_only, self.version(model))
+        body = self._listings.get(key)
+        if body is None:
+            body = render()
+            self._listings.set(key, body)
+        return body
+
+    def preload(self) -> None:
+        """Load every config table using a short-lived session."""
+        db = get_sessionmaker()()
+        try:
+            for model in ALL_CONFIG_MODELS.values():
+                self.invalidate(model)
+                self.table(db, model)
+        finally:
+            db.close()
+
+    def invalidate(self, model: Type[Base]) -> None:
+        """Drop the cached rows of ``model`` and retire its listings."""
+        name = model.__tablename__
+        self._versions[name] = self._versions.get(name, 0) + 1
+        self._tables.pop(name)
+
+    def clear(self) -> None:
+        """Drop every cached table and listing."""
+        self._tables.clear()
+        self._listings.clear()
+
+
+config_cache = ConfigCache()
+
+
+# Session.info key holding the config models written in the open transaction
+_PENDING_KEY = "config_cache_pending"
+
+
+def _has_pending_write(db: Session, model: Type[Base]) -> bool:
+    """Whether ``db`` has flushed, uncommitted writes to ``model``."""
+    return model in db.info.get(_PENDING_KEY, ())
+
+
+def _record_write(mapper, connection, target) -> None:
+    """Note a flushed config write; the cache is only told on commit."""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(mapper.class_)
+
+
+def _invalidate_committed(session: Session) -> None:
+    # Releasing a savepoint commits nothing yet; wait for the outer COMMIT
+    if session.in_nested_transaction():
+        return
+    for model in session.info.pop(_PENDING_KEY, ()):
+        config_cache.invalidate(model)
+
+
+def _discard_rolled_back(session: Session) -> None:
+    # A savepoint rollback leaves the outer transaction's writes pending
+    if not session.in_nested_transaction():
+        session.info.pop(_PENDING_KEY, None)
+
+
+for _model in ALL_CONFIG_MODELS.values():
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event, _record_write)
+event.listen(Session, "after_commit", _invalidate_committed)
+event.listen(Session, "after_rollback", _discard_rolled_back)
@@ -2,11 +2,32 @@
 from typing import Any, List, Optional, Type
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from pydantic import BaseModel
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
 from app.core.database import Base
-from app.models.database.config_tables import ALL_CONFIG_MODELS, WEIGHTED_CONFIG_MODELS
+from app.models.database.config_tables import (
+    ALL_CONFIG_MODELS,
+    WEIGHTED_CONFIG_MODELS,
+    ProbabilityLevel,
+    SeverityLevel,
+)
+from app.models.database.risk import Risk
+from app.models.schemas.config import (
+    CONFIG_ITEM_LIST_ADAPTER,
+    CONFIG_TABLE_INFO,
+    ConfigItemListResponse,
+    ConfigItemResponse,
+)
+from app.services.config_cache import config_cache
+
+# Risks keep a copy of these weights (for their expected_cost column), so a
+# weight change is written through to every risk using the level.
+RISK_WEIGHT_SNAPSHOTS = {
+    ProbabilityLevel: (Risk.probability_code, Risk.probability_weight),
+    SeverityLevel: (Risk.severity_code, Risk.severity_weight),
+}
 
 
 class ConfigService:
@@ -15,9 +36,15 @@ class ConfigService:
     Provides a reusable service that works with any config table model.
     """
 
-    def __init__(self, model: Type[Base], db: Session):
+    def __init__(
+        self,
+        model: Type[Base],
+        db: Session,
+        response_schema: Type[BaseModel] = ConfigItemResponse,
+    ):
         self.model = model
         self.db = db
+        self.response_schema = response_schema
 
     def get(self, item_id: int) -> Optional[Any]:
         """Get a config item by ID."""
@@ -52,6 +79,16 @@ class ConfigService:
         )
         return list(self.db.scalars(stmt).all())
 
+    def get_listing_json(self, active_only: bool = False) -> bytes:
+        """JSON body of the table listing, rendered once per table version."""
+
+        def render() -> bytes:
+            items = self.get_active() if active_only else self.get_all()
+            listing = ConfigItemListResponse(items=items, total=len(items))
+            return CONFIG_ITEM_LIST_ADAPTER.dump_json(listing)
+
+        return config_cache.listing(self.db, self.model, active_only, render)
+
     def count(self) -> int:
         """Count total config items."""
         stmt = select(func.count()).select_from(self.model)
@@ -103,6 +140,15 @@ class ConfigService:
             if value is not None and hasattr(item, field):
                 setattr(item, field, value)
 
+        snapshot = RISK_WEIGHT_SNAPSHOTS.get(self.model)
+        if snapshot is not None and data.get("weight") is not None:
+            code_column, weight_column = snapshot
+            self.db.execute(
+                update(Risk)
+                .where(code_column == item.code)
+                .values({weight_column: item.weight})
+            )
+
         self.db.commit()
         self.db.refresh(item)
         return item
@@ -139,7 +185,8 @@ def get_config_service(table_name: str, db: Session) -> ConfigService:
         db: Database session
 
     Returns:
-        ConfigService instance for the specified table
+        ConfigService instance for the specified table, carrying the
+        table's response schema
 
     Raises:
         HTTPException: If table name is not recognized
@@ -151,7 +198,7 @@ def get_config_service(table_name: str, db: Session) -> ConfigService:
             detail=f"Unknown configuration table: '{table_name}'. "
             f"Valid tables: {list(ALL_CONFIG_MODELS.keys())}",
         )
-    return ConfigService(model, db)
+    return ConfigService(model, db, CONFIG_TABLE_INFO[table_name].response_schema)
 
 
 def is_weighted_table(table_name: str) -> bool:
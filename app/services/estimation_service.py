@@ -14,10 +14,15 @@ from app.models.schemas.estimation import (
     SupplierBreakdownItem,
     WBSCostSummary,
 )
-from app.repositories.assignment_repository import AssignmentRepository
+from app.repositories.assignment_repository import (
+    ROLLUP_TOTAL,
+    AssignmentRepository,
+    rollup_grouping_id,
+)
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.risk_repository import RiskRepository
 from app.repositories.wbs_repository import WBSRepository
+from app.services.config_cache import config_cache
 from app.services.risk_service import RiskService
 
 
@@ -53,7 +58,7 @@ class EstimationService:
             )
 
         # Get assignments and compute totals
-        assignments = self.assignment_repo.get_by_wbs(wbs_id)
+        assignments = self.assignment_repo.get_estimates_by_wbs(wbs_id)
         total_pert = sum(a.pert_estimate for a in assignments)
         variances = [a.std_deviation**2 for a in assignments]
         total_std = math.sqrt(sum(variances)) if variances else 0.0
@@ -101,34 +106,41 @@ class EstimationService:
         # Get all WBS items
         wbs_items = self.wbs_repo.get_by_project(project_id, skip=0, limit=10000)
 
-        # Get all assignments and risks
-        assignments = self.assignment_repo.get_by_project(project_id)
-        risks = self.risk_repo.get_by_project(project_id)
-
-        # Compute totals
-        total_pert = sum(a.pert_estimate for a in assignments)
-        variances = [a.std_deviation**2 for a in assignments]
-        total_std = math.sqrt(sum(variances)) if variances else 0.0
+        # Every total and breakdown comes from one grouped query
+        rollup = {}
+        for row in self.assignment_repo.get_estimate_rollup(project_id):
+            rollup.setdefault(row.grouping_id, []).append(row)
+        totals = rollup.get(ROLLUP_TOTAL)
+        total_pert = totals[0].total_pert if totals else 0.0
+        total_std = math.sqrt(totals[0].total_variance) if totals else 0.0
+        total_assignments = totals[0].count if totals else 0
         ci_low, ci_high = self._compute_confidence_interval(total_pert, total_std)
 
         # Compute total risk exposure
+        risks = self.risk_repo.get_by_project(project_id)
+        risks_by_wbs = {}
+        for r in risks:
+            risks_by_wbs.setdefault(r.wbs_id, []).append(r)
         total_exposure = sum(self.risk_service.compute_risk_exposure(r) for r in risks)
 
+        def grouped(column: str) -> list:
+            return rollup.get(rollup_grouping_id(column), [])
+
         # Compute breakdowns
-        by_cost_type = self._compute_cost_type_breakdown(assignments)
-        by_region = self._compute_region_breakdown(assignments)
-        by_resource = self._compute_resource_breakdown(assignments)
-        by_supplier = self._compute_supplier_breakdown(assignments)
+        by_cost_type = self._compute_cost_type_breakdown(grouped("cost_type_code"))
+        by_region = self._compute_region_breakdown(grouped("region_code"))
+        by_resource = self._compute_resource_breakdown(grouped("resource_code"))
+        by_supplier = self._compute_supplier_breakdown(grouped("supplier_code"))
 
         # Compute WBS-level summaries
+        by_wbs = {row.wbs_id: row for row in grouped("wbs_id")}
         wbs_summaries = []
         for wbs in wbs_items:
-            wbs_assignments = [a for a in assignments if a.wbs_id == wbs.id]
-            wbs_risks = [r for r in risks if r.wbs_id == wbs.id]
+            row = by_wbs.get(wbs.id)
+            wbs_risks = risks_by_wbs.get(wbs.id, [])
 
-            wbs_pert = sum(a.pert_estimate for a in wbs_assignments)
-            wbs_variances = [a.std_deviation**2 for a in wbs_assignments]
-            wbs_std = math.sqrt(sum(wbs_variances)) if wbs_variances else 0.0
+            wbs_pert = row.total_pert if row else 0.0
+            wbs_std = math.sqrt(row.total_variance) if row else 0.0
             wbs_ci_low, wbs_ci_high = self._compute_confidence_interval(
                 wbs_pert, wbs_std
             )
@@ -141,7 +153,7 @@ class EstimationService:
                     wbs_id=wbs.id,
                     wbs_code=wbs.wbs_code,
                     wbs_title=wbs.wbs_title,
-                    assignment_count=len(wbs_assignments),
+                    assignment_count=row.count if row else 0,
                     total_pert_estimate=wbs_pert,
                     total_std_deviation=wbs_std,
                     confidence_80_low=wbs_ci_low,
@@ -157,7 +169,7 @@ class EstimationService:
             project_id=project.id,
             project_name=project.project_name,
             total_wbs_items=len(wbs_items),
-            total_assignments=len(assignments),
+            total_assignments=total_assignments,
             total_pert_estimate=total_pert,
             total_std_deviation=total_std,
             confidence_80_low=ci_low,
@@ -186,116 +198,81 @@ class EstimationService:
         margin = self.Z_80 * std_dev
         return (pert_total - margin, pert_total + margin)
 
-    def _compute_cost_type_breakdown(
-        self, assignments: list
-    ) -> List[CostBreakdownItem]:
-        """Group assignments by cost type and sum PERT."""
-        groups = {}
-        for a in assignments:
-            code = a.cost_type_code or "UNASSIGNED"
-            if code not in groups:
-                groups[code] = {"code": code, "total_pert": 0.0, "count": 0}
-            groups[code]["total_pert"] += a.pert_estimate
-            groups[code]["count"] += 1
-
-        # Lookup descriptions
+    def _compute_cost_type_breakdown(self, rows: list) -> List[CostBreakdownItem]:
+        """Describe the per-cost-type rollup rows."""
         result = []
-        for code, data in groups.items():
-            if code != "UNASSIGNED":
-                stmt = select(CostType).where(CostType.code == code)
-                ct = self.db.scalars(stmt).first()
-                desc = ct.description if ct else code
+        for row in rows:
+            if row.cost_type_code:
+                ct = config_cache.get(self.db, CostType, row.cost_type_code)
+                desc = ct.description if ct else row.cost_type_code
             else:
                 desc = "Unassigned"
             result.append(
                 CostBreakdownItem(
-                    code=code,
+                    code=row.cost_type_code or "UNASSIGNED",
                     description=desc,
-                    total_pert=data["total_pert"],
-                    assignment_count=data["count"],
+                    total_pert=row.total_pert,
+                    assignment_count=row.count,
                 )
             )
         return sorted(result, key=lambda x: x.total_pert, reverse=True)
 
-    def _compute_region_breakdown(self, assignments: list) -> List[CostBreakdownItem]:
-        """Group assignments by region and sum PERT."""
-        groups = {}
-        for a in assignments:
-            code = a.region_code or "UNASSIGNED"
-            if code not in groups:
-                groups[code] = {"code": code, "total_pert": 0.0, "count": 0}
-            groups[code]["total_pert"] += a.pert_estimate
-            groups[code]["count"] += 1
-
+    def _compute_region_breakdown(self, rows: list) -> List[CostBreakdownItem]:
+        """Describe the per-region rollup rows."""
         result = []
-        for code, data in groups.items():
-            if code != "UNASSIGNED":
-                stmt = select(Region).where(Region.code == code)
-                r = self.db.scalars(stmt).first()
-                desc = r.description if r else code
+        for row in rows:
+            if row.region_code:
+                r = config_cache.get(self.db, Region, row.region_code)
+                desc = r.description if r else row.region_code
             else:
                 desc = "Unassigned"
             result.append(
                 CostBreakdownItem(
-                    code=code,
+                    code=row.region_code or "UNASSIGNED",
                     description=desc,
-                    total_pert=data["total_pert"],
-                    assignment_count=data["count"],
+                    total_pert=row.total_pert,
+                    assignment_count=row.count,
                 )
             )
         return sorted(result, key=lambda x: x.total_pert, reverse=True)
 
-    def _compute_resource_breakdown(self, assignments: list) -> List[CostBreakdownItem]:
-        """Group assignments by resource and sum PERT."""
-        groups = {}
-        for a in assignments:
-            code = a.resource_code
-            if code not in groups:
-                groups[code] = {"code": code, "total_pert": 0.0, "count": 0}
-            groups[code]["total_pert"] += a.pert_estimate
-            groups[code]["count"] += 1
-
-        result = []
-        for code, data in groups.items():
-            stmt = select(Resource).where(Resource.resource_code == code)
-            r = self.db.scalars(stmt).first()
-            desc = r.description if r else code
-            result.append(
-                CostBreakdownItem(
-                    code=code,
-                    description=desc,
-                    total_pert=data["total_pert"],
-                    assignment_count=data["count"],
-                )
+    def _compute_resource_breakdown(self, rows: list) -> List[CostBreakdownItem]:
+        """Describe the per-resource rollup rows."""
+        codes = [row.resource_code for row in rows]
+        stmt = select(Resource.resource_code, Resource.description).where(
+            Resource.resource_code.in_(codes)
+        )
+        descriptions = dict(self.db.execute(stmt).all()) if codes else {}
+        result = [
+            CostBreakdownItem(
+                code=row.resource_code,
+                description=descriptions.get(row.resource_code, row.resource_code),
+                total_pert=row.total_pert,
+                assignment_count=row.count,
             )
+            for row in rows
+        ]
         return sorted(result, key=lambda x: x.total_pert, reverse=True)
 
-    def _compute_supplier_breakdown(
-        self, assignments: list
-    ) -> List[SupplierBreakdownItem]:
-        """Group assignments by supplier and sum PERT."""
-        groups = {}
-        for a in assignments:
-            code = a.supplier_code or "UNASSIGNED"
-            if code not in groups:
-                groups[code] = {"code": code, "total_pert": 0.0, "count": 0}
-            groups[code]["total_pert"] += a.pert_estimate
-            groups[code]["count"] += 1
-
+    def _compute_supplier_breakdown(self, rows: list) -> List[SupplierBreakdownItem]:
+        """Describe the per-supplier rollup rows."""
+        codes = [row.supplier_code for row in rows if row.supplier_code]
+        stmt = select(Supplier.supplier_code, Supplier.name).where(
+            Supplier.supplier_code.in_(codes)
+        )
+        names = dict(self.db.execute(stmt).all()) if codes else {}
         result = []
-        for code, data in groups.items():
-            if code != "UNASSIGNED":
-                stmt = select(Supplier).where(Supplier.supplier_code == code)
-                s = self.db.scalars(stmt).first()
-                name = s.name if s else code
+        for row in rows:
+            if row.supplier_code:
+                name = names.get(row.supplier_code, row.supplier_code)
             else:
                 name = "Unassigned"
             result.append(
                 SupplierBreakdownItem(
-                    code=code,
+                    code=row.supplier_code or "UNASSIGNED",
                     name=name,
-                    total_pert=data["total_pert"],
-                    assignment_count=data["count"],
+                    total_pert=row.total_pert,
+                    assignment_count=row.count,
                 )
             )
         return sorted(result, key=lambda x: x.total_pert, reverse=True)
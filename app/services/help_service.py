@@ -102,7 +102,8 @@ class HelpService:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Category not found"
             )
-        return self.topic_repo.create(topic_in.model_dump())
+        topic = self.topic_repo.create(topic_in.model_dump())
+        return self.topic_repo.load_descriptions(topic)
 
     def update_topic(self, topic_id: int, topic_in: HelpTopicUpdate) -> HelpTopic:
         """Update an existing help topic."""
@@ -118,7 +119,8 @@ class HelpService:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Category not found"
                 )
-        return self.topic_repo.update(topic, update_data)
+        topic = self.topic_repo.update(topic, update_data)
+        return self.topic_repo.load_descriptions(topic)
 
     def delete_topic(self, topic_id: int) -> bool:
         """Delete a help topic."""
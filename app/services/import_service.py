@@ -9,20 +9,39 @@ from datetime import datetime
 from typing import List, Optional
 
 from fastapi import HTTPException, UploadFile, status
+from sqlalchemy import (
+    Column,
+    Integer,
+    delete,
+    exists,
+    func,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.database import bulk_insert_copy, temp_staging
 from app.models.database.import_job import ImportJob, ImportStatus
 from app.models.database.project import Project, ProjectSourceFormat, ProjectStatus
 from app.models.database.wbs import WBS
 from app.repositories.import_job_repository import ImportJobRepository
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.wbs_repository import WBSRepository
-from app.services.mpp_parser import MPPParser, ParsedProject
+from app.services.mpp_parser import MPPParser, ParsedProject, ParsedTask
 from app.utils.validators import get_content_type, sanitize_filename, validate_file
 
 logger = logging.getLogger(__name__)
 
+# Imported tasks are matched to existing WBS rows on this key
+WBS_IMPORT_KEY = ("project_id", "task_unique_id")
+
+# LISTEN channel carrying the id of each import job whose phase changed
+IMPORT_PROGRESS_CHANNEL = "import_progress"
+
 
 class ImportService:
     """Orchestrates MS Project file import lifecycle."""
@@ -110,7 +129,6 @@ class ImportService:
                 "s3_key": s3_key,
                 "file_size": file_size,
                 "status": ImportStatus.PENDING,
-                "progress": 0.0,
             }
         )
 
@@ -148,28 +166,25 @@ class ImportService:
             return
 
         try:
-            # Update status: started
+            # Update status: started (covers the download and the parse)
             self._update_progress(
-                job, ImportStatus.PARSING, 10, started_at=datetime.utcnow()
+                job, ImportStatus.PARSING, started_at=func.now()
             )
 
             # Download file from S3
-            self._update_progress(job, ImportStatus.PARSING, 15)
             file_contents = self._download_from_s3(job.s3_key)
             if file_contents is None:
                 self._fail_job(job, "Failed to download file from S3")
                 return
 
             # Parse with MPPParser
-            self._update_progress(job, ImportStatus.PARSING, 20)
             parser = MPPParser()
             parsed = parser.parse(file_contents, job.filename)
-            self._update_progress(job, ImportStatus.CREATING_RECORDS, 50)
-
-            # Clear existing WBS for re-import
-            self.wbs_repo.delete_by_project(job.project_id)
+            self._update_progress(
+                job, ImportStatus.CREATING_RECORDS, rows_total=len(parsed.tasks)
+            )
 
-            # Create WBS records (two-pass for parent linking)
+            # Create or refresh WBS records (two-pass for parent linking)
             self._create_wbs_records(job, project, parsed)
 
             # Update project metadata
@@ -190,8 +205,8 @@ class ImportService:
             self._update_progress(
                 job,
                 ImportStatus.COMPLETED,
-                100,
-                completed_at=datetime.utcnow(),
+                rows_processed=len(parsed.tasks),
+                completed_at=func.now(),
                 task_count=len(parsed.tasks),
                 resource_count=len(parsed.resources),
                 assignment_count=len(parsed.assignments),
@@ -207,6 +222,10 @@ class ImportService:
 
         except Exception as e:
             logger.exception("Import failed: job=%d", job_id)
+            # A database error leaves the transaction aborted on PostgreSQL;
+            # roll back so the failure can be recorded (and the staging
+            # table is dropped with it).
+            self.db.rollback()
             self._fail_job(job, str(e))
             self.project_repo.update(project, {"status": ProjectStatus.IMPORT_FAILED})
 
@@ -216,7 +235,7 @@ class ImportService:
 
     def get_import_status(self, job_id: int) -> Optional[ImportJob]:
         """Get a single import job by ID."""
-        return self.import_repo.get(job_id)
+        return self.import_repo.get(job_id, with_details=True)
 
     def get_project_imports(self, project_id: int) -> List[ImportJob]:
         """Get all import jobs for a project."""
@@ -246,88 +265,133 @@ class ImportService:
         self, job: ImportJob, project: Project, parsed: ParsedProject
     ) -> None:
         """
-        Two-pass WBS creation:
-        1. Create all records (to get DB IDs)
-        2. Link parent_id using unique_id -> db_id mapping
+        Set-based WBS upsert through a temporary staging table:
+        1. Load every task into the staging table (COPY on PostgreSQL,
+           one executemany elsewhere)
+        2. Move them into ``wbs`` with a single INSERT ... SELECT ...
+           ON CONFLICT DO UPDATE on (project_id, task_unique_id)
+        3. Delete the project's WBS rows that are no longer in the file
+        4. Link parent_id with one UPDATE joining on task_unique_id
+        5. Materialize wbs_path with one recursive-CTE UPDATE
+
+        Re-importing a file therefore keeps the ids of tasks that are
+        still present, along with their assignments, risks and approval
+        state.
+
+        The import can be re-run from the S3 file, so the staged rows
+        never need to be WAL-logged. Nothing commits until the end: the
+        staging table lives on this transaction's connection.
         """
         if not parsed.tasks:
             return
 
-        # Pass 1: Create all WBS items without parent links
-        unique_id_to_db_id = {}
-        total = len(parsed.tasks)
-
-        for i, task in enumerate(parsed.tasks):
-            wbs_data = {
-                "project_id": project.id,
-                "task_unique_id": task.unique_id,
-                "wbs_code": task.wbs_code,
-                "wbs_title": task.name,
-                "outline_level": task.outline_level,
-                "schedule_start": task.start,
-                "schedule_finish": task.finish,
-                "baseline_start": task.baseline_start,
-                "baseline_finish": task.baseline_finish,
-                "late_start": task.late_start,
-                "late_finish": task.late_finish,
-                "actual_start": task.actual_start,
-                "actual_finish": task.actual_finish,
-                "duration": task.duration,
-                "duration_units": task.duration_units,
-                "percent_complete": task.percent_complete,
-                "cost": task.cost,
-                "baseline_cost": task.baseline_cost,
-                "is_milestone": task.is_milestone,
-                "is_summary": task.is_summary,
-                "is_critical": task.is_critical,
-                "resource_names": task.resource_names,
-                "notes": task.notes,
+        wbs = WBS.__table__
+        rows = [
+            {**self._wbs_row(project, task), "parent_unique_id": task.parent_unique_id}
+            for task in parsed.tasks
+        ]
+        columns = [name for name in rows[0] if name != "parent_unique_id"]
+
+        with temp_staging(
+            self.db, wbs, Column("parent_unique_id", Integer)
+        ) as staging:
+            bulk_insert_copy(self.db, staging, rows)
+
+            # SQLite needs the WHERE to parse ON CONFLICT after a SELECT
+            upsert = self._insert(wbs).from_select(
+                columns, select(*(staging.c[name] for name in columns)).where(true())
+            )
+            refreshed = {
+                name: upsert.excluded[name]
+                for name in columns
+                if name not in WBS_IMPORT_KEY
             }
+            self.db.execute(
+                upsert.on_conflict_do_update(
+                    index_elements=list(WBS_IMPORT_KEY),
+                    index_where=wbs.c.task_unique_id.isnot(None),
+                    set_={**refreshed, "parent_id": None, "updated_at": func.now()},
+                )
+            )
+            self.db.execute(
+                delete(wbs).where(
+                    wbs.c.project_id == project.id,
+                    ~exists().where(staging.c.task_unique_id == wbs.c.task_unique_id),
+                )
+            )
 
-            db_item = WBS(**wbs_data)
-            self.db.add(db_item)
-            self.db.flush()  # Get the DB ID without committing
-            unique_id_to_db_id[task.unique_id] = db_item.id
-
-            # Update progress (55-90 range during record creation)
-            if i % 50 == 0:
-                progress = 55 + (35 * i / total)
-                self._update_progress(job, ImportStatus.CREATING_RECORDS, progress)
-
-        # Pass 2: Link parents
-        for task in parsed.tasks:
-            if (
-                task.parent_unique_id is not None
-                and task.parent_unique_id in unique_id_to_db_id
-            ):
-                db_id = unique_id_to_db_id[task.unique_id]
-                parent_db_id = unique_id_to_db_id[task.parent_unique_id]
-                db_item = self.db.get(WBS, db_id)
-                if db_item:
-                    db_item.parent_id = parent_db_id
+            parent = wbs.alias("parent")
+            self.db.execute(
+                update(wbs)
+                .where(
+                    wbs.c.project_id == project.id,
+                    wbs.c.task_unique_id == staging.c.task_unique_id,
+                    parent.c.project_id == project.id,
+                    parent.c.task_unique_id == staging.c.parent_unique_id,
+                )
+                .values(parent_id=parent.c.id)
+            )
 
+        self.wbs_repo.rebuild_paths(project.id)
         self.db.commit()
-        self._update_progress(job, ImportStatus.CREATING_RECORDS, 95)
+
+    def _insert(self, table):
+        """Dialect-specific INSERT construct, for ON CONFLICT support."""
+        if self.db.get_bind().dialect.name == "sqlite":
+            return sqlite_insert(table)
+        return pg_insert(table)
+
+    @staticmethod
+    def _wbs_row(project: Project, task: ParsedTask) -> dict:
+        """Column values for one imported task."""
+        return {
+            "project_id": project.id,
+            "task_unique_id": task.unique_id,
+            "wbs_code": task.wbs_code,
+            "wbs_title": task.name,
+            "outline_level": task.outline_level,
+            "schedule_start": task.start,
+            "schedule_finish": task.finish,
+            "baseline_start": task.baseline_start,
+            "baseline_finish": task.baseline_finish,
+            "late_start": task.late_start,
+            "late_finish": task.late_finish,
+            "actual_start": task.actual_start,
+            "actual_finish": task.actual_finish,
+            "duration": task.duration,
+            "duration_units": task.duration_units,
+            "percent_complete": task.percent_complete,
+            "cost": task.cost,
+            "baseline_cost": task.baseline_cost,
+            "is_milestone": task.is_milestone,
+            "is_summary": task.is_summary,
+            "is_critical": task.is_critical,
+            "resource_names": task.resource_names,
+            "notes": task.notes,
+        }
 
     def _update_progress(
-        self,
-        job: ImportJob,
-        status: ImportStatus,
-        progress: float,
-        **extra_fields,
+        self, job: ImportJob, status: ImportStatus, **extra_fields
     ) -> None:
-        """Update import job progress."""
-        update_data = {"status": status, "progress": progress, **extra_fields}
-        self.import_repo.update(job, update_data)
+        """
+        Move an import job to a new phase.
+
+        Called once per phase rather than per row. On PostgreSQL the same
+        transaction sends a NOTIFY on ``IMPORT_PROGRESS_CHANNEL`` with the
+        job id, so listeners see the change at commit without polling.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            self.db.execute(
+                select(func.pg_notify(IMPORT_PROGRESS_CHANNEL, str(job.id)))
+            )
+        self.import_repo.update(job, {"status": status, **extra_fields})
 
     def _fail_job(self, job: ImportJob, error_message: str) -> None:
         """Mark an import job as failed."""
-        self.import_repo.update(
+        self._update_progress(
             job,
-            {
-                "status": ImportStatus.FAILED,
-                "error_message": error_message,
-                "completed_at": datetime.utcnow(),
-            },
+            ImportStatus.FAILED,
+            error_message=error_message,
+            completed_at=func.now(),
         )
         logger.error("Import job %d failed: %s", job.id, error_message)
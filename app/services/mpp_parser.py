@@ -58,7 +58,7 @@ class ParsedTask:
     is_critical: bool = False
 
     # Display
-    resource_names: Optional[str] = None
+    resource_names: Optional[List[str]] = None
     notes: Optional[str] = None
 
 
@@ -195,7 +195,7 @@ class MPPParser:
                 time_unit = duration_obj.getUnits()
                 dur_units = self._str(time_unit) if time_unit else None
 
-            # Resource names (comma-separated display string)
+            # Names of the assigned resources
             resource_names = None
             assignments = task.getResourceAssignments()
             if assignments is not None and assignments.size() > 0:
@@ -207,7 +207,7 @@ class MPPParser:
                         if rn:
                             names.append(rn)
                 if names:
-                    resource_names = ", ".join(names)
+                    resource_names = names
 
             tasks.append(
                 ParsedTask(
@@ -1,16 +1,18 @@
 """Risk service."""
-from typing import List, Optional
+from decimal import Decimal
+from typing import List, Optional, Type
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.database import Base
 from app.models.database.config_tables import ProbabilityLevel, SeverityLevel
 from app.models.database.risk import Risk
 from app.models.database.wbs import WBS
 from app.models.schemas.risk import RiskCreate, RiskUpdate
 from app.repositories.risk_repository import RiskRepository
 from app.repositories.wbs_repository import WBSRepository
+from app.services.config_cache import config_cache
 
 
 class RiskService:
@@ -23,11 +25,11 @@ class RiskService:
 
     def get(self, risk_id: int) -> Optional[Risk]:
         """Get a risk by ID."""
-        return self.repository.get(risk_id)
+        return self.repository.get(risk_id, with_details=True)
 
     def get_or_404(self, risk_id: int) -> Risk:
         """Get a risk by ID or raise 404."""
-        risk = self.repository.get(risk_id)
+        risk = self.repository.get(risk_id, with_details=True)
         if not risk:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -35,9 +37,9 @@ class RiskService:
             )
         return risk
 
-    def get_by_wbs(self, wbs_id: int) -> List[Risk]:
+    def get_by_wbs(self, wbs_id: int, with_details: bool = False) -> List[Risk]:
         """Get all risks for a WBS item."""
-        return self.repository.get_by_wbs(wbs_id)
+        return self.repository.get_by_wbs(wbs_id, with_details=with_details)
 
     def count_by_wbs(self, wbs_id: int) -> int:
         """Count risks for a WBS item."""
@@ -56,6 +58,11 @@ class RiskService:
         # Create risk
         risk_data = data.model_dump()
         risk_data["wbs_id"] = wbs_id
+        risk_data.update(
+            self._weight_snapshot(
+                risk_data.get("probability_code"), risk_data.get("severity_code")
+            )
+        )
         return self.repository.create(risk_data)
 
     def update(self, risk_id: int, data: RiskUpdate) -> Risk:
@@ -71,6 +78,13 @@ class RiskService:
         self._validate_wbs_editable(risk.wbs_id)
 
         update_data = data.model_dump(exclude_unset=True)
+        if "probability_code" in update_data or "severity_code" in update_data:
+            update_data.update(
+                self._weight_snapshot(
+                    update_data.get("probability_code", risk.probability_code),
+                    update_data.get("severity_code", risk.severity_code),
+                )
+            )
         return self.repository.update(risk, update_data)
 
     def delete(self, risk_id: int) -> bool:
@@ -86,28 +100,12 @@ class RiskService:
         return self.repository.delete(risk_id)
 
     def compute_risk_exposure(self, risk: Risk) -> float:
-        """Compute risk exposure: risk_cost * probability_weight * severity_weight.
+        """Risk exposure: risk_cost * probability_weight * severity_weight.
 
-        Returns 0.0 if probability or severity codes are not set or not found.
+        Read from the ``expected_cost`` column the database computes from the
+        weight snapshots; 0.0 when either code is unset or unknown.
         """
-        if not risk.probability_code or not risk.severity_code:
-            return 0.0
-
-        # Get probability weight
-        prob_stmt = select(ProbabilityLevel).where(
-            ProbabilityLevel.code == risk.probability_code
-        )
-        probability = self.db.scalars(prob_stmt).first()
-        prob_weight = float(probability.weight) if probability else 0.0
-
-        # Get severity weight
-        sev_stmt = select(SeverityLevel).where(SeverityLevel.code == risk.severity_code)
-        severity = self.db.scalars(sev_stmt).first()
-        sev_weight = float(severity.weight) if severity else 0.0
-
-        # Compute exposure
-        risk_cost = float(risk.risk_cost or 0)
-        return risk_cost * prob_weight * sev_weight
+        return float(risk.expected_cost or 0)
 
     def get_with_exposure(self, risk_id: int) -> dict:
         """Get a risk with computed exposure included."""
@@ -120,7 +118,7 @@ class RiskService:
 
     def get_by_wbs_with_exposure(self, wbs_id: int) -> List[dict]:
         """Get all risks for a WBS item with computed exposure."""
-        risks = self.get_by_wbs(wbs_id)
+        risks = self.get_by_wbs(wbs_id, with_details=True)
         return [
             {
                 "risk": risk,
@@ -131,8 +129,21 @@ class RiskService:
 
     def get_total_exposure_by_wbs(self, wbs_id: int) -> float:
         """Get total risk exposure for a WBS item."""
-        risks = self.get_by_wbs(wbs_id)
-        return sum(self.compute_risk_exposure(r) for r in risks)
+        return self.repository.get_total_exposure_by_wbs(wbs_id)
+
+    def _weight_snapshot(
+        self, probability_code: Optional[str], severity_code: Optional[str]
+    ) -> dict:
+        """Current level weights for the codes, for the risk's snapshot columns."""
+        return {
+            "probability_weight": self._weight(ProbabilityLevel, probability_code),
+            "severity_weight": self._weight(SeverityLevel, severity_code),
+        }
+
+    def _weight(self, model: Type[Base], code: Optional[str]) -> Optional[Decimal]:
+        # Weights come from the in-process lookup cache
+        entry = config_cache.get(self.db, model, code) if code else None
+        return entry.weight if entry else None
 
     def _validate_wbs_editable(self, wbs_id: int) -> WBS:
         """Validate that a WBS item exists and is editable.
@@ -1,11 +1,15 @@
 """User service with business logic."""
-from datetime import datetime
 from typing import List, Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import (
+    aget_password_hash,
+    averify_password,
+    invalidate_cached_user,
+)
 from app.models.database.user import User
 from app.models.schemas.user import UserCreate, UserPasswordUpdate, UserUpdate
 from app.repositories.user_repository import UserRepository
@@ -36,7 +40,7 @@ class UserService:
     def count(self) -> int:
         return self.repository.count()
 
-    def create(self, user_in: UserCreate) -> User:
+    async def create(self, user_in: UserCreate) -> User:
         # Check for duplicates
         if self.repository.get_by_email(user_in.email):
             raise HTTPException(
@@ -48,7 +52,7 @@ class UserService:
             )
 
         user_data = user_in.model_dump(exclude={"password"})
-        user_data["hashed_password"] = get_password_hash(user_in.password)
+        user_data["hashed_password"] = await aget_password_hash(user_in.password)
         return self.repository.create(user_data)
 
     def update(self, user_id: int, user_in: UserUpdate) -> User:
@@ -69,31 +73,36 @@ class UserService:
                     detail="Username already taken",
                 )
 
-        return self.repository.update(user, update_data)
+        user = self.repository.update(user, update_data)
+        invalidate_cached_user(user_id)
+        return user
 
-    def update_password(
+    async def update_password(
         self, user_id: int, password_update: UserPasswordUpdate
     ) -> User:
         user = self.get_or_404(user_id)
-        if not verify_password(password_update.current_password, user.hashed_password):
+        if not await averify_password(
+            password_update.current_password, user.hashed_password
+        ):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Incorrect current password",
             )
-        return self.repository.update(
-            user, {"hashed_password": get_password_hash(password_update.new_password)}
-        )
+        hashed_password = await aget_password_hash(password_update.new_password)
+        return self.repository.update(user, {"hashed_password": hashed_password})
 
     def delete(self, user_id: int) -> bool:
         self.get_or_404(user_id)
-        return self.repository.delete(user_id)
+        deleted = self.repository.delete(user_id)
+        invalidate_cached_user(user_id)
+        return deleted
 
-    def authenticate(self, username: str, password: str) -> Optional[User]:
+    async def authenticate(self, username: str, password: str) -> Optional[User]:
         user = self.repository.get_by_username(username)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await averify_password(password, user.hashed_password):
             return None
         if not user.is_active:
             return None
         # Update last login
-        self.repository.update(user, {"last_login": datetime.utcnow()})
+        self.repository.update(user, {"last_login": func.now()})
         return user
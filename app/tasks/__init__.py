@@ -2,6 +2,7 @@
 Celery application configuration and task autodiscovery.
 """
 from celery import Celery
+from celery.schedules import crontab
 
 from app.core.config import settings
 
@@ -9,6 +10,7 @@ celery_app = Celery(
     "icepac",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
+    include=["app.tasks.mpp_tasks", "app.tasks.maintenance_tasks"],
 )
 
 celery_app.conf.update(
@@ -20,6 +22,12 @@ celery_app.conf.update(
     task_track_started=True,
     task_acks_late=True,
     worker_prefetch_multiplier=1,
+    beat_schedule={
+        "ensure-audit-partitions": {
+            "task": "tasks.ensure_audit_partitions",
+            "schedule": crontab(hour=0, minute=15),
+        },
+    },
 )
 
 celery_app.autodiscover_tasks(["app.tasks"])
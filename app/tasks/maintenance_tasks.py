@@ -0,0 +1,51 @@
+"""
+Celery tasks for periodic database maintenance.
+"""
+import logging
+from datetime import date
+
+from sqlalchemy import text
+
+from app.tasks import celery_app
+
+logger = logging.getLogger(__name__)
+
+# Months of audit_logs partitions kept ready ahead of the current one.
+AUDIT_PARTITIONS_AHEAD = 3
+
+
+def _add_months(month: date, count: int) -> date:
+    """First day of the month ``count`` months after ``month``."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+@celery_app.task(name="tasks.ensure_audit_partitions")
+def ensure_audit_partitions() -> int:
+    """
+    Create the monthly audit_logs partitions for the coming months.
+
+    Run daily by beat; audit_logs_ensure_partition() is idempotent, so
+    missed runs are caught up and rows never fall into the DEFAULT
+    partition. Returns the number of months checked.
+    """
+    from app.core.database import get_sessionmaker
+
+    this_month = date.today().replace(day=1)
+    months = [
+        _add_months(this_month, offset)
+        for offset in range(AUDIT_PARTITIONS_AHEAD + 1)
+    ]
+
+    db = get_sessionmaker()()
+    try:
+        db.execute(
+            text("SELECT audit_logs_ensure_partition(:month)"),
+            [{"month": month} for month in months],
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    logger.info("Audit partitions ensured through %s", months[-1])
+    return len(months)
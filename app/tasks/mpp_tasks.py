@@ -41,10 +41,10 @@ def process_mpp_import(self, import_job_id: int) -> Dict[str, Any]:
     """
     logger.info("Starting import processing: job_id=%d", import_job_id)
 
-    from app.core.database import SessionLocal
+    from app.core.database import get_sessionmaker
     from app.services.import_service import ImportService
 
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         service = ImportService(db)
         service.process_import(import_job_id)
@@ -53,7 +53,7 @@ def process_mpp_import(self, import_job_id: int) -> Dict[str, Any]:
         logger.exception("Import task failed: job_id=%d", import_job_id)
         # Try to mark the job as failed
         try:
-            from datetime import datetime
+            from sqlalchemy import func
 
             from app.models.database.import_job import ImportJob, ImportStatus
 
@@ -61,7 +61,7 @@ def process_mpp_import(self, import_job_id: int) -> Dict[str, Any]:
             if job and job.status != ImportStatus.FAILED:
                 job.status = ImportStatus.FAILED
                 job.error_message = str(exc)
-                job.completed_at = datetime.utcnow()
+                job.completed_at = func.now()
                 db.commit()
         except Exception:
             logger.exception("Failed to update job status after error")
@@ -9,7 +9,8 @@ import re
 from typing import List, Optional, Tuple
 
 # Default allowed file extensions for MS Project files
-ALLOWED_EXTENSIONS = [".mpp", ".mpx", ".xml"]
+ALLOWED_EXTENSIONS = (".mpp", ".mpx", ".xml")
+_ALLOWED_EXTENSION_SET = frozenset(ALLOWED_EXTENSIONS)
 
 # Default maximum file size (100 MB)
 DEFAULT_MAX_FILE_SIZE = 100 * 1024 * 1024
@@ -43,15 +44,18 @@ def validate_file_extension(
         return False, "Filename cannot be empty"
 
     if allowed_extensions is None:
-        allowed_extensions = ALLOWED_EXTENSIONS
-
-    # Normalize extensions to lowercase with leading dot
-    normalized_extensions = []
-    for ext in allowed_extensions:
-        ext = ext.lower()
-        if not ext.startswith("."):
-            ext = "." + ext
-        normalized_extensions.append(ext)
+        # Defaults are already normalized
+        normalized_extensions = ALLOWED_EXTENSIONS
+        extension_set = _ALLOWED_EXTENSION_SET
+    else:
+        # Normalize extensions to lowercase with leading dot
+        normalized_extensions = []
+        for ext in allowed_extensions:
+            ext = ext.lower()
+            if not ext.startswith("."):
+                ext = "." + ext
+            normalized_extensions.append(ext)
+        extension_set = frozenset(normalized_extensions)
 
     # Get file extension
     _, ext = os.path.splitext(filename)
@@ -60,7 +64,7 @@ def validate_file_extension(
     if not ext:
         return False, "File has no extension"
 
-    if ext not in normalized_extensions:
+    if ext not in extension_set:
         return (
             False,
             f"Invalid file type '{ext}'. Allowed: {', '.join(normalized_extensions)}",
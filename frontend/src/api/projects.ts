@@ -57,6 +57,8 @@ export interface ImportJob {
   file_size: number | null;
   status: string;
   progress: number;
+  rows_processed: number;
+  rows_total: number;
   celery_task_id: string | null;
   task_count: number;
   resource_count: number;
@@ -1,6 +1,7 @@
 """
 Pytest configuration and fixtures for ICEPac tests.
 """
+import os
 from unittest.mock import MagicMock
 
 import pytest
@@ -8,8 +9,11 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.core.database import Base, get_db
-from app.main import app
+# Cheap bcrypt cost for tests; must be set before settings are loaded.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from app.core.database import Base, get_db  # noqa: E402
+from app.main import app  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # Real SQLite engine for integration-style unit tests
@@ -665,6 +665,20 @@ class TestAdminRoutes:
         service = get_config_service("cost-types", mock_db)
         assert service.model == CostType
 
+    def test_config_table_specs_are_frozen_and_carry_schema(self):
+        """Each table's spec pre-binds its response schema."""
+        from app.models.schemas.config import (
+            CONFIG_TABLE_INFO,
+            WeightedConfigItemResponse,
+        )
+        from app.services.config_service import get_config_service
+
+        with pytest.raises(TypeError):
+            CONFIG_TABLE_INFO["extra"] = CONFIG_TABLE_INFO["regions"]
+
+        service = get_config_service("severity-levels", MagicMock(spec=Session))
+        assert service.response_schema is WeightedConfigItemResponse
+
 
 # ============================================================
 # Integration-style Tests
@@ -749,3 +763,103 @@ class TestAdminIntegration:
 
             # Verify 3 audit entries created
             assert mock_repo.create.call_count == 3
+
+
+class TestAuditLogLoading:
+    """Audit listings load their users in a single extra query."""
+
+    def test_listing_issues_two_queries(self, db):
+        from sqlalchemy import event
+
+        from app.models.database.audit_log import AuditLog
+        from app.models.database.user import User
+        from app.repositories.audit_repository import AuditRepository
+
+        users = [
+            User(email=f"u{i}@example.com", username=f"u{i}", hashed_password="x")
+            for i in range(3)
+        ]
+        db.add_all(users)
+        db.flush()
+        db.add_all(
+            AuditLog(user_id=users[i % 3].id, action="CREATE", entity_type="Project")
+            for i in range(9)
+        )
+        db.commit()
+        db.expunge_all()
+
+        statements = []
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.get_bind(), "before_cursor_execute", listener)
+        try:
+            logs = AuditRepository(db).get_filtered(limit=100)
+            usernames = {log.user.username for log in logs}
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", listener)
+
+        assert usernames == {"u0", "u1", "u2"}
+        assert len(statements) == 2
+
+    def test_list_adapter_reads_username_from_user(self, db):
+        from app.models.database.audit_log import AuditLog
+        from app.models.database.user import User
+        from app.models.schemas.audit_log import AUDIT_LOG_LIST_ADAPTER
+        from app.repositories.audit_repository import AuditRepository
+
+        user = User(email="u@example.com", username="u", hashed_password="x")
+        db.add(user)
+        db.flush()
+        db.add_all(
+            [
+                AuditLog(user_id=user.id, action="CREATE", entity_type="Project"),
+                AuditLog(action="LOGIN", entity_type="System"),
+            ]
+        )
+        db.commit()
+
+        items = AUDIT_LOG_LIST_ADAPTER.validate_python(
+            AuditRepository(db).get_filtered(limit=10), from_attributes=True
+        )
+        assert sorted(i.username or "" for i in items) == ["", "u"]
+
+    def test_new_values_filter_uses_jsonb_containment(self):
+        from sqlalchemy.dialects import postgresql
+
+        from app.repositories.audit_repository import AuditRepository
+
+        mock_db = MagicMock(spec=Session)
+        AuditRepository(mock_db).get_filtered(new_values_contains={"status": 1})
+
+        stmt = mock_db.scalars.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "audit_logs.new_values @> %(new_values_1)s" in sql
+
+    def test_new_values_filter_requires_json_object(self):
+        from fastapi import HTTPException
+
+        from app.routes.admin import _parse_json_object
+
+        assert _parse_json_object('{"status": 1}') == {"status": 1}
+        for raw in ("[1]", "{bad"):
+            with pytest.raises(HTTPException):
+                _parse_json_object(raw)
+
+    def test_value_diffs_deferred_unless_requested(self, db):
+        from app.models.database.audit_log import AuditLog
+        from app.repositories.audit_repository import AuditRepository
+
+        db.add(AuditLog(action="UPDATE", entity_type="Project", new_values={"a": 1}))
+        db.commit()
+        db.expunge_all()
+        repo = AuditRepository(db)
+
+        (log,) = repo.get_filtered()
+        assert "new_values" not in log.__dict__
+        db.expunge_all()
+
+        (log,) = repo.get_filtered(with_details=True)
+        assert log.__dict__["new_values"] == {"a": 1}
+        assert "user_agent" in log.__dict__
@@ -322,3 +322,20 @@ class TestApprovalService:
                 approval_service.submit_for_approval(1, user_id=1, username="user")
 
         assert wbs.approval_status == "submitted"
+
+
+class TestApprovalActionSchema:
+    """Approval actions are a closed set of literals."""
+
+    def test_accepts_known_actions(self):
+        from app.models.schemas.estimation import ApprovalAction
+
+        assert ApprovalAction(action="approve").action == "approve"
+
+    def test_rejects_unknown_action(self):
+        from pydantic import ValidationError
+
+        from app.models.schemas.estimation import ApprovalAction
+
+        with pytest.raises(ValidationError):
+            ApprovalAction(action="publish")
@@ -176,3 +176,97 @@ class TestAssignmentService:
 
         expected_std_dev = (worst - best) / 6
         assert round(expected_std_dev, 2) == 16.67
+
+
+class TestPertExpressions:
+    """PERT hybrids compute the same values in Python and in SQL."""
+
+    @pytest.fixture
+    def wbs_id(self, db):
+        from app.models.database.project import Project
+        from app.models.database.resource import Resource
+
+        project = Project(project_name="P")
+        db.add_all([project, Resource(resource_code="ENG", description="Eng")])
+        db.flush()
+        wbs = WBS(project_id=project.id, wbs_title="Task")
+        db.add(wbs)
+        db.flush()
+        db.add_all(
+            [
+                ResourceAssignment(
+                    wbs_id=wbs.id,
+                    resource_code="ENG",
+                    best_estimate=100,
+                    likely_estimate=150,
+                    worst_estimate=200,
+                ),
+                ResourceAssignment(
+                    wbs_id=wbs.id,
+                    resource_code="ENG",
+                    best_estimate="10.50",
+                    likely_estimate="12.25",
+                    worst_estimate="20.75",
+                ),
+            ]
+        )
+        db.commit()
+        return wbs.id
+
+    def test_sql_expression_matches_python(self, db, wbs_id):
+        from sqlalchemy import select
+
+        rows = db.execute(
+            select(
+                ResourceAssignment,
+                ResourceAssignment.pert_estimate,
+                ResourceAssignment.std_deviation,
+            )
+        ).all()
+        for assignment, pert, std in rows:
+            assert pert == pytest.approx(assignment.pert_estimate)
+            assert std == pytest.approx(assignment.std_deviation)
+
+    def test_pert_sum_by_wbs_aggregates_in_sql(self, db, wbs_id):
+        from app.repositories.assignment_repository import AssignmentRepository
+
+        result = AssignmentRepository(db).get_pert_sum_by_wbs(wbs_id)
+
+        assert result["count"] == 2
+        assert result["total_pert"] == pytest.approx(150 + 80.25 / 6)
+        assert result["total_variance"] == pytest.approx(
+            (100 / 6) ** 2 + (10.25 / 6) ** 2
+        )
+
+    def test_estimate_rows_are_sql_computed_floats(self, db, wbs_id):
+        from app.repositories.assignment_repository import AssignmentRepository
+
+        rows = AssignmentRepository(db).get_estimates_by_wbs(wbs_id)
+
+        assert all(type(r.pert_estimate) is float for r in rows)
+        assert sorted(r.pert_estimate for r in rows) == pytest.approx(
+            [80.25 / 6, 150]
+        )
+        assert {r.resource_code for r in rows} == {"ENG"}
+
+    def test_estimate_rollup_groups_every_set_in_one_query(self, db, wbs_id):
+        from app.repositories.assignment_repository import (
+            ROLLUP_TOTAL,
+            AssignmentRepository,
+            rollup_grouping_id,
+        )
+
+        project_id = db.get(WBS, wbs_id).project_id
+        rows = AssignmentRepository(db).get_estimate_rollup(project_id)
+        by_set = {}
+        for row in rows:
+            by_set.setdefault(row.grouping_id, []).append(row)
+
+        (total,) = by_set[ROLLUP_TOTAL]
+        assert total.count == 2
+        assert total.total_pert == pytest.approx(150 + 80.25 / 6)
+        (by_wbs,) = by_set[rollup_grouping_id("wbs_id")]
+        assert (by_wbs.wbs_id, by_wbs.count) == (wbs_id, 2)
+        (unassigned,) = by_set[rollup_grouping_id("supplier_code")]
+        assert unassigned.supplier_code is None
+        assert unassigned.total_pert == pytest.approx(total.total_pert)
@@ -1,7 +1,8 @@
 """
 Tests for authentication endpoints.
 """
-from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -51,7 +52,7 @@ class TestAuthEndpoints:
     def test_login_success(self, mock_token, mock_user_service, client, mock_user):
         """Test successful login."""
         mock_service = MagicMock()
-        mock_service.authenticate.return_value = mock_user
+        mock_service.authenticate = AsyncMock(return_value=mock_user)
         mock_user_service.return_value = mock_service
         mock_token.return_value = "test_token"
 
@@ -67,7 +68,7 @@ class TestAuthEndpoints:
     def test_login_invalid_credentials(self, mock_user_service, client):
         """Test login with invalid credentials."""
         mock_service = MagicMock()
-        mock_service.authenticate.return_value = None
+        mock_service.authenticate = AsyncMock(return_value=None)
         mock_user_service.return_value = mock_service
 
         response = client.post(
@@ -77,3 +78,179 @@ class TestAuthEndpoints:
 
         # Should return 401 unauthorized
         assert response.status_code in [401, 422]
+
+
+class TestPasswordHashing:
+    """Tests for the bcrypt configuration."""
+
+    def test_new_hashes_use_configured_rounds(self):
+        from app.core.config import settings
+        from app.core.security import get_password_hash
+
+        assert get_password_hash("secret").startswith(
+            f"$2b${settings.BCRYPT_ROUNDS:02d}$"
+        )
+
+    def test_native_backend_selected(self):
+        from app.core.security import pwd_context
+
+        assert pwd_context.handler("bcrypt").get_backend() == "bcrypt"
+
+
+class TestDecodeTokenCache:
+    """Tests for the verified-token cache in decode_token."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from app.core.security import _token_cache
+
+        _token_cache.clear()
+        yield
+        _token_cache.clear()
+
+    def test_repeated_token_verified_once(self):
+        from app.core import security
+
+        token = security.create_access_token({"sub": "1"})
+        with patch.object(
+            security.jwt, "decode", wraps=security.jwt.decode
+        ) as mock_decode:
+            assert security.decode_token(token)["sub"] == "1"
+            assert security.decode_token(token)["sub"] == "1"
+        assert mock_decode.call_count == 1
+
+    def test_expired_cached_token_rejected(self):
+        from fastapi import HTTPException
+
+        from app.core import security
+
+        token = security.create_access_token({"sub": "1"})
+        security.decode_token(token)
+        with patch.object(security.time, "time", return_value=float("inf")):
+            with pytest.raises(HTTPException) as exc_info:
+                security.decode_token(token)
+        assert exc_info.value.status_code == 401
+
+    def test_invalid_token_not_cached(self):
+        from fastapi import HTTPException
+
+        from app.core import security
+
+        with pytest.raises(HTTPException):
+            security.decode_token("not-a-token")
+        assert len(security._token_cache) == 0
+
+
+class TestCurrentUserCache:
+    """Tests for the authenticated-user snapshot cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from app.core.security import _user_cache
+
+        _user_cache.clear()
+        yield
+        _user_cache.clear()
+
+    def _db_user(self, is_active=True):
+        user = MagicMock()
+        user.id = 1
+        user.username = "testuser"
+        user.role = MagicMock(value="user")
+        user.is_active = is_active
+        return user
+
+    @pytest.mark.asyncio
+    async def test_user_loaded_once(self):
+        from app.core.security import CurrentUser, create_access_token, get_current_user
+
+        db = MagicMock()
+        db.get.return_value = self._db_user()
+        token = create_access_token({"sub": "1"})
+
+        first = await get_current_user(token=token, db=db)
+        second = await get_current_user(token=token, db=db)
+
+        assert isinstance(first, CurrentUser)
+        assert first is second
+        db.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads_user(self):
+        from fastapi import HTTPException
+
+        from app.core.security import (
+            create_access_token,
+            get_current_user,
+            invalidate_cached_user,
+        )
+
+        db = MagicMock()
+        db.get.return_value = self._db_user()
+        token = create_access_token({"sub": "1"})
+        await get_current_user(token=token, db=db)
+
+        db.get.return_value = self._db_user(is_active=False)
+        invalidate_cached_user(1)
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(token=token, db=db)
+        assert exc_info.value.status_code == 403
+
+    def test_access_token_carries_numeric_uid(self):
+        from app.core.security import create_access_token, decode_token
+
+        payload = decode_token(create_access_token({"sub": "7"}))
+        assert payload["sub"] == "7"
+        assert payload["uid"] == 7
+
+    @pytest.mark.asyncio
+    async def test_token_without_uid_falls_back_to_sub(self):
+        import jwt
+
+        from app.core.config import settings
+        from app.core.security import get_current_user
+
+        db = MagicMock()
+        db.get.return_value = self._db_user()
+        token = jwt.encode(
+            {"sub": "1", "exp": datetime.utcnow() + timedelta(minutes=5)},
+            settings.SECRET_KEY,
+            algorithm=settings.ALGORITHM,
+        )
+
+        user = await get_current_user(token=token, db=db)
+        assert user.id == 1
+        db.get.assert_called_once_with(ANY, 1)
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_rejected_as_access_token(self):
+        from fastapi import HTTPException
+
+        from app.core.security import create_refresh_token, get_current_user
+
+        db = MagicMock()
+        db.get.return_value = self._db_user()
+        token = create_refresh_token({"sub": "1"})
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(token=token, db=db)
+        assert exc_info.value.status_code == 401
+        db.get.assert_not_called()
+
+
+class TestRoleDependencies:
+    """Role guards are cached so routes share one dependency callable."""
+
+    def test_require_role_is_cached(self):
+        from app.core.security import require_role
+
+        assert require_role("admin") is require_role("admin")
+        assert require_role("admin") is not require_role("manager")
+
+    def test_require_any_role_ignores_argument_order(self):
+        from app.core.security import require_any_role
+
+        checker = require_any_role("admin", "manager")
+        assert checker is require_any_role("admin", "manager")
+        assert checker is require_any_role("manager", "admin")
+        assert checker is not require_any_role("admin")
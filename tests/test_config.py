@@ -0,0 +1,50 @@
+"""
+Tests for application settings (app.core.config).
+"""
+import subprocess
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings, get_settings
+
+
+class TestSettings:
+    """Tests for the Settings loader."""
+
+    def test_get_settings_is_cached(self):
+        assert get_settings() is get_settings()
+
+    def test_legacy_module_reexports_core_settings(self):
+        from app.config import settings
+
+        assert settings is get_settings()
+
+    def test_comma_separated_origins_parsed_to_tuple(self):
+        settings = Settings(ALLOWED_ORIGINS="http://a, http://b")
+        assert settings.ALLOWED_ORIGINS == ("http://a", "http://b")
+
+    def test_settings_are_frozen(self):
+        with pytest.raises(ValidationError):
+            get_settings().DEBUG = True
+
+    def test_extensions_normalized_to_frozenset(self):
+        settings = Settings(ALLOWED_EXTENSIONS="mpp, .XML")
+        assert settings.ALLOWED_EXTENSIONS == frozenset({".mpp", ".xml"})
+
+    def test_config_import_skips_security_and_database(self):
+        code = (
+            "import sys, app.core.config; "
+            "print('app.core.security' in sys.modules, 'sqlalchemy' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False False"
+
+    def test_lazy_core_exports(self):
+        import app.core
+        from app.core.security import verify_password
+
+        assert app.core.verify_password is verify_password
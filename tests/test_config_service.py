@@ -144,3 +144,120 @@ class TestConfigService:
 
         assert mock_item.is_active is False
         mock_db.commit.assert_called_once()
+
+
+class TestConfigCache:
+    """Tests for the in-process lookup table cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from app.services.config_cache import config_cache
+
+        config_cache.clear()
+        yield
+        config_cache.clear()
+
+    def test_table_loaded_once(self, db):
+        from decimal import Decimal
+
+        from app.models.database.config_tables import ProbabilityLevel
+        from app.services.config_cache import config_cache
+
+        db.add(ProbabilityLevel(code="M", description="Medium", weight=Decimal("0.5")))
+        db.commit()
+
+        with patch.object(db, "scalars", wraps=db.scalars) as scalars:
+            first = config_cache.get(db, ProbabilityLevel, "M")
+            second = config_cache.get(db, ProbabilityLevel, "M")
+            missing = config_cache.get(db, ProbabilityLevel, "X")
+
+        assert first is second
+        assert first.weight == Decimal("0.5")
+        assert missing is None
+        scalars.assert_called_once()
+
+    def test_write_invalidates_table(self, db):
+        from app.models.database.config_tables import Region
+        from app.services.config_cache import config_cache
+
+        region = Region(code="NA", description="North America")
+        db.add(region)
+        db.commit()
+        assert config_cache.get(db, Region, "NA").description == "North America"
+
+        ConfigService(Region, db).update(region.id, {"description": "Americas"})
+
+        assert config_cache.get(db, Region, "NA").description == "Americas"
+
+    def test_listing_rendered_once_per_version(self, db):
+        import json
+
+        from app.models.database.config_tables import Region
+
+        region = Region(code="NA", description="North America")
+        db.add(region)
+        db.commit()
+        service = ConfigService(Region, db)
+
+        with patch.object(db, "scalars", wraps=db.scalars) as scalars:
+            first = service.get_listing_json()
+            second = service.get_listing_json()
+        scalars.assert_called_once()
+        assert first is second
+        assert json.loads(first)["items"][0]["description"] == "North America"
+
+        service.update(region.id, {"description": "Americas"})
+
+        listing = json.loads(service.get_listing_json())
+        assert listing["total"] == 1
+        assert listing["items"][0]["description"] == "Americas"
+
+    def test_uncommitted_rows_never_cached(self, db):
+        from app.models.database.config_tables import Region
+        from app.services.config_cache import config_cache
+
+        db.add(Region(code="NA", description="North America"))
+        db.flush()
+        assert config_cache.get(db, Region, "NA").description == "North America"
+        db.rollback()
+
+        assert config_cache.get(db, Region, "NA") is None
+
+    def test_flushed_write_invalidates_only_on_commit(self, db):
+        from app.models.database.config_tables import Region
+        from app.services.config_cache import config_cache
+
+        region = Region(code="NA", description="North America")
+        db.add(region)
+        db.commit()
+        assert config_cache.get(db, Region, "NA").description == "North America"
+
+        region.description = "Americas"
+        db.flush()
+        # The writing session sees its own flush without it being cached
+        assert config_cache.get(db, Region, "NA").description == "Americas"
+        db.rollback()
+        assert config_cache.get(db, Region, "NA").description == "North America"
+
+        region.description = "Americas"
+        db.commit()
+        assert config_cache.get(db, Region, "NA").description == "Americas"
+
+    def test_uncommitted_listing_never_cached(self, db):
+        import json
+
+        from app.models.database.config_tables import Region
+
+        region = Region(code="NA", description="North America")
+        db.add(region)
+        db.commit()
+        service = ConfigService(Region, db)
+
+        region.description = "Americas"
+        db.flush()
+        pending = json.loads(service.get_listing_json())
+        db.rollback()
+        committed = json.loads(service.get_listing_json())
+
+        assert pending["items"][0]["description"] == "Americas"
+        assert committed["items"][0]["description"] == "North America"
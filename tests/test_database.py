@@ -0,0 +1,388 @@
+"""
+Tests for engine and session management (app.core.database).
+"""
+import os
+import time
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import Column, LargeBinary, MetaData, Table, text
+from sqlalchemy.dialects.postgresql import psycopg2
+from sqlalchemy.exc import DisconnectionError, IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.database import (
+    _copy_field,
+    _ping_if_stale,
+    _reset_engine_after_fork,
+    bulk_insert_copy,
+    get_db,
+    get_engine,
+    get_scoped_session,
+    get_sessionmaker,
+    insert_in_batches,
+    request_scope,
+)
+from app.models.database.config_tables import Region
+from app.models.database.types import BasisPoints, Cents, StringArray, Weight
+
+
+class TestEngineFactory:
+    """Tests for the lazily built, cached engine."""
+
+    def test_engine_is_cached(self):
+        assert get_engine() is get_engine()
+
+    def test_compiled_cache_sized_from_settings(self):
+        from app.core.config import settings
+
+        assert get_engine()._compiled_cache.capacity == settings.DB_QUERY_CACHE_SIZE
+
+    def test_insert_page_size_from_settings(self):
+        from app.core.config import settings
+
+        page_size = get_engine().dialect.insertmanyvalues_page_size
+        assert page_size == settings.DB_INSERT_PAGE_SIZE
+
+    def test_json_columns_serialized_with_orjson(self):
+        from datetime import datetime
+        from decimal import Decimal
+
+        from app.core.database import json_dumps
+
+        assert get_engine().dialect._json_serializer is json_dumps
+        assert json_dumps({"cost": Decimal("1.50"), "at": datetime(2024, 1, 2)}) == (
+            '{"cost":"1.50","at":"2024-01-02T00:00:00"}'
+        )
+
+    def test_sessionmaker_bound_to_cached_engine(self):
+        assert get_sessionmaker().kw["bind"] is get_engine()
+
+    def test_reset_after_fork_builds_new_engine(self):
+        before = get_engine()
+        _reset_engine_after_fork()
+        after = get_engine()
+        assert after is not before
+        assert get_sessionmaker().kw["bind"] is after
+
+
+class TestStalePing:
+    """Tests for the throttled checkout ping."""
+
+    def _record(self, last_ping):
+        record = MagicMock()
+        record.info = {"last_ping": last_ping}
+        return record
+
+    def test_recent_connection_not_pinged(self):
+        dbapi_connection = MagicMock()
+        _ping_if_stale(dbapi_connection, self._record(time.monotonic()), None)
+        dbapi_connection.cursor.assert_not_called()
+
+    def test_stale_connection_pinged(self):
+        dbapi_connection = MagicMock()
+        record = self._record(float("-inf"))
+        _ping_if_stale(dbapi_connection, record, None)
+        dbapi_connection.cursor.return_value.execute.assert_called_once_with("SELECT 1")
+        assert record.info["last_ping"] != float("-inf")
+
+    def test_failed_ping_raises_disconnection(self):
+        dbapi_connection = MagicMock()
+        dbapi_connection.cursor.return_value.execute.side_effect = OSError("gone")
+        with pytest.raises(DisconnectionError):
+            _ping_if_stale(dbapi_connection, self._record(float("-inf")), None)
+
+
+class TestScopedSession:
+    """Tests for the request-scoped session registry."""
+
+    def test_same_session_within_a_request(self):
+        token = request_scope.set("req-1")
+        try:
+            registry = get_scoped_session()
+            assert registry() is registry()
+        finally:
+            get_scoped_session().remove()
+            request_scope.reset(token)
+
+    def test_requests_get_distinct_sessions(self):
+        registry = get_scoped_session()
+        sessions = []
+        for scope in ("req-1", "req-2"):
+            token = request_scope.set(scope)
+            try:
+                sessions.append(registry())
+                registry.remove()
+            finally:
+                request_scope.reset(token)
+        assert sessions[0] is not sessions[1]
+
+    def test_get_db_releases_session(self):
+        token = request_scope.set("req-3")
+        try:
+            gen = get_db()
+            session = next(gen)
+            gen.close()
+            assert get_scoped_session()() is not session
+        finally:
+            get_scoped_session().remove()
+            request_scope.reset(token)
+
+
+class TestInsertInBatches:
+    """Tests for the batched bulk insert helper."""
+
+    def test_inserts_all_rows_across_batches(self, db):
+        rows = [
+            {"code": f"R{i}", "description": f"Region {i}", "is_active": True}
+            for i in range(5)
+        ]
+        insert_in_batches(db, Region, rows, batch_size=2)
+        db.commit()
+        assert db.query(Region).count() == 5
+
+
+class TestTempStaging:
+    """Bulk-load staging tables live only as long as their transaction."""
+
+    def test_staging_table_dropped_on_exit(self, db):
+        from sqlalchemy import insert, select, text
+
+        from app.core.database import temp_staging
+        from app.models.database.wbs import WBS
+
+        with temp_staging(db, WBS.__table__) as staging:
+            db.execute(insert(staging), [{"project_id": 1, "wbs_title": "T"}])
+            assert db.scalar(select(staging.c.wbs_title)) == "T"
+
+        # PostgreSQL also drops it at COMMIT if a failed load skipped the exit
+        assert staging.dialect_options["postgresql"]["on_commit"] == "DROP"
+        db.commit()
+        assert db.scalar(text("SELECT count(*) FROM sqlite_temp_master")) == 0
+
+
+class TestBulkInsertCopy:
+    """Tests for the COPY-based bulk insert helper."""
+
+    def test_small_batch_falls_back_to_insert(self, db):
+        from app.models.database.audit_log import AuditLog
+
+        rows = [
+            {"action": "CREATE", "entity_type": "Project", "new_values": {"n": i}}
+            for i in range(3)
+        ]
+        bulk_insert_copy(db, AuditLog, rows)
+        db.commit()
+        assert db.query(AuditLog).count() == 3
+
+    def _psycopg2_session(self):
+        db = MagicMock()
+        connection = db.connection.return_value
+        connection.dialect = psycopg2.dialect()
+        return db, connection.connection.cursor.return_value
+
+    def test_large_batch_streams_copy_on_psycopg2(self):
+        from app.models.database.assignment import ResourceAssignment
+
+        db, cursor = self._psycopg2_session()
+        rows = [
+            {"wbs_id": 1, "resource_code": "ENG", "best_estimate": Decimal("1.50")}
+        ] * 2
+
+        bulk_insert_copy(db, ResourceAssignment, rows, threshold=2)
+
+        sql, buffer = cursor.copy_expert.call_args.args
+        assert sql.startswith(
+            "COPY resource_assignments (wbs_id, resource_code, best_estimate, "
+        )
+        assert "supplier_code" not in sql
+        first_line = buffer.getvalue().splitlines()[0].split("\t")
+        assert first_line[:3] == ["1", "ENG", "150"]  # Cents bound to cents
+        assert len(buffer.getvalue().splitlines()) == 2
+        db.execute.assert_not_called()
+
+    def test_array_enum_and_bool_rendered_for_copy(self):
+        from app.models.database.user import User, UserRole
+
+        db, cursor = self._psycopg2_session()
+        rows = [
+            {
+                "email": "a@example.com",
+                "username": "a",
+                "hashed_password": "x",
+                "role": UserRole.ADMIN,
+                "is_active": False,
+            }
+        ]
+        bulk_insert_copy(db, User, rows, threshold=1)
+        sql, buffer = cursor.copy_expert.call_args.args
+        names = sql[sql.index("(") + 1 : sql.index(")")].split(", ")
+        fields = dict(zip(names, buffer.getvalue().rstrip("\n").split("\t")))
+        assert fields["role"] == "ADMIN"
+        assert fields["is_active"] == "f"
+
+        staging = Table("staging", MetaData(), Column("resource_names", StringArray))
+        bulk_insert_copy(
+            db, staging, [{"resource_names": ["Eng, Sr", 'say "hi"', None]}], 1
+        )
+        _, buffer = cursor.copy_expert.call_args.args
+        assert buffer.getvalue() == '{"Eng, Sr","say \\\\"hi\\\\"",NULL}\n'
+
+    def test_unrenderable_column_type_falls_back_to_insert(self):
+        db, cursor = self._psycopg2_session()
+        table = Table("blobs", MetaData(), Column("data", LargeBinary))
+
+        bulk_insert_copy(db, table, [{"data": b"x"}], threshold=1)
+
+        cursor.copy_expert.assert_not_called()
+        db.execute.assert_called_once()
+
+    def test_copy_field_escapes_text_format(self):
+        assert _copy_field(None) == "\\N"
+        assert _copy_field("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+
+    @pytest.mark.integration
+    @pytest.mark.skipif(
+        not os.environ.get("TEST_POSTGRES_URL"), reason="needs TEST_POSTGRES_URL"
+    )
+    def test_copy_into_temp_staging_on_postgres(self):
+        from sqlalchemy import create_engine, select
+
+        from app.core.database import temp_staging
+        from app.models.database.wbs import WBS
+
+        engine = create_engine(os.environ["TEST_POSTGRES_URL"])
+        rows = [
+            {
+                "project_id": 1,
+                "wbs_title": f"Task\t{i}",
+                "cost": Decimal("12.34"),
+                "is_summary": i % 2 == 0,
+                "resource_names": ["Eng, Sr", 'say "hi"'],
+            }
+            for i in range(3)
+        ]
+        with Session(engine) as session:
+            with temp_staging(session, WBS.__table__) as staging:
+                bulk_insert_copy(session, staging, rows, threshold=1)
+                loaded = session.execute(
+                    select(
+                        staging.c.wbs_title,
+                        staging.c.cost,
+                        staging.c.is_summary,
+                        staging.c.resource_names,
+                    ).order_by(staging.c.wbs_title)
+                ).all()
+            session.rollback()
+        engine.dispose()
+        assert loaded[0] == ("Task\t0", Decimal("12.34"), True, ["Eng, Sr", 'say "hi"'])
+        assert [row.is_summary for row in loaded] == [True, False, True]
+
+
+class TestCents:
+    """Tests for the BIGINT cents money column type."""
+
+    def test_bind_converts_to_integer_cents(self):
+        assert Cents().process_bind_param(Decimal("12.34"), None) == 1234
+        assert Cents().process_bind_param(0.1, None) == 10
+        assert Cents().process_bind_param(Decimal("0.005"), None) == 1
+
+    def test_result_converts_to_decimal(self):
+        assert Cents().process_result_value(1234, None) == Decimal("12.34")
+
+    def test_none_passes_through(self):
+        assert Cents().process_bind_param(None, None) is None
+        assert Cents().process_result_value(None, None) is None
+
+
+class TestBasisPoints:
+    """Tests for the SMALLINT basis-point percentage column type."""
+
+    def test_round_trip(self):
+        assert BasisPoints().process_bind_param(Decimal("12.50"), None) == 1250
+        assert BasisPoints().process_result_value(1250, None) == Decimal("12.50")
+
+    def test_percentage_above_100_rejected(self, db):
+        from app.models.database.assignment import ResourceAssignment
+
+        db.add(ResourceAssignment(wbs_id=1, resource_code="R", duty_pct="100.01"))
+        with pytest.raises(IntegrityError, match="ck_ra_duty_pct"):
+            db.commit()
+
+
+class TestWeight:
+    """Tests for the SMALLINT hundredths weight column type."""
+
+    def test_round_trip(self):
+        assert Weight().process_bind_param(Decimal("0.05"), None) == 5
+        assert Weight().process_result_value(5, None) == Decimal("0.05")
+
+    def test_stored_as_smallint(self, db):
+        from app.models.database.config_tables import SeverityLevel
+
+        db.add(SeverityLevel(code="MAJOR", description="Major", weight="0.5"))
+        db.commit()
+        db.expire_all()
+        assert db.query(SeverityLevel).one().weight == Decimal("0.50")
+        raw = db.execute(text("SELECT weight FROM severity_levels")).scalar()
+        assert raw == 50
+
+    def test_negative_weight_rejected(self, db):
+        from app.models.database.config_tables import SeverityLevel
+
+        db.add(SeverityLevel(code="BAD", description="Bad", weight="-0.5"))
+        with pytest.raises(IntegrityError):
+            db.commit()
+
+
+class TestModelRepr:
+    """Model reprs come from ``__repr_fields__`` and never touch the database."""
+
+    def test_renders_declared_fields(self):
+        from app.models.database.config_tables import SeverityLevel
+
+        level = SeverityLevel(code="MAJOR", weight=Decimal("0.5"))
+        assert repr(level) == "<SeverityLevel(code='MAJOR', weight=Decimal('0.5'))>"
+
+    def test_expired_instance_does_not_load(self, db):
+        from app.models.database.project import Project
+
+        project = Project(project_name="P")
+        db.add(project)
+        db.commit()
+
+        assert repr(project) == "<Project(id=?, project_name=?)>"
+        assert "id" not in project.__dict__
+
+
+class TestEagerDefaults:
+    """Server-generated columns come back with the INSERT itself."""
+
+    def test_flush_loads_server_defaults(self, db):
+        from app.models.database.project import Project
+
+        project = Project(project_name="P")
+        db.add(project)
+        db.flush()
+
+        assert project.__dict__["created_at"] is not None
+        assert project.__dict__["updated_at"] is not None
+
+
+class TestModelRegistry:
+    """Every table is mapped by exactly one class."""
+
+    def test_each_table_mapped_once(self):
+        import app.models.database  # noqa: F401
+        import app.models.project  # noqa: F401
+        from app.core.database import Base
+
+        tables = [mapper.local_table.name for mapper in Base.registry.mappers]
+        assert len(tables) == len(set(tables))
+
+    def test_legacy_project_module_reexports_canonical_model(self):
+        from app.models.database.project import Project
+        from app.models.project import Project as LegacyProject
+
+        assert LegacyProject is Project
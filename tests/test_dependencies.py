@@ -0,0 +1,41 @@
+"""
+Tests for shared endpoint dependencies (app.core.dependencies).
+"""
+import dataclasses
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.dependencies import Pagination, get_pagination_params
+
+
+class TestPaginationParams:
+    """Tests for get_pagination_params."""
+
+    @pytest.mark.asyncio
+    async def test_valid_window(self):
+        assert await get_pagination_params(skip=10, limit=50) == Pagination(10, 50)
+
+    @pytest.mark.asyncio
+    async def test_limit_at_max_allowed(self):
+        page = await get_pagination_params(limit=1000)
+        assert page.limit == 1000
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "skip,limit,detail",
+        [
+            (-1, 10, "Skip value must be non-negative"),
+            (0, 0, "Limit value must be positive"),
+            (0, 1001, "Limit value cannot exceed 1000"),
+        ],
+    )
+    async def test_invalid_window_rejected(self, skip, limit, detail):
+        with pytest.raises(HTTPException) as exc_info:
+            await get_pagination_params(skip=skip, limit=limit)
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == detail
+
+    def test_pagination_is_frozen(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            Pagination(0, 10).skip = 5
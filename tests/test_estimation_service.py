@@ -75,7 +75,7 @@ class TestEstimationService:
         with patch.object(estimation_service.wbs_repo, "get", return_value=mock_wbs):
             with patch.object(
                 estimation_service.assignment_repo,
-                "get_by_wbs",
+                "get_estimates_by_wbs",
                 return_value=mock_assignments,
             ):
                 with patch.object(
@@ -140,7 +140,9 @@ class TestEstimationService:
                 return_value=mock_wbs_list,
             ):
                 with patch.object(
-                    estimation_service.assignment_repo, "get_by_wbs", return_value=[]
+                    estimation_service.assignment_repo,
+                    "get_estimate_rollup",
+                    return_value=[],
                 ):
                     with patch.object(
                         estimation_service.risk_repo, "get_by_wbs", return_value=[]
@@ -215,3 +217,24 @@ class TestEstimationService:
 
         # The correct method gives smaller uncertainty than naive addition
         assert correct_combined < wrong_combined
+
+
+class TestSummarySchemas:
+    """Estimation summaries are immutable, closed DTOs."""
+
+    def test_summary_is_frozen(self):
+        from pydantic import ValidationError
+
+        from app.models.schemas.estimation import WBSCostSummary
+
+        summary = WBSCostSummary(wbs_id=1, wbs_title="Task")
+        with pytest.raises(ValidationError):
+            summary.total_pert_estimate = 1.0
+
+    def test_summary_rejects_unknown_fields(self):
+        from pydantic import ValidationError
+
+        from app.models.schemas.estimation import CostBreakdownItem
+
+        with pytest.raises(ValidationError):
+            CostBreakdownItem(code="LAB", description="Labour", total=1.0)
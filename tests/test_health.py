@@ -0,0 +1,53 @@
+"""
+Tests for the liveness and readiness endpoints (app.main).
+"""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+
+
+class TestReadiness:
+    """Tests for the cached /ready probe."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        main._ready_cache.update(at=float("-inf"), result=None)
+        yield
+        main._ready_cache.update(at=float("-inf"), result=None)
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(main.app)
+
+    def test_ready_when_database_reachable(self, client):
+        with patch.object(main, "_ping_database") as ping, patch.object(
+            main._redis, "ping", AsyncMock(side_effect=ConnectionError)
+        ):
+            response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["checks"] == {"database": "ok", "redis": "unavailable"}
+        ping.assert_called_once()
+
+    def test_unavailable_when_database_down(self, client):
+        with patch.object(
+            main, "_ping_database", side_effect=OSError("down")
+        ), patch.object(main._redis, "ping", AsyncMock()):
+            response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "unavailable"
+
+    def test_result_cached_between_probes(self, client):
+        with patch.object(main, "_ping_database") as ping, patch.object(
+            main._redis, "ping", AsyncMock()
+        ):
+            client.get("/ready")
+            client.get("/ready")
+        ping.assert_called_once()
+
+    def test_health_does_no_io(self, client):
+        with patch.object(main, "_ping_database") as ping:
+            assert client.get("/health").status_code == 200
+        ping.assert_not_called()
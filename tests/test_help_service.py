@@ -96,3 +96,37 @@ class TestHelpService:
             help_service.get_topics_by_category(999)
 
         assert exc_info.value.status_code == 404
+
+
+class TestHelpTopicLoading:
+    """Topic descriptions are only ever loaded explicitly."""
+
+    def test_plain_get_refuses_lazy_load(self, db):
+        from sqlalchemy.exc import InvalidRequestError
+
+        from app.models.database.help import HelpCategory, HelpTopic
+
+        category = HelpCategory(name="General")
+        db.add(category)
+        db.flush()
+        db.add(HelpTopic(category_id=category.id, title="T", content="C"))
+        db.commit()
+        db.expunge_all()
+
+        topic = db.get(HelpTopic, 1)
+        with pytest.raises(InvalidRequestError):
+            topic.descriptions
+
+    def test_created_topic_serializes_with_descriptions(self, db):
+        from app.models.database.help import HelpCategory
+        from app.models.schemas.help import HelpTopicCreate, HelpTopicResponse
+
+        category = HelpCategory(name="General")
+        db.add(category)
+        db.commit()
+
+        topic = HelpService(db).create_topic(
+            HelpTopicCreate(category_id=category.id, title="T", content="C")
+        )
+
+        assert HelpTopicResponse.model_validate(topic).descriptions == []
@@ -4,12 +4,17 @@ Tests for the import service (app.services.import_service).
 Uses mocked S3, parser, and database to test the import lifecycle.
 """
 from datetime import datetime
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError, OperationalError
 
 from app.models.database.import_job import ImportJob, ImportStatus
 from app.models.database.project import Project, ProjectStatus
+from app.models.database.user import User
+from app.models.database.wbs import WBS
 from app.services.import_service import ImportService
 from app.services.mpp_parser import (
     ParsedAssignment,
@@ -137,8 +142,8 @@ class TestImportServiceProcessImport:
             b"fake file contents", "test.mpp"
         )
 
-        # Verify old WBS items were deleted
-        service.wbs_repo.delete_by_project.assert_called_once_with(1)
+        # Existing WBS items are upserted in place, not wiped first
+        service.wbs_repo.delete_by_project.assert_not_called()
 
         # Verify project was updated with metadata
         project_update_calls = service.project_repo.update.call_args_list
@@ -149,6 +154,16 @@ class TestImportServiceProcessImport:
         assert update_data["task_count"] == 2
         assert update_data["resource_count"] == 1
 
+        # One job update per phase, with the counters carried on them
+        job_updates = [call[0][1] for call in service.import_repo.update.call_args_list]
+        assert [u["status"] for u in job_updates] == [
+            ImportStatus.PARSING,
+            ImportStatus.CREATING_RECORDS,
+            ImportStatus.COMPLETED,
+        ]
+        assert job_updates[1]["rows_total"] == 2
+        assert job_updates[2]["rows_processed"] == 2
+
     def test_process_import_job_not_found(self, service):
         """Test that missing job is handled gracefully."""
         service.import_repo.get.return_value = None
@@ -212,6 +227,30 @@ class TestImportServiceProcessImport:
         last_project_update = project_update_calls[-1]
         assert last_project_update[0][1]["status"] == ProjectStatus.IMPORT_FAILED
 
+    @patch("app.services.import_service.MPPParser")
+    def test_process_import_rolls_back_before_failing_job(
+        self, MockParser, service, mock_db
+    ):
+        """A failed staging upsert is rolled back before the job is marked failed."""
+        job = self._make_job()
+        service.import_repo.get.return_value = job
+        service.project_repo.get.return_value = self._make_project()
+        service._download_from_s3 = MagicMock(return_value=b"fake mpp")
+        MockParser.return_value.parse.return_value = self._make_parsed_project()
+        service._create_wbs_records = MagicMock(
+            side_effect=OperationalError("INSERT INTO wbs", {}, Exception("aborted"))
+        )
+
+        calls = []
+        mock_db.rollback.side_effect = lambda: calls.append("rollback")
+        service.import_repo.update.side_effect = lambda job, data: calls.append(
+            data["status"]
+        )
+
+        service.process_import(job.id)
+
+        assert calls[-2:] == ["rollback", ImportStatus.FAILED]
+
 
 class TestImportServiceStatus:
     """Test status query methods."""
@@ -239,3 +278,161 @@ class TestImportServiceStatus:
         service.import_repo.get_by_project.return_value = mock_jobs
         result = service.get_project_imports(1)
         assert len(result) == 2
+
+
+class TestCreateWBSRecords:
+    """WBS rows are staged, copied and parent-linked in bulk."""
+
+    def test_tasks_inserted_with_parent_links(self, db):
+        project = Project(project_name="P")
+        db.add(project)
+        db.commit()
+        service = ImportService(db)
+        service.import_repo = MagicMock()
+        parsed = ParsedProject(
+            name="P",
+            tasks=[
+                ParsedTask(unique_id=1, name="Summary", outline_level=0, cost=12.5),
+                ParsedTask(
+                    unique_id=2, name="Child", outline_level=1, parent_unique_id=1
+                ),
+            ],
+        )
+
+        service._create_wbs_records(MagicMock(), project, parsed)
+
+        summary, child = db.query(WBS).order_by(WBS.task_unique_id).all()
+        assert child.parent_id == summary.id
+        assert summary.parent_id is None
+        assert summary.wbs_path == f"/{summary.id}/"
+        assert child.wbs_path == f"/{summary.id}/{child.id}/"
+        assert summary.cost == Decimal("12.50")
+        assert db.scalar(text("SELECT count(*) FROM sqlite_temp_master")) == 0
+
+    def test_reimport_updates_rows_in_place(self, db):
+        project = Project(project_name="P")
+        db.add(project)
+        db.commit()
+        service = ImportService(db)
+        service.import_repo = MagicMock()
+        first = ParsedProject(
+            name="P",
+            tasks=[
+                ParsedTask(unique_id=1, name="Summary", outline_level=0),
+                ParsedTask(
+                    unique_id=2, name="Child", outline_level=1, parent_unique_id=1
+                ),
+                ParsedTask(unique_id=3, name="Dropped", outline_level=0),
+            ],
+        )
+        service._create_wbs_records(MagicMock(), project, first)
+        ids = dict(db.execute(select(WBS.task_unique_id, WBS.id)).all())
+
+        second = ParsedProject(
+            name="P",
+            tasks=[
+                ParsedTask(unique_id=1, name="Summary", outline_level=0),
+                ParsedTask(unique_id=2, name="Renamed", outline_level=0),
+            ],
+        )
+        service._create_wbs_records(MagicMock(), project, second)
+        db.expire_all()
+
+        summary, child = db.query(WBS).order_by(WBS.task_unique_id).all()
+        assert (summary.id, child.id) == (ids[1], ids[2])
+        assert child.wbs_title == "Renamed"
+        assert child.parent_id is None
+        assert child.wbs_path == f"/{child.id}/"
+
+    def test_task_unique_id_unique_per_project(self, db):
+        project = Project(project_name="P")
+        db.add(project)
+        db.flush()
+        db.add_all(
+            [
+                WBS(project_id=project.id, wbs_title="A", task_unique_id=None),
+                WBS(project_id=project.id, wbs_title="B", task_unique_id=None),
+                WBS(project_id=project.id, wbs_title="C", task_unique_id=7),
+            ]
+        )
+        db.flush()
+        db.add(WBS(project_id=project.id, wbs_title="D", task_unique_id=7))
+        with pytest.raises(IntegrityError):
+            db.flush()
+
+
+class TestStatusColumns:
+    """Status enums are stored as CHECK-constrained SMALLINT positions."""
+
+    def test_statuses_persist_as_positions(self, db):
+        user = User(email="a@example.com", username="a", hashed_password="x")
+        project = Project(project_name="P", status=ProjectStatus.IMPORTING)
+        db.add_all([user, project])
+        db.flush()
+        db.add(ImportJob(project_id=project.id, user_id=user.id, filename="p.mpp"))
+        db.commit()
+
+        assert db.scalar(text("SELECT status FROM projects")) == 1
+        assert db.scalar(text("SELECT status FROM import_jobs")) == 0
+        assert db.get(Project, project.id).status is ProjectStatus.IMPORTING
+
+    def test_filters_accept_members_and_values(self, db):
+        db.add(Project(project_name="P", status=ProjectStatus.ARCHIVED))
+        db.commit()
+
+        assert db.query(Project).filter(Project.status == "archived").count() == 1
+        assert (
+            db.query(Project).filter(Project.status == ProjectStatus.DRAFT).count()
+            == 0
+        )
+
+    def test_unknown_status_rejected(self, db):
+        with pytest.raises(IntegrityError):
+            db.execute(
+                text(
+                    "INSERT INTO projects "
+                    "(project_name, archived, status, created_at, updated_at) "
+                    "VALUES ('P', 0, 6, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                )
+            )
+
+
+class TestImportProgress:
+    """Progress is derived from the row counters."""
+
+    def _job(self, db, **fields):
+        user = User(email="a@example.com", username="a", hashed_password="x")
+        project = Project(project_name="P")
+        db.add_all([user, project])
+        db.flush()
+        job = ImportJob(
+            project_id=project.id, user_id=user.id, filename="p.mpp", **fields
+        )
+        db.add(job)
+        db.commit()
+        return job
+
+    def test_progress_from_counters(self, db):
+        job = self._job(db, rows_processed=25, rows_total=100)
+
+        assert job.progress == 25.0
+        assert db.scalar(select(ImportJob.progress)) == 25.0
+
+    def test_unknown_total_and_completed(self, db):
+        job = self._job(db)
+        assert job.progress == 0.0
+        assert db.scalar(select(ImportJob.progress)) == 0.0
+
+        job.status = ImportStatus.COMPLETED
+        db.commit()
+        assert job.progress == 100.0
+        assert db.scalar(select(ImportJob.progress)) == 100.0
+
+    def test_failed_job_stamped_by_database_clock(self, db):
+        job = self._job(db)
+
+        ImportService(db)._fail_job(job, "boom")
+
+        assert job.status == ImportStatus.FAILED
+        assert job.completed_at is not None
+        assert job.completed_at >= job.created_at
@@ -0,0 +1,99 @@
+"""
+Tests for structured logging (app.logging_config).
+"""
+import json
+import logging
+import logging.handlers
+from unittest.mock import patch
+
+from app.logging_config import JSONFormatter
+
+
+class TestJSONFormatter:
+    """Tests for JSONFormatter."""
+
+    def _record(self, msg, args=()):
+        record = logging.LogRecord("icepac", logging.INFO, "mod.py", 7, msg, args, None)
+        record.created = 1767225600.25  # 2026-01-01T00:00:00.25Z
+        return record
+
+    def test_fields_and_timestamp(self):
+        data = json.loads(JSONFormatter().format(self._record("hello %s", ("x",))))
+        assert data["timestamp"] == "2026-01-01T00:00:00.250000"
+        assert data["message"] == "hello x"
+        assert data["level"] == "INFO"
+        assert data["line"] == 7
+
+    def test_message_without_args_not_interpolated(self):
+        data = json.loads(JSONFormatter().format(self._record("100% done")))
+        assert data["message"] == "100% done"
+
+    def test_extra_fields_merged(self):
+        record = self._record("hi")
+        record.extra_fields = {"request_id": "abc", "when": object()}
+        data = json.loads(JSONFormatter().format(record))
+        assert data["request_id"] == "abc"
+        assert data["when"].startswith("<object")
+
+
+class TestSetupLogging:
+    """Tests for the queued logging setup."""
+
+    def test_records_written_by_listener(self, capsys):
+        from app import logging_config
+        from app.logging_config import setup_logging, start_logging, stop_logging
+
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        saved_listener = logging_config._listener
+        saved_running = logging_config._listener_running
+        try:
+            setup_logging("INFO", log_format="%(levelname)s:%(message)s")
+            assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+            logging.getLogger("icepac.test").info("queued %d", 1)
+            stop_logging()
+            assert "INFO:queued 1" in capsys.readouterr().out
+        finally:
+            root.handlers, root.level = saved_handlers, saved_level
+            # setup_logging() stopped the saved listener; start it again
+            logging_config._listener = saved_listener
+            logging_config._listener_running = False
+            if saved_running:
+                start_logging()
+
+    def test_exception_kept_as_separate_field(self, capsys):
+        from app import logging_config
+        from app.logging_config import setup_logging, start_logging, stop_logging
+
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        saved_listener = logging_config._listener
+        saved_running = logging_config._listener_running
+        try:
+            setup_logging("INFO", json_format=True)
+            try:
+                1 / 0
+            except ZeroDivisionError:
+                logging.getLogger("icepac.test").exception("boom")
+            stop_logging()
+            data = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+            assert data["message"] == "boom"
+            assert "ZeroDivisionError" in data["exception"]
+        finally:
+            root.handlers, root.level = saved_handlers, saved_level
+            logging_config._listener = saved_listener
+            logging_config._listener_running = False
+            if saved_running:
+                start_logging()
+
+
+class TestJSONFormatterTimestamp:
+    """Tests for the cached whole-second timestamp."""
+
+    def test_second_prefix_reused_and_refreshed(self):
+        formatter = JSONFormatter()
+        assert formatter._timestamp(1767225600.5) == "2026-01-01T00:00:00.500000"
+        with patch("app.logging_config.time.strftime") as strftime:
+            assert formatter._timestamp(1767225600.75).endswith(".750000")
+        strftime.assert_not_called()
+        assert formatter._timestamp(1767225601.0) == "2026-01-01T00:00:01.000000"
@@ -0,0 +1,35 @@
+"""
+Tests for periodic maintenance tasks.
+"""
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from app.tasks.maintenance_tasks import (
+    AUDIT_PARTITIONS_AHEAD,
+    _add_months,
+    ensure_audit_partitions,
+)
+
+
+class TestEnsureAuditPartitions:
+    """Tests for the audit_logs partition maintenance task."""
+
+    def test_add_months_rolls_over_year(self):
+        assert _add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+
+    def test_ensures_current_and_upcoming_months(self):
+        db = MagicMock()
+        with patch("app.core.database.get_sessionmaker", return_value=lambda: db):
+            count = ensure_audit_partitions()
+
+        assert count == AUDIT_PARTITIONS_AHEAD + 1
+        params = db.execute.call_args.args[1]
+        assert params[0]["month"] == date.today().replace(day=1)
+        db.commit.assert_called_once()
+        db.close.assert_called_once()
+
+    def test_scheduled_by_beat(self):
+        from app.tasks import celery_app
+
+        tasks = {entry["task"] for entry in celery_app.conf.beat_schedule.values()}
+        assert "tasks.ensure_audit_partitions" in tasks
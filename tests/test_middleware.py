@@ -0,0 +1,63 @@
+"""
+Tests for the ASGI middleware stack (app.middleware).
+"""
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.database import request_scope
+from app.middleware.db_session import DBSessionScopeMiddleware
+from app.middleware.error_handler import ErrorHandlerMiddleware
+from app.middleware.request_logging import RequestLoggingMiddleware
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok():
+        return {"scope": request_scope.get()}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    app.add_middleware(DBSessionScopeMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(ErrorHandlerMiddleware)
+    return app
+
+
+class TestMiddleware:
+    """Tests for the pure ASGI middlewares."""
+
+    def test_request_gets_its_own_db_scope(self):
+        client = TestClient(_make_app())
+        first = client.get("/ok").json()["scope"]
+        second = client.get("/ok").json()["scope"]
+        assert first and second and first != second
+
+    def test_request_logged_with_status(self, caplog):
+        client = TestClient(_make_app())
+        with caplog.at_level(logging.INFO, logger="app.middleware.request_logging"):
+            client.get("/ok")
+        assert "GET /ok 200" in caplog.text
+
+    def test_unhandled_exception_returns_500(self):
+        client = TestClient(_make_app(), raise_server_exceptions=False)
+        response = client.get("/boom")
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Internal server error", "path": "/boom"}
+
+    def test_application_stack_registered_once_in_order(self):
+        from fastapi.middleware.cors import CORSMiddleware
+
+        from app.main import app
+
+        assert [m.cls for m in app.user_middleware] == [
+            CORSMiddleware,
+            ErrorHandlerMiddleware,
+            RequestLoggingMiddleware,
+            DBSessionScopeMiddleware,
+        ]
@@ -0,0 +1,52 @@
+"""
+Tests for Alembic migration helpers.
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+VERSIONS = Path(__file__).resolve().parent.parent / "alembic" / "versions"
+
+
+def _load_migration(filename):
+    spec = importlib.util.spec_from_file_location(
+        filename.removesuffix(".py"), VERSIONS / filename
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def admin_tables():
+    return _load_migration("002_admin_tables.py")
+
+
+class TestSeedTables:
+    """Seed INSERTs must render in offline (--sql) mode."""
+
+    def test_seed_inserts_compile_with_literal_binds(self, admin_tables):
+        for table_name, columns, rows in admin_tables.SEEDS:
+            table = admin_tables._seed_table(table_name, columns)
+            stmt = sa.insert(table).values([dict(zip(columns, row)) for row in rows])
+            sql = str(
+                stmt.compile(
+                    dialect=postgresql.dialect(),
+                    compile_kwargs={"literal_binds": True},
+                )
+            )
+            assert sql.startswith(f"INSERT INTO {table_name}")
+
+    def test_weighted_row_renders_typed_literals(self, admin_tables):
+        columns = admin_tables.WEIGHTED_COLUMNS
+        table = admin_tables._seed_table("pmb_weights", columns)
+        stmt = sa.insert(table).values(dict(zip(columns, ("LOW", "Low", 25, True))))
+        sql = str(
+            stmt.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+        assert "'LOW', 'Low', 25, true" in sql
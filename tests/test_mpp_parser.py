@@ -47,7 +47,7 @@ class TestParsedDataclasses:
             is_milestone=False,
             is_summary=True,
             is_critical=True,
-            resource_names="Alice, Bob",
+            resource_names=["Alice", "Bob"],
             notes="Important phase",
         )
         assert task.wbs_code == "1.2"
@@ -55,7 +55,7 @@ class TestParsedDataclasses:
         assert task.parent_unique_id == 3
         assert task.is_summary is True
         assert task.is_critical is True
-        assert task.resource_names == "Alice, Bob"
+        assert task.resource_names == ["Alice", "Bob"]
 
     def test_parsed_resource_defaults(self):
         resource = ParsedResource(unique_id=1, name="Engineer")
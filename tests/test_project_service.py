@@ -1,102 +1,230 @@
-"""
-Tests for the project service.
-"""
-from unittest.mock import MagicMock, patch
-
-import pytest
-from fastapi import HTTPException
-from sqlalchemy.orm import Session
-
-from app.services.project_service import ProjectService
-
-
-class TestProjectService:
-    """Tests for ProjectService class."""
-
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        return MagicMock(spec=Session)
-
-    @pytest.fixture
-    def project_service(self, mock_db):
-        """Create a ProjectService instance with mocked DB."""
-        with patch("app.repositories.project_repository.Project") as mock_model:
-            service = ProjectService(mock_db)
-            service.repository.model = mock_model
-            return service
-
-    def test_get_returns_project(self, project_service, mock_db):
-        """Test that get returns a project when found."""
-        mock_project = MagicMock()
-        mock_project.id = 1
-        mock_project.is_archived = False
-        mock_db.get.return_value = mock_project
-
-        result = project_service.get(1)
-
-        assert result == mock_project
-
-    def test_get_returns_none_when_not_found(self, project_service, mock_db):
-        """Test that get returns None when project not found."""
-        mock_db.get.return_value = None
-
-        result = project_service.get(999)
-
-        assert result is None
-
-    def test_get_or_404_raises_when_not_found(self, project_service, mock_db):
-        """Test that get_or_404 raises HTTPException when not found."""
-        mock_db.get.return_value = None
-
-        with pytest.raises(HTTPException) as exc_info:
-            project_service.get_or_404(999)
-
-        assert exc_info.value.status_code == 404
-
-    def test_get_multi_with_pagination(self, project_service, mock_db):
-        """Test getting multiple projects with pagination."""
-        mock_projects = [MagicMock() for _ in range(3)]
-        mock_db.scalars.return_value.all.return_value = mock_projects
-
-        result = project_service.get_multi(skip=0, limit=10)
-
-        assert len(result) == 3
-
-    def test_count(self, project_service, mock_db):
-        """Test counting projects."""
-        mock_db.scalar.return_value = 5
-
-        result = project_service.count()
-
-        assert result == 5
-
-    def test_search(self, project_service, mock_db):
-        """Test searching projects."""
-        mock_projects = [MagicMock()]
-        mock_db.scalars.return_value.all.return_value = mock_projects
-
-        result = project_service.search("test", skip=0, limit=10)
-
-        assert len(result) == 1
-
-    def test_create(self, project_service, mock_db):
-        """Test creating a project."""
-        mock_project_in = MagicMock()
-        mock_project_in.model_dump.return_value = {"name": "Test Project"}
-
-        project_service.create(mock_project_in)
-
-        mock_db.add.assert_called_once()
-        mock_db.commit.assert_called_once()
-
-    def test_delete_archives_project(self, project_service, mock_db):
-        """Test that delete archives the project."""
-        mock_project = MagicMock()
-        mock_project.archived = False
-        mock_db.get.return_value = mock_project
-
-        project_service.delete(1)
-
-        assert mock_project.archived is True
-        mock_db.commit.assert_called_once()
+"""
+Tests for the project service.
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.services.project_service import ProjectService
+
+
+class TestProjectService:
+    """Tests for ProjectService class."""
+
+    @pytest.fixture
+    def mock_db(self):
+        """Create a mock database session."""
+        return MagicMock(spec=Session)
+
+    @pytest.fixture
+    def project_service(self, mock_db):
+        """Create a ProjectService instance with mocked DB."""
+        with patch("app.repositories.project_repository.Project") as mock_model:
+            service = ProjectService(mock_db)
+            service.repository.model = mock_model
+            return service
+
+    def test_get_returns_project(self, project_service, mock_db):
+        """Test that get returns a project when found."""
+        mock_project = MagicMock()
+        mock_project.id = 1
+        mock_project.is_archived = False
+        mock_db.get.return_value = mock_project
+
+        result = project_service.get(1)
+
+        assert result == mock_project
+
+    def test_get_returns_none_when_not_found(self, project_service, mock_db):
+        """Test that get returns None when project not found."""
+        mock_db.get.return_value = None
+
+        result = project_service.get(999)
+
+        assert result is None
+
+    def test_get_or_404_raises_when_not_found(self, project_service, mock_db):
+        """Test that get_or_404 raises HTTPException when not found."""
+        mock_db.get.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            project_service.get_or_404(999)
+
+        assert exc_info.value.status_code == 404
+
+    def test_get_multi_with_pagination(self, project_service, mock_db):
+        """Test getting multiple projects with pagination."""
+        mock_projects = [MagicMock() for _ in range(3)]
+        mock_db.scalars.return_value.all.return_value = mock_projects
+
+        result = project_service.get_multi(skip=0, limit=10)
+
+        assert len(result) == 3
+
+    def test_count(self, project_service, mock_db):
+        """Test counting projects."""
+        mock_db.scalar.return_value = 5
+
+        result = project_service.count()
+
+        assert result == 5
+
+    def test_search(self, project_service, mock_db):
+        """Test searching projects."""
+        mock_projects = [MagicMock()]
+        mock_db.scalars.return_value.all.return_value = mock_projects
+
+        result = project_service.search("test", skip=0, limit=10)
+
+        assert len(result) == 1
+
+    def test_create(self, project_service, mock_db):
+        """Test creating a project."""
+        mock_project_in = MagicMock()
+        mock_project_in.model_dump.return_value = {"name": "Test Project"}
+
+        project_service.create(mock_project_in)
+
+        mock_db.add.assert_called_once()
+        mock_db.commit.assert_called_once()
+
+    def test_delete_archives_project(self, project_service, mock_db):
+        """Test that delete archives the project."""
+        mock_project = MagicMock()
+        mock_project.archived = False
+        mock_db.get.return_value = mock_project
+
+        project_service.delete(1)
+
+        assert mock_project.archived is True
+        mock_db.commit.assert_called_once()
+
+
+class TestWBSTree:
+    """The WBS tree is loaded with a single query."""
+
+    def test_tree_serializes_without_per_item_queries(self, db):
+        from sqlalchemy import event
+
+        from app.models.database.project import Project
+        from app.models.database.wbs import WBS
+        from app.models.schemas.wbs import WBSTreeNode
+        from app.repositories.wbs_repository import WBSRepository
+
+        project = Project(project_name="P")
+        db.add(project)
+        db.flush()
+        root = WBS(project_id=project.id, wbs_title="Root")
+        db.add(root)
+        db.flush()
+        child = WBS(project_id=project.id, wbs_title="Child", parent_id=root.id)
+        db.add(child)
+        db.flush()
+        db.add(WBS(project_id=project.id, wbs_title="Leaf", parent_id=child.id))
+        db.commit()
+        project_id = project.id
+        db.expunge_all()
+
+        statements = []
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.get_bind(), "before_cursor_execute", listener)
+        try:
+            roots = WBSRepository(db).get_tree(project_id)
+            nodes = [WBSTreeNode.model_validate(r) for r in roots]
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", listener)
+
+        assert [n.wbs_title for n in nodes] == ["Root"]
+        assert nodes[0].children[0].children[0].wbs_title == "Leaf"
+        assert len(statements) == 1
+
+    def test_subtree_follows_materialized_path(self, db):
+        from app.models.database.project import Project
+        from app.repositories.wbs_repository import WBSRepository
+
+        project = Project(project_name="P")
+        db.add(project)
+        db.commit()
+        repo = WBSRepository(db)
+        root, other = repo.bulk_create(
+            [
+                {"project_id": project.id, "wbs_title": "Root"},
+                {"project_id": project.id, "wbs_title": "Other"},
+            ]
+        )
+        (child,) = repo.bulk_create(
+            [{"project_id": project.id, "wbs_title": "Child", "parent_id": root.id}]
+        )
+
+        assert child.wbs_path == f"/{root.id}/{child.id}/"
+        assert [w.wbs_title for w in repo.get_subtree(root)] == ["Root", "Child"]
+
+    def test_subtree_without_path_walks_tree(self, db):
+        from app.models.database.project import Project
+        from app.models.database.wbs import WBS
+        from app.repositories.wbs_repository import WBSRepository
+
+        project = Project(project_name="P")
+        db.add(project)
+        db.flush()
+        root = WBS(project_id=project.id, wbs_title="Root")
+        db.add(root)
+        db.flush()
+        db.add(WBS(project_id=project.id, wbs_title="Child", parent_id=root.id))
+        db.add(WBS(project_id=project.id, wbs_title="Other"))
+        db.commit()
+
+        assert root.wbs_path is None
+        subtree = WBSRepository(db).get_subtree(root)
+        assert [w.wbs_title for w in subtree] == ["Root", "Child"]
+
+    def test_resource_name_lookup_is_array_containment(self):
+        from sqlalchemy.dialects import postgresql
+
+        from app.repositories.wbs_repository import WBSRepository
+
+        mock_db = MagicMock(spec=Session)
+        WBSRepository(mock_db).get_by_resource_name(1, "Alice")
+
+        stmt = mock_db.scalars.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "wbs.resource_names @> %(resource_names_1)s::VARCHAR[]" in sql
+
+
+class TestWBSExport:
+    """The WBS export streams NDJSON off a batched cursor."""
+
+    def test_streams_one_item_per_line(self, client, db, mock_current_user):
+        import json
+
+        from app.core.security import get_current_user
+        from app.main import app
+        from app.models.database.project import Project
+        from app.models.database.wbs import WBS
+
+        project = Project(project_name="P")
+        db.add(project)
+        db.flush()
+        db.add_all(
+            [
+                WBS(project_id=project.id, wbs_title=f"Task {i}", outline_level=1)
+                for i in range(3)
+            ]
+        )
+        db.commit()
+        app.dependency_overrides[get_current_user] = lambda: mock_current_user
+
+        response = client.get(f"/api/v1/projects/{project.id}/wbs/export")
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.text.splitlines()
+        assert [json.loads(line)["wbs_title"] for line in lines] == [
+            "Task 0",
+            "Task 1",
+            "Task 2",
+        ]
@@ -1,14 +1,20 @@
 """
 Tests for the risk service.
 """
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from app.models.database.config_tables import ProbabilityLevel, SeverityLevel
+from app.models.database.project import Project
 from app.models.database.risk import Risk
 from app.models.database.wbs import WBS
+from app.models.schemas.risk import RiskCreate
+from app.services.config_cache import config_cache
+from app.services.config_service import ConfigService
 from app.services.risk_service import RiskService
 
 
@@ -114,36 +120,35 @@ class TestRiskService:
 
         assert exc_info.value.status_code == 409
 
-    def test_compute_risk_exposure(
-        self,
-        risk_service,
-        mock_db,
-        mock_risk,
-        mock_probability_level,
-        mock_severity_level,
-    ):
-        """Test risk exposure: cost * prob_weight * sev_weight."""
-        mock_db.scalars.return_value.first.side_effect = [
-            mock_probability_level,
-            mock_severity_level,
-        ]
+    def test_compute_risk_exposure(self, risk_service, mock_risk):
+        """Exposure is read from the database-computed expected_cost."""
+        mock_risk.expected_cost = Decimal("7500.00")
+
+        assert risk_service.compute_risk_exposure(mock_risk) == 7500.0
 
-        result = risk_service.compute_risk_exposure(mock_risk)
+    def test_compute_risk_exposure_defaults_to_zero(self, risk_service, mock_risk):
+        """Test risk exposure defaults to 0 when nothing has been computed."""
+        mock_risk.expected_cost = None
 
-        # 10000 * 0.5 * 1.5 = 7500
-        expected = 10000.0 * 0.5 * 1.5
-        assert result == expected
+        assert risk_service.compute_risk_exposure(mock_risk) == 0.0
 
-    def test_compute_risk_exposure_defaults_to_zero(
-        self, risk_service, mock_db, mock_risk
+    def test_create_snapshots_weights(
+        self, risk_service, mock_wbs, mock_probability_level, mock_severity_level
     ):
-        """Test risk exposure defaults to 0 when weights not found."""
-        mock_risk.probability_code = None
-        mock_risk.severity_code = None
+        """Creating a risk copies the current level weights onto it."""
+        data = RiskCreate(probability_code="M", severity_code="H", risk_cost=100)
 
-        result = risk_service.compute_risk_exposure(mock_risk)
+        with patch.object(risk_service.wbs_repo, "get", return_value=mock_wbs):
+            with patch.object(risk_service.repository, "create") as create:
+                with patch(
+                    "app.services.risk_service.config_cache.get",
+                    side_effect=[mock_probability_level, mock_severity_level],
+                ):
+                    risk_service.create(1, data)
 
-        assert result == 0.0
+        risk_data = create.call_args[0][0]
+        assert risk_data["probability_weight"] == 0.5
+        assert risk_data["severity_weight"] == 1.5
 
     def test_update_prevents_when_submitted(
         self, risk_service, mock_db, mock_wbs, mock_risk
@@ -180,3 +185,71 @@ class TestRiskService:
 
         expected_exposure = cost * prob_weight * sev_weight
         assert expected_exposure == 7500.0
+
+
+class TestExpectedCost:
+    """expected_cost is computed by the database from the weight snapshots."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_config_cache(self):
+        config_cache.clear()
+        yield
+        config_cache.clear()
+
+    @pytest.fixture(autouse=True)
+    def _editable_wbs(self):
+        with patch.object(RiskService, "_validate_wbs_editable"):
+            yield
+
+    @pytest.fixture
+    def wbs(self, db):
+        project = Project(project_name="P")
+        db.add(project)
+        db.flush()
+        wbs = WBS(project_id=project.id, wbs_code="1", wbs_title="Root")
+        db.add_all(
+            [
+                wbs,
+                ProbabilityLevel(code="M", description="Medium", weight=Decimal("0.5")),
+                SeverityLevel(code="H", description="High", weight=Decimal("1.5")),
+            ]
+        )
+        db.commit()
+        return wbs
+
+    def test_create_computes_expected_cost(self, db, wbs):
+        service = RiskService(db)
+        risk = service.create(
+            wbs.id,
+            RiskCreate(probability_code="M", severity_code="H", risk_cost=1000),
+        )
+
+        assert risk.expected_cost == Decimal("750.00")
+        assert service.get_total_exposure_by_wbs(wbs.id) == 750.0
+
+    def test_weight_change_updates_risks(self, db, wbs):
+        risk = RiskService(db).create(
+            wbs.id,
+            RiskCreate(probability_code="M", severity_code="H", risk_cost=1000),
+        )
+        level = db.query(SeverityLevel).one()
+
+        ConfigService(SeverityLevel, db).update(level.id, {"weight": Decimal("2")})
+
+        db.refresh(risk)
+        assert risk.severity_weight == Decimal("2.00")
+        assert risk.expected_cost == Decimal("1000.00")
+
+    def test_list_adapter_reads_exposure_from_expected_cost(self, db, wbs):
+        from app.models.schemas.risk import RISK_LIST_ADAPTER
+
+        service = RiskService(db)
+        service.create(
+            wbs.id,
+            RiskCreate(probability_code="M", severity_code="H", risk_cost=1000),
+        )
+
+        (item,) = RISK_LIST_ADAPTER.validate_python(
+            service.get_by_wbs(wbs.id, with_details=True), from_attributes=True
+        )
+        assert item.risk_exposure == 750.0
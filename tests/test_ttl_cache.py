@@ -0,0 +1,41 @@
+"""
+Tests for the in-process TTL cache (app.utils.ttl_cache).
+"""
+from unittest.mock import patch
+
+from app.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_entries_expire(self):
+        cache = TTLCache(maxsize=2, ttl=30)
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=131.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_evicted(self):
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_pop_removes_entry(self):
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.pop("a")
+        cache.pop("a")
+        assert cache.get("a") is None
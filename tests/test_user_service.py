@@ -7,6 +7,7 @@ import pytest
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from app.core.security import pwd_context
 from app.services.user_service import UserService
 
 
@@ -78,3 +79,46 @@ class TestUserService:
             user_service.get_or_404(999)
 
         assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_authenticate_verifies_off_loop(self, user_service):
+        """Test that authenticate checks the bcrypt hash and records the login."""
+        mock_user = MagicMock(is_active=True)
+        mock_user.hashed_password = pwd_context.hash("secret")
+        user_service.repository.get_by_username.return_value = mock_user
+
+        assert await user_service.authenticate("testuser", "secret") is mock_user
+        user_service.repository.update.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_authenticate_rejects_wrong_password(self, user_service):
+        """Test that a wrong password returns None."""
+        mock_user = MagicMock(is_active=True)
+        mock_user.hashed_password = pwd_context.hash("secret")
+        user_service.repository.get_by_username.return_value = mock_user
+
+        assert await user_service.authenticate("testuser", "wrong") is None
+        user_service.repository.update.assert_not_called()
+
+
+class TestActiveUsers:
+    """Active-user listings page in id order over the partial index."""
+
+    def test_get_active_users_skips_inactive(self, db):
+        from app.models.database.user import User
+        from app.repositories.user_repository import UserRepository
+
+        db.add_all(
+            User(
+                email=f"u{i}@example.com",
+                username=f"u{i}",
+                hashed_password="x",
+                is_active=i != 1,
+            )
+            for i in range(3)
+        )
+        db.commit()
+
+        users = UserRepository(db).get_active_users()
+
+        assert [u.username for u in users] == ["u0", "u2"]